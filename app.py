@@ -4,7 +4,9 @@ import os
 
 # Add utils to path
 sys.path.append(os.path.join(os.path.dirname(__file__), 'utils'))
-from data_loader import StatsBombDataLoader
+sys.path.append(os.path.dirname(__file__))
+from utils.data_service import get_sample_data, warm_up_analyzer
+from utils.decision_tables import load_decision_tables
 from visualizations import create_pitch, create_radar_chart
 
 # Set page configuration
@@ -15,14 +17,6 @@ st.set_page_config(
     initial_sidebar_state="expanded"
 )
 
-# Initialize data loader
-@st.cache_resource
-def load_data():
-    data_loader = StatsBombDataLoader()
-    return data_loader
-
-data_loader = load_data()
-
 # Main page content
 st.title("xT-GK: Expected Threat for Goalkeepers")
 st.subheader("Interactive Analysis Templates")
@@ -58,8 +52,14 @@ Each template provides interactive controls and visualizations to help you apply
 # Display data overview
 st.header("Data Overview")
 
-# Get sample data
-sample_data = data_loader.get_sample_data()
+# Get sample data (shared with the template pages)
+sample_data = get_sample_data()
+
+# Load the in-game decision tables now so the decision page opens instantly
+load_decision_tables()
+
+# Fit the xT grid behind the decision surface in the background
+warm_up_analyzer()
 gk_data = sample_data['goalkeeper_data']
 match_info = sample_data['match_info']
 
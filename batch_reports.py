@@ -0,0 +1,445 @@
+"""
+Batch generation of xT-GK goalkeeper reports for a whole competition season.
+
+Computes xT-GK for every goalkeeper of the season with XtGkAnalyzer and writes
+one scouting or opposition PDF per goalkeeper, rendered in a process pool.
+A manifest of input hashes is kept in the output directory, so an interrupted
+run can be resumed and reports whose inputs have not changed are skipped.
+
+Example:
+    python batch_reports.py --competition 11 --season 90 --report scouting
+"""
+import argparse
+import json
+import os
+import re
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+import numpy as np
+import pandas as pd
+
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+from utils.data_loader import StatsBombDataLoader
+from utils.xt_gk_analyzer import XtGkAnalyzer
+from utils.visualizations import create_pass_map
+from utils.pdf_generator import generate_goalkeeper_scouting_pdf, generate_opposition_analysis_pdf
+from utils.report_cache import report_key
+
+REPORT_GENERATORS = {
+    'scouting': generate_goalkeeper_scouting_pdf,
+    'opposition': generate_opposition_analysis_pdf,
+}
+TEAM_STYLES = ["Possession-Based", "Direct Play", "Counter-Attacking", "High Press", "Balanced"]
+MANIFEST_FILE = 'manifest.json'
+
+# StatsBomb event coordinates (yards) and the metric pitch drawn by create_pitch
+STATSBOMB_PITCH = (120, 80)
+PLOT_PITCH = (105, 68)
+# Passes shorter than this (yards) count as short, as in StatsBombDataLoader
+SHORT_PASS_LENGTH = 30
+
+
+def collect_goalkeeper_events(data_loader, analyzer, matches):
+    """
+    Score the goalkeeper actions of every match with xT-GK.
+
+    Parameters:
+    -----------
+    data_loader : StatsBombDataLoader
+        Loader used to read the match events
+    analyzer : XtGkAnalyzer
+        Analyzer used to score the events
+    matches : list
+        List of match dictionaries
+
+    Returns:
+    --------
+    pd.DataFrame
+        Goalkeeper events of all matches with 'xt_gk' and 'match_id' columns
+    """
+    frames = []
+    for match in matches:
+        events = data_loader.get_match_events_frame(match['match_id'])
+        if events.empty:
+            continue
+
+        gk_events = analyzer.process_match_events(events)
+        gk_events['match_id'] = match['match_id']
+        frames.append(gk_events)
+
+    if not frames:
+        return pd.DataFrame()
+    return pd.concat(frames, ignore_index=True)
+
+
+def goalkeeper_profiles(analyzer, gk_events):
+    """
+    Build one distribution profile per goalkeeper.
+
+    Parameters:
+    -----------
+    analyzer : XtGkAnalyzer
+        Analyzer used to aggregate xT-GK
+    gk_events : pd.DataFrame
+        Output of collect_goalkeeper_events
+
+    Returns:
+    --------
+    pd.DataFrame
+        The goalkeeper_performance_table columns plus 'matches',
+        'long_pass_pct', 'pressure_pct' and 'pressure_completion_rate'
+    """
+    table = analyzer.goalkeeper_performance_table(gk_events)
+
+    passes = gk_events[gk_events['type.name'] == 'Pass']
+    pressured = passes['under_pressure'].fillna(False).astype(bool)
+    completed = passes['pass.outcome.name'].isna()
+    pass_flags = pd.DataFrame({
+        'player.id': passes['player.id'],
+        'long_passes': passes['pass.length'] >= SHORT_PASS_LENGTH,
+        'pressured_passes': pressured,
+        'pressured_completed': pressured & completed
+    }).groupby('player.id').sum()
+
+    table = table.join(pass_flags, on='player.id')
+    table['matches'] = table['player.id'].map(gk_events.groupby('player.id')['match_id'].nunique())
+    table = table.fillna({'long_passes': 0, 'pressured_passes': 0, 'pressured_completed': 0})
+
+    num_passes = table['num_passes'].to_numpy(dtype=float)
+    pressured_passes = table['pressured_passes'].to_numpy(dtype=float)
+    table['long_pass_pct'] = np.divide(
+        table['long_passes'].to_numpy(dtype=float), num_passes,
+        out=np.zeros(len(table)), where=num_passes > 0
+    )
+    table['pressure_pct'] = np.divide(
+        pressured_passes, num_passes,
+        out=np.zeros(len(table)), where=num_passes > 0
+    )
+    table['pressure_completion_rate'] = np.divide(
+        table['pressured_completed'].to_numpy(dtype=float), pressured_passes,
+        out=np.zeros(len(table)), where=pressured_passes > 0
+    )
+
+    return table
+
+
+def goalkeeper_passes(gk_events, player_id):
+    """Start/end locations (meters on the plotted pitch) and outcomes of a goalkeeper's passes, as plain lists."""
+    passes = gk_events[(gk_events['type.name'] == 'Pass') & (gk_events['player.id'] == player_id)]
+    scale_x = PLOT_PITCH[0] / STATSBOMB_PITCH[0]
+    scale_y = PLOT_PITCH[1] / STATSBOMB_PITCH[1]
+    return {
+        'x': (passes['location.x'] * scale_x).round(1).tolist(),
+        'y': (passes['location.y'] * scale_y).round(1).tolist(),
+        'end_x': (passes['pass.end_location.x'] * scale_x).round(1).tolist(),
+        'end_y': (passes['pass.end_location.y'] * scale_y).round(1).tolist(),
+        'completed': passes['pass.outcome.name'].isna().tolist()
+    }
+
+
+def _compare(value, average, label):
+    """Format a metric against the league average."""
+    return f"{label}: {value:.0%} (league average {average:.0%})"
+
+
+def scouting_report_inputs(profile, league, rank, num_goalkeepers, scouting_team, team_style):
+    """Keyword arguments for generate_goalkeeper_scouting_pdf (without figures)."""
+    strengths = []
+    weaknesses = []
+
+    comparisons = [
+        (profile.pass_completion_rate, league['pass_completion_rate'], "Pass completion"),
+        (profile.pressure_completion_rate, league['pressure_completion_rate'], "Completion under pressure"),
+    ]
+    for value, average, label in comparisons:
+        (strengths if value >= average else weaknesses).append(_compare(value, average, label))
+
+    xt_line = f"xT-GK per action: {profile.avg_xt_gk:.3f} (league average {league['avg_xt_gk']:.3f})"
+    (strengths if profile.avg_xt_gk >= league['avg_xt_gk'] else weaknesses).append(xt_line)
+
+    # Long distribution suits direct sides, short build-up the others
+    long_line = _compare(profile.long_pass_pct, league['long_pass_pct'], "Long distribution share")
+    prefers_long = profile.long_pass_pct >= league['long_pass_pct']
+    if (team_style == "Direct Play") == prefers_long:
+        strengths.append(long_line)
+    else:
+        weaknesses.append(long_line)
+
+    percentile = 1 - rank / num_goalkeepers
+    if percentile >= 0.75:
+        verdict = "Priority target"
+    elif percentile >= 0.4:
+        verdict = "Monitor"
+    else:
+        verdict = "Not recommended"
+    recommendation = (
+        f"{verdict} for a {team_style.lower()} side: ranked {rank + 1} of {num_goalkeepers} "
+        f"goalkeepers by total xT-GK ({profile.total_xt_gk:.2f} over {profile.matches} matches, "
+        f"{profile.num_passes} passes)."
+    )
+
+    return {
+        'gk_name': profile.player_name,
+        'team_name': profile.team_name,
+        'scouting_team': scouting_team,
+        'team_style': team_style,
+        'strengths': strengths,
+        'weaknesses': weaknesses,
+        'recommendation': recommendation
+    }
+
+
+def opposition_report_inputs(profile, league, our_team):
+    """Keyword arguments for generate_opposition_analysis_pdf (without figures)."""
+    key_findings = [
+        _compare(profile.pass_completion_rate, league['pass_completion_rate'], "Pass completion"),
+        _compare(profile.long_pass_pct, league['long_pass_pct'], "Long distribution share"),
+        _compare(profile.pressure_pct, league['pressure_pct'], "Share of passes under pressure"),
+    ]
+
+    if profile.pressured_passes and profile.pressure_completion_rate < profile.pass_completion_rate:
+        key_findings.append(
+            f"Completion drops from {profile.pass_completion_rate:.0%} to "
+            f"{profile.pressure_completion_rate:.0%} under pressure: press the first pass"
+        )
+    if profile.long_pass_pct >= league['long_pass_pct']:
+        key_findings.append("Goes long more than average: win the second ball in midfield")
+    else:
+        key_findings.append("Prefers short build-up: screen the centre-backs and pivot")
+
+    key_findings.append(
+        f"xT-GK per action: {profile.avg_xt_gk:.3f} (league average {league['avg_xt_gk']:.3f})"
+    )
+
+    return {
+        'gk_name': profile.player_name,
+        'team_name': our_team,
+        'opposition_team': profile.team_name,
+        'analysis_type': 'their_gk',
+        'key_findings': key_findings
+    }
+
+
+def build_report_jobs(profiles, gk_events, report_type, scouting_team, team_style, our_team,
+                      image_format='png'):
+    """
+    Describe every report to generate.
+
+    Parameters:
+    -----------
+    profiles : pd.DataFrame
+        Output of goalkeeper_profiles
+    gk_events : pd.DataFrame
+        Output of collect_goalkeeper_events
+    report_type : str
+        'scouting' or 'opposition'
+    scouting_team : str
+        Team the scouting reports are written for
+    team_style : str
+        Playing style of the scouting team
+    our_team : str
+        Team the opposition reports are written for
+    image_format : str
+        How figures are embedded in the PDFs, 'png' or 'svg'
+
+    Returns:
+    --------
+    list
+        List of job dictionaries with 'file_name', 'report_type', 'inputs'
+        (generator keyword arguments) and 'passes' (pass map data)
+    """
+    active = profiles[profiles['num_passes'] > 0]
+    league = {
+        column: float(active[column].mean()) if not active.empty else 0.0
+        for column in ['pass_completion_rate', 'pressure_completion_rate', 'avg_xt_gk',
+                       'long_pass_pct', 'pressure_pct']
+    }
+    ranks = profiles['total_xt_gk'].rank(ascending=False, method='first').astype(int) - 1
+
+    jobs = []
+    rows = zip(profiles.itertuples(index=False), profiles['player.id'], ranks)
+    for profile, player_id, rank in rows:
+        if report_type == 'scouting':
+            inputs = scouting_report_inputs(profile, league, rank, len(profiles), scouting_team, team_style)
+        else:
+            inputs = opposition_report_inputs(profile, league, our_team)
+        inputs['image_format'] = image_format
+
+        slug = re.sub(r'[^a-z0-9]+', '_', str(profile.player_name).lower()).strip('_')
+        jobs.append({
+            'file_name': f"{report_type}_{player_id}_{slug}.pdf",
+            'report_type': report_type,
+            'inputs': inputs,
+            'passes': goalkeeper_passes(gk_events, player_id)
+        })
+
+    return jobs
+
+
+def render_report(job, output_dir):
+    """
+    Render one report to output_dir. Runs in a worker process.
+
+    Returns:
+    --------
+    str
+        File name of the written report
+    """
+    inputs = job['inputs']
+    pass_map = create_pass_map(job['passes'], f"{inputs['gk_name']} passes")
+
+    generator = REPORT_GENERATORS[job['report_type']]
+    pdf_bytes = generator(pitch_fig=pass_map, **inputs)
+
+    output_path = os.path.join(output_dir, job['file_name'])
+    tmp_path = f"{output_path}.{os.getpid()}.tmp"
+    with open(tmp_path, 'wb') as f:
+        f.write(pdf_bytes)
+    os.replace(tmp_path, output_path)
+
+    return job['file_name']
+
+
+def job_key(job):
+    """Hash of everything that determines a report's content."""
+    return report_key(REPORT_GENERATORS[job['report_type']], passes=job['passes'], **job['inputs'])
+
+
+def load_manifest(output_dir):
+    try:
+        with open(os.path.join(output_dir, MANIFEST_FILE), 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def save_manifest(output_dir, manifest):
+    manifest_path = os.path.join(output_dir, MANIFEST_FILE)
+    tmp_path = f"{manifest_path}.tmp"
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump(manifest, f, indent=2, sort_keys=True)
+    os.replace(tmp_path, manifest_path)
+
+
+def generate_reports(jobs, output_dir, workers=None, force=False):
+    """
+    Render the reports whose inputs changed since the last run.
+
+    Parameters:
+    -----------
+    jobs : list
+        Output of build_report_jobs
+    output_dir : str
+        Directory receiving the PDFs and the manifest
+    workers : int, optional
+        Number of worker processes (default: one per CPU core)
+    force : bool
+        Render every report even if it is up to date
+
+    Returns:
+    --------
+    tuple
+        (number of reports written, number skipped, list of failed file names)
+    """
+    os.makedirs(output_dir, exist_ok=True)
+    manifest = load_manifest(output_dir)
+
+    pending = []
+    for job in jobs:
+        key = job_key(job)
+        up_to_date = (
+            manifest.get(job['file_name']) == key
+            and os.path.exists(os.path.join(output_dir, job['file_name']))
+        )
+        if force or not up_to_date:
+            pending.append((job, key))
+
+    skipped = len(jobs) - len(pending)
+    print(f"{len(jobs)} reports: {skipped} up to date, {len(pending)} to render")
+
+    written = 0
+    failed = []
+    start = time.time()
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        futures = {
+            executor.submit(render_report, job, output_dir): (job, key)
+            for job, key in pending
+        }
+        for done, future in enumerate(as_completed(futures), start=1):
+            job, key = futures[future]
+            try:
+                future.result()
+            except Exception as e:
+                failed.append(job['file_name'])
+                print(f"[{done}/{len(pending)}] FAILED {job['file_name']}: {e}", file=sys.stderr)
+                continue
+
+            # Record each report as soon as it exists so that reruns resume here
+            manifest[job['file_name']] = key
+            save_manifest(output_dir, manifest)
+            written += 1
+            print(f"[{done}/{len(pending)}] {job['file_name']} ({time.time() - start:.1f}s)")
+
+    return written, skipped, failed
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description="Generate one xT-GK report per goalkeeper for a competition season."
+    )
+    parser.add_argument('--competition', type=int, default=11, help="Competition ID (default: 11, La Liga)")
+    parser.add_argument('--season', type=int, default=90, help="Season ID (default: 90)")
+    parser.add_argument('--report', choices=sorted(REPORT_GENERATORS), default='scouting',
+                        help="Report type (default: scouting)")
+    parser.add_argument('--data-dir', help="StatsBomb open data directory")
+    parser.add_argument('--output-dir',
+                        help="Output directory (default: reports/<competition>_<season>_<report>)")
+    parser.add_argument('--num-matches', type=int, help="Only use the first N matches of the season")
+    parser.add_argument('--min-passes', type=int, default=10,
+                        help="Skip goalkeepers with fewer passes (default: 10)")
+    parser.add_argument('--workers', type=int, help="Worker processes (default: one per CPU core)")
+    parser.add_argument('--scouting-team', default="Scouting Team",
+                        help="Team the scouting reports are written for")
+    parser.add_argument('--team-style', choices=TEAM_STYLES, default="Possession-Based",
+                        help="Playing style of the scouting team")
+    parser.add_argument('--team', default="Our Team", help="Team the opposition reports are written for")
+    parser.add_argument('--image-format', choices=['png', 'svg'], default='png',
+                        help="Embed figures as raster PNG or vector SVG (default: png)")
+    parser.add_argument('--fit-xt', action='store_true',
+                        help="Use an xT grid fitted on the season instead of the default values")
+    parser.add_argument('--force', action='store_true', help="Re-render reports that are up to date")
+    args = parser.parse_args(argv)
+
+    data_loader = StatsBombDataLoader(data_dir=args.data_dir) if args.data_dir else StatsBombDataLoader()
+    matches = data_loader.get_matches(args.competition, args.season)[:args.num_matches]
+    if not matches:
+        parser.error(f"no matches found for competition {args.competition}, season {args.season}")
+
+    analyzer = XtGkAnalyzer(pitch_dimensions=STATSBOMB_PITCH)
+    if args.fit_xt:
+        analyzer.use_fitted_base_values(data_loader, args.competition, args.season, args.num_matches)
+
+    print(f"Scoring goalkeeper actions in {len(matches)} matches...")
+    gk_events = collect_goalkeeper_events(data_loader, analyzer, matches)
+    if gk_events.empty:
+        parser.error("no goalkeeper events found")
+
+    profiles = goalkeeper_profiles(analyzer, gk_events)
+    profiles = profiles[profiles['num_passes'] >= args.min_passes].reset_index(drop=True)
+
+    jobs = build_report_jobs(profiles, gk_events, args.report, args.scouting_team,
+                             args.team_style, args.team, args.image_format)
+
+    output_dir = args.output_dir or os.path.join(
+        'reports', f"{args.competition}_{args.season}_{args.report}"
+    )
+    written, skipped, failed = generate_reports(jobs, output_dir, args.workers, args.force)
+
+    print(f"Done: {written} written, {skipped} skipped, {len(failed)} failed -> {output_dir}")
+    return 1 if failed else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
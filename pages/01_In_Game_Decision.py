@@ -9,9 +9,15 @@ import os
 
 # Add utils to path
 sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
-from utils.visualizations import create_pitch, plot_distribution_options
-from utils.data_loader import StatsBombDataLoader
+from utils.visualizations import (
+    create_pitch, plot_distribution_options, add_pressure_field, add_markers, add_labels, add_passing_lines,
+    add_decision_surface, pressure_layout
+)
+from utils.decision_engine import decision_surface, top_targets
+from utils.decision_tables import lookup_options
+from utils.data_service import get_sample_data, get_available_teams, get_team_goalkeepers, warm_up_analyzer
 from utils.pdf_generator import generate_in_game_decision_pdf
+from utils.report_cache import find_report, cached_report
 
 st.set_page_config(
     page_title="In-Game Decision | xT-GK",
@@ -19,16 +25,11 @@ st.set_page_config(
     layout="wide"
 )
 
-# Initialize data loader
-@st.cache_resource
-def load_data():
-    data_loader = StatsBombDataLoader()
-    return data_loader
-
-data_loader = load_data()
+# Get real data (shared across pages and sessions)
+real_data = get_sample_data()
 
-# Get real data
-real_data = data_loader.get_sample_data()
+# Start fitting the decision surface's xT grid while the options are chosen
+warm_up_analyzer()
 gk_data = real_data['goalkeeper_data']
 pass_events = real_data['pass_events']
 match_info = real_data['match_info']
@@ -53,12 +54,7 @@ with col1:
     st.subheader("Match Situation")
     
     # Select teams from real data
-    available_teams = []
-    for match in match_info:
-        if match['home_team'] not in available_teams:
-            available_teams.append(match['home_team'])
-        if match['away_team'] not in available_teams:
-            available_teams.append(match['away_team'])
+    available_teams = get_available_teams()
     
     if not available_teams:
         available_teams = ["Team A", "Team B", "Team C"]  # Fallback
@@ -70,10 +66,7 @@ with col1:
     )
     
     # Select goalkeeper
-    team_goalkeepers = []
-    for gk in gk_data:
-        if gk['team_name'] == team:
-            team_goalkeepers.append(gk['player_name'])
+    team_goalkeepers = get_team_goalkeepers(team)
     
     if not team_goalkeepers:
         team_goalkeepers = ["Team Goalkeeper"]  # Fallback
@@ -151,95 +144,29 @@ with col2:
     # Create pitch visualization
     st.markdown("### Available Distribution Options")
     
-    # Generate distribution options based on inputs
-    distribution_options = []
-    
-    # Short options (always available)
-    short_options = [
-        {"name": "Left Center Back", "position": (15, 25), "distance": "short", "pressure": "low", "xT_value": 0.65},
-        {"name": "Right Center Back", "position": (15, 43), "distance": "short", "pressure": "low", "xT_value": 0.68}
-    ]
-    
-    # Add full backs if in build-up
-    if game_state in ["Build-up from Goal Kick", "Build-up from Open Play"]:
-        short_options.extend([
-            {"name": "Left Full Back", "position": (20, 15), "distance": "short", "pressure": "medium", "xT_value": 0.58},
-            {"name": "Right Full Back", "position": (20, 53), "distance": "short", "pressure": "medium", "xT_value": 0.56}
-        ])
-    
-    # Medium options
-    medium_options = [
-        {"name": "Defensive Midfielder", "position": (30, 34), "distance": "medium", "pressure": "medium", "xT_value": 0.52},
-        {"name": "Left Midfielder", "position": (40, 20), "distance": "medium", "pressure": "high", "xT_value": 0.48},
-        {"name": "Right Midfielder", "position": (40, 48), "distance": "medium", "pressure": "high", "xT_value": 0.45}
-    ]
-    
-    # Long options
-    long_options = [
-        {"name": "Left Winger", "position": (60, 15), "distance": "long", "pressure": "high", "xT_value": 0.35},
-        {"name": "Striker", "position": (60, 34), "distance": "long", "pressure": "high", "xT_value": 0.32},
-        {"name": "Right Winger", "position": (60, 53), "distance": "long", "pressure": "high", "xT_value": 0.30}
-    ]
-    
-    # Adjust options based on game state
-    if game_state == "Counter-Attack Opportunity":
-        # Prioritize longer options for counter
-        distribution_options = short_options[:1] + medium_options[1:] + long_options
-    elif game_state == "Defensive Reset":
-        # Prioritize safer options
-        distribution_options = short_options + medium_options[:1]
-    else:
-        # Standard build-up
-        distribution_options = short_options + medium_options + long_options
-    
-    # Adjust xT values based on pressure
-    pressure_factor = 1.0 - (pressure_level / 20)  # Higher pressure reduces xT
-    for option in distribution_options:
-        base_xt = option["xT_value"]
-        
-        # Pressure affects different distances differently
-        if option["distance"] == "short" and pressure_level > 7:
-            option["xT_value"] = base_xt * (pressure_factor * 0.8)  # Short passes more affected by high pressure
-        elif option["distance"] == "long" and pressure_level > 5:
-            option["xT_value"] = base_xt * (pressure_factor * 0.9)  # Long passes somewhat affected
-        else:
-            option["xT_value"] = base_xt * pressure_factor
-    
-    # Adjust based on tactical approach
-    for option in distribution_options:
-        if team_tactical_approach == "Possession-Based" and option["distance"] == "short":
-            option["xT_value"] *= 1.2  # Boost short options for possession teams
-        elif team_tactical_approach == "Direct Play" and option["distance"] == "long":
-            option["xT_value"] *= 1.2  # Boost long options for direct play
-        elif team_tactical_approach == "Counter-Attacking" and option["distance"] in ["medium", "long"]:
-            option["xT_value"] *= 1.15  # Boost medium/long for counter
-    
-    # Adjust based on score state
-    for option in distribution_options:
-        if score_state == "Winning" and option["distance"] == "short":
-            option["xT_value"] *= 1.1  # Safer options when winning
-        elif score_state == "Losing" and option["distance"] == "long":
-            option["xT_value"] *= 1.1  # Riskier options when losing
+    # Ranked distribution options for this match context, looked up from
+    # tables precomputed for every combination of pressure, game state,
+    # score state, tactical approach and field conditions
+    distribution_options = lookup_options(
+        pressure_level, game_state, score_state, team_tactical_approach, field_conditions
+    )
     
     # Create the pitch visualization with distribution options
     pitch_fig = create_pitch()
     
-    # Add goalkeeper position
+    # Goalkeeper and teammates are drawn as one marker trace, passing lines
+    # as one trace per line style
     gk_pos = (5, 34)
-    pitch_fig.add_trace(go.Scatter(
-        x=[gk_pos[0]],
-        y=[gk_pos[1]],
-        mode='markers+text',
-        marker=dict(
-            color='cyan',
-            size=15,
-            symbol='circle',
-            line=dict(color='white', width=2)
-        ),
-        text=goalkeeper,
-        textposition="top center",
-        name=goalkeeper
-    ))
+    players = [{
+        "pos": gk_pos,
+        "color": 'cyan',
+        "size": 15,
+        "outline_width": 2,
+        "text": goalkeeper,
+        "hover": goalkeeper
+    }]
+    passing_lines = []
+    xt_labels = []
     
     # Add distribution options with player names and xT values
     for option in distribution_options:
@@ -263,46 +190,32 @@ with col2:
             width = 2
         
         # Add player position
-        pitch_fig.add_trace(go.Scatter(
-            x=[option["position"][0]],
-            y=[option["position"][1]],
-            mode='markers+text',
-            marker=dict(
-                color='blue',
-                size=12,
-                symbol='circle',
-                line=dict(color='white', width=1)
-            ),
-            text=f"{option['name']}",
-            textposition="top center",
-            name=f"{option['name']} (xT: {option['xT_value']:.2f})"
-        ))
+        players.append({
+            "pos": option["position"],
+            "text": f"{option['name']}",
+            "hover": f"{option['name']} (xT: {option['xT_value']:.2f})"
+        })
         
         # Add passing line
-        pitch_fig.add_trace(go.Scatter(
-            x=[gk_pos[0], option["position"][0]],
-            y=[gk_pos[1], option["position"][1]],
-            mode='lines',
-            line=dict(
-                color=color,
-                width=width,
-                dash=dash
-            ),
-            name=f"{option['distance'].capitalize()} pass to {option['name']}"
-        ))
+        passing_lines.append({
+            "start": gk_pos,
+            "end": option["position"],
+            "color": color,
+            "width": width,
+            "dash": dash,
+            "hover": f"{option['distance'].capitalize()} pass to {option['name']}",
+            "legend": f"{option['distance'].capitalize()} passes"
+        })
         
         # Add xT value label
-        pitch_fig.add_annotation(
-            x=option["position"][0],
-            y=option["position"][1] - 3,
-            text=f"xT: {option['xT_value']:.2f}",
-            showarrow=False,
-            font=dict(size=10, color="white"),
-            bgcolor="rgba(0, 0, 0, 0.7)",
-            bordercolor="white",
-            borderwidth=1,
-            borderpad=2
-        )
+        xt_labels.append({
+            "pos": (option["position"][0], option["position"][1] - 3),
+            "text": f"xT: {option['xT_value']:.2f}"
+        })
+    
+    add_passing_lines(pitch_fig, passing_lines)
+    add_markers(pitch_fig, players, name="Goalkeeper & Teammates")
+    add_labels(pitch_fig, xt_labels)
     
     # Add pressure visualization if high pressure
     if pressure_level > 5:
@@ -315,19 +228,15 @@ with col2:
         else:
             pressure_positions = []
         
-        for pos in pressure_positions:
-            pitch_fig.add_trace(go.Scatter(
-                x=[pos[0]],
-                y=[pos[1]],
-                mode='markers',
-                marker=dict(
-                    color='red',
-                    size=12,
-                    symbol='x',
-                    line=dict(color='white', width=1)
-                ),
-                name="Opposition Player"
-            ))
+        # Shade the area the pressing players cover
+        if pressure_positions:
+            add_pressure_field(pitch_fig, pressure_positions, opacity=0.4)
+        
+        add_markers(
+            pitch_fig,
+            [{"pos": pos, "color": 'red', "symbol": 'x', "hover": "Opposition Player"} for pos in pressure_positions],
+            name="Opposition Player"
+        )
     
     # Update layout to ensure legend is visible
     pitch_fig.update_layout(
@@ -390,13 +299,71 @@ with col2:
             st.markdown("*Higher risk option that could bypass more opposition players*")
         else:
             st.markdown(f"*Alternative {option['distance']} distribution option with slightly lower expected value*")
+    
+    # Value of passing to every location on the pitch in this situation
+    st.markdown("### Full-Pitch Decision Surface")
+    
+    if pressure_level > 5:
+        opponent_positions = pressure_positions
+    else:
+        opponent_positions = pressure_layout(pressure_level)
+    
+    surface = decision_surface(
+        goalkeeper_position=gk_pos,
+        pressure_level=pressure_level,
+        game_state=game_state,
+        score_state=score_state,
+        tactical_approach=team_tactical_approach,
+        opponent_positions=opponent_positions
+    )
+    best_targets = top_targets(surface, n=5)
+    
+    surface_fig = add_decision_surface(create_pitch(), surface)
+    add_markers(
+        surface_fig,
+        [{"pos": pos, "color": 'red', "symbol": 'x', "hover": "Opposition Player"} for pos in opponent_positions],
+        name="Opposition Player"
+    )
+    add_markers(
+        surface_fig,
+        [{
+            "pos": target["position"],
+            "color": 'white',
+            "outline": 'black',
+            "text": f"{rank}",
+            "hover": f"Target {rank}: value {target['value']:.3f}, {target['success']:.0%} completion"
+        } for rank, target in enumerate(best_targets, start=1)],
+        name="Best Targets"
+    )
+    surface_fig.update_layout(
+        legend=dict(
+            orientation="h",
+            yanchor="bottom",
+            y=-0.2,
+            xanchor="center",
+            x=0.5
+        )
+    )
+    st.plotly_chart(surface_fig, use_container_width=True)
+    
+    st.dataframe(
+        pd.DataFrame({
+            "Target": [f"{rank}" for rank in range(1, len(best_targets) + 1)],
+            "Location (m)": [f"({target['position'][0]:.0f}, {target['position'][1]:.0f})" for target in best_targets],
+            "Distance (m)": [round(target["distance"]) for target in best_targets],
+            "Completion": [f"{target['success']:.0%}" for target in best_targets],
+            "Risk-Adjusted Value": [round(target["value"], 3) for target in best_targets]
+        }),
+        hide_index=True,
+        use_container_width=True
+    )
 
 # Download options
 st.markdown("---")
 st.subheader("Export Analysis")
 
-# Create PDF export functionality
-pdf_data = generate_in_game_decision_pdf(
+# Create PDF export functionality; the report is only rendered on request
+report_args = dict(
     gk_name=goalkeeper,
     team_name=team,
     match_situation=f"{game_state} ({match_minute}', {score_state})",
@@ -405,15 +372,24 @@ pdf_data = generate_in_game_decision_pdf(
     recommendation=recommendation,
     pitch_fig=pitch_fig
 )
+pdf_data = find_report(generate_in_game_decision_pdf, **report_args)
 
 col1, col2 = st.columns(2)
 with col1:
-    st.download_button(
-        label="Download Analysis as PDF",
-        data=pdf_data,
-        file_name="xt_gk_in_game_decision.pdf",
-        mime="application/pdf",
-    )
+    if pdf_data is None and st.button("Prepare PDF Report"):
+        with st.spinner("Generating PDF report..."):
+            try:
+                pdf_data = cached_report(generate_in_game_decision_pdf, **report_args)
+            except RuntimeError as e:
+                st.error(f"Could not generate the PDF report: {e}")
+    
+    if pdf_data is not None:
+        st.download_button(
+            label="Download Analysis as PDF",
+            data=pdf_data,
+            file_name="xt_gk_in_game_decision.pdf",
+            mime="application/pdf",
+        )
 
 with col2:
     st.download_button(
@@ -9,8 +9,11 @@ import os
 
 # Add utils to path
 sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
-from utils.visualizations import create_pitch, create_opposition_analysis
-from utils.data_loader import StatsBombDataLoader
+from utils.visualizations import (
+    create_pitch, create_opposition_analysis, create_opposition_heatmap, add_pressure_field, add_markers,
+    add_passing_lines
+)
+from utils.data_service import get_sample_data, get_available_teams, get_team_goalkeepers, get_pressing_surface
 from utils.pdf_generator import generate_opposition_analysis_pdf
 
 st.set_page_config(
@@ -19,16 +22,8 @@ st.set_page_config(
     layout="wide"
 )
 
-# Initialize data loader
-@st.cache_resource
-def load_data():
-    data_loader = StatsBombDataLoader()
-    return data_loader
-
-data_loader = load_data()
-
-# Get real data
-real_data = data_loader.get_sample_data()
+# Get real data (shared across pages and sessions)
+real_data = get_sample_data()
 gk_data = real_data['goalkeeper_data']
 pass_events = real_data['pass_events']
 match_info = real_data['match_info']
@@ -53,12 +48,7 @@ with col1:
     st.subheader("Match-Up Parameters")
     
     # Select teams from real data
-    available_teams = []
-    for match in match_info:
-        if match['home_team'] not in available_teams:
-            available_teams.append(match['home_team'])
-        if match['away_team'] not in available_teams:
-            available_teams.append(match['away_team'])
+    available_teams = get_available_teams()
     
     if not available_teams:
         available_teams = ["Team A", "Team B", "Team C"]  # Fallback
@@ -71,10 +61,7 @@ with col1:
     )
     
     # Select goalkeeper
-    team_goalkeepers = []
-    for gk in gk_data:
-        if gk['team_name'] == team:
-            team_goalkeepers.append(gk['player_name'])
+    team_goalkeepers = get_team_goalkeepers(team)
     
     if not team_goalkeepers:
         team_goalkeepers = ["Team Goalkeeper"]  # Fallback
@@ -165,22 +152,8 @@ with col2:
     # Create pitch visualization
     pitch_fig = create_pitch()
     
-    # Add goalkeeper position
+    # Goalkeeper position
     gk_pos = (5, 34)
-    pitch_fig.add_trace(go.Scatter(
-        x=[gk_pos[0]],
-        y=[gk_pos[1]],
-        mode='markers+text',
-        marker=dict(
-            color='cyan',
-            size=15,
-            symbol='circle',
-            line=dict(color='white', width=2)
-        ),
-        text=goalkeeper,
-        textposition="top center",
-        name=goalkeeper
-    ))
     
     # Add opposition pressing pattern based on formation and intensity
     if opposition_formation == "4-3-3":
@@ -224,35 +197,30 @@ with col2:
         
         pos["pos"] = (adjusted_x, adjusted_y)
     
-    # Add opposition pressers
-    for pos in pressing_positions:
-        pitch_fig.add_trace(go.Scatter(
-            x=[pos["pos"][0]],
-            y=[pos["pos"][1]],
-            mode='markers+text',
-            marker=dict(
-                color='red',
-                size=12,
-                symbol='x',
-                line=dict(color='white', width=1)
-            ),
-            text=f"{pos['role']}",
-            textposition="top center",
-            name=f"Opposition {pos['role']}"
-        ))
-        
-        # Add pressing movement arrows
-        pitch_fig.add_trace(go.Scatter(
-            x=[pos["pos"][0], gk_pos[0] - 2],  # End slightly before GK
-            y=[pos["pos"][1], gk_pos[1] + (pos["pos"][1] - gk_pos[1]) * 0.2],  # Curve toward GK
-            mode='lines',
-            line=dict(
-                color='rgba(255, 0, 0, 0.5)',
-                width=2,
-                dash='dot'
-            ),
-            name=f"Press from {pos['role']}"
-        ))
+    # Shade the area the pressers cover
+    add_pressure_field(pitch_fig, [pos["pos"] for pos in pressing_positions], opacity=0.4)
+    
+    # Add opposition pressers and their pressing movements
+    add_markers(
+        pitch_fig,
+        [{
+            "pos": pos["pos"],
+            "color": 'red',
+            "symbol": 'x',
+            "text": f"{pos['role']}",
+            "hover": f"Opposition {pos['role']}"
+        } for pos in pressing_positions],
+        name="Opposition Pressers"
+    )
+    add_passing_lines(pitch_fig, [{
+        "start": pos["pos"],
+        "end": (gk_pos[0] - 2, gk_pos[1] + (pos["pos"][1] - gk_pos[1]) * 0.2),  # End slightly before GK, curving toward it
+        "color": 'rgba(255, 0, 0, 0.5)',
+        "width": 2,
+        "dash": 'dot',
+        "hover": f"Press from {pos['role']}",
+        "legend": "Pressing Movement"
+    } for pos in pressing_positions])
     
     # Add distribution options based on opposition pressing
     # Short options
@@ -288,7 +256,17 @@ with col2:
     # Combine all options
     distribution_options = short_options + medium_options + long_options
     
-    # Add distribution options to visualization
+    # Add distribution options to visualization: goalkeeper and teammates as
+    # one marker trace, passing lines as one trace per line style
+    players = [{
+        "pos": gk_pos,
+        "color": 'cyan',
+        "size": 15,
+        "outline_width": 2,
+        "text": goalkeeper,
+        "hover": goalkeeper
+    }]
+    passing_lines = []
     for option in distribution_options:
         # Determine color based on viability
         if option["viability"] == "high":
@@ -302,41 +280,36 @@ with col2:
         if option in short_options:
             dash = None
             width = 3
+            distance = "Short"
         elif option in medium_options:
             dash = 'dot'
             width = 2
+            distance = "Medium"
         else:  # long
             dash = 'dash'
             width = 2
+            distance = "Long"
         
         # Add player position
-        pitch_fig.add_trace(go.Scatter(
-            x=[option["pos"][0]],
-            y=[option["pos"][1]],
-            mode='markers+text',
-            marker=dict(
-                color='blue',
-                size=12,
-                symbol='circle',
-                line=dict(color='white', width=1)
-            ),
-            text=f"{option['role']}",
-            textposition="top center",
-            name=f"{option['role']} ({option['viability']} viability)"
-        ))
+        players.append({
+            "pos": option["pos"],
+            "text": f"{option['role']}",
+            "hover": f"{option['role']} ({option['viability']} viability)"
+        })
         
         # Add passing line
-        pitch_fig.add_trace(go.Scatter(
-            x=[gk_pos[0], option["pos"][0]],
-            y=[gk_pos[1], option["pos"][1]],
-            mode='lines',
-            line=dict(
-                color=color,
-                width=width,
-                dash=dash
-            ),
-            name=f"Pass to {option['role']}"
-        ))
+        passing_lines.append({
+            "start": gk_pos,
+            "end": option["pos"],
+            "color": color,
+            "width": width,
+            "dash": dash,
+            "hover": f"Pass to {option['role']}",
+            "legend": f"{distance} passes"
+        })
+    
+    add_passing_lines(pitch_fig, passing_lines)
+    add_markers(pitch_fig, players, name="Goalkeeper & Teammates")
     
     # Update layout to ensure legend is visible
     pitch_fig.update_layout(
@@ -352,6 +325,12 @@ with col2:
     # Display the pitch visualization
     st.plotly_chart(pitch_fig, use_container_width=True)
     
+    # Pressing map from the opposition's actual Pressure events this season
+    pressing_map = get_pressing_surface(opposition_team)
+    if pressing_map is not None:
+        st.markdown("### Observed Pressing Map")
+        st.plotly_chart(create_opposition_heatmap(pressing_map), use_container_width=True)
+    
     # Opposition pressing analysis
     st.markdown("### Opposition Pressing Analysis")
     
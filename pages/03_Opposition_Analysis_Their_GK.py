@@ -9,8 +9,10 @@ import os
 
 # Add utils to path
 sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
-from utils.visualizations import create_pitch, create_opposition_heatmap
-from utils.data_loader import StatsBombDataLoader
+from utils.visualizations import create_pitch, create_opposition_heatmap, create_pass_map, add_markers, add_passing_lines
+from utils.data_service import (
+    get_sample_data, get_available_teams, get_team_goalkeepers, get_goalkeeper_passes, DEFAULT_NUM_MATCHES
+)
 
 st.set_page_config(
     page_title="Opposition Analysis (Their GK) | xT-GK",
@@ -18,16 +20,8 @@ st.set_page_config(
     layout="wide"
 )
 
-# Initialize data loader
-@st.cache_resource
-def load_data():
-    data_loader = StatsBombDataLoader()
-    return data_loader
-
-data_loader = load_data()
-
-# Get real data
-real_data = data_loader.get_sample_data()
+# Get real data (shared across pages and sessions)
+real_data = get_sample_data()
 gk_data = real_data['goalkeeper_data']
 pass_events = real_data['pass_events']
 match_info = real_data['match_info']
@@ -52,12 +46,7 @@ with col1:
     st.subheader("Opposition Analysis Parameters")
     
     # Select teams from real data
-    available_teams = []
-    for match in match_info:
-        if match['home_team'] not in available_teams:
-            available_teams.append(match['home_team'])
-        if match['away_team'] not in available_teams:
-            available_teams.append(match['away_team'])
+    available_teams = get_available_teams()
     
     if not available_teams:
         available_teams = ["Team A", "Team B", "Team C"]  # Fallback
@@ -75,10 +64,7 @@ with col1:
     )
     
     # Select opposition goalkeeper
-    opposition_goalkeepers = []
-    for gk in gk_data:
-        if gk['team_name'] == opposition_team:
-            opposition_goalkeepers.append(gk['player_name'])
+    opposition_goalkeepers = get_team_goalkeepers(opposition_team)
     
     if not opposition_goalkeepers:
         opposition_goalkeepers = ["Opposition Goalkeeper"]  # Fallback
@@ -190,22 +176,18 @@ with col2:
     # Create pitch visualization
     pitch_fig = create_pitch()
     
-    # Add opposition goalkeeper position
+    # Opposition goalkeeper and targets are drawn as one marker trace,
+    # passing lines as one trace per line style
     gk_pos = (5, 34)
-    pitch_fig.add_trace(go.Scatter(
-        x=[gk_pos[0]],
-        y=[gk_pos[1]],
-        mode='markers+text',
-        marker=dict(
-            color='red',
-            size=15,
-            symbol='circle',
-            line=dict(color='white', width=2)
-        ),
-        text=opposition_goalkeeper,
-        textposition="top center",
-        name=f'Opposition GK ({opposition_goalkeeper})'
-    ))
+    opposition_players = [{
+        "pos": gk_pos,
+        "color": 'red',
+        "size": 15,
+        "outline_width": 2,
+        "text": opposition_goalkeeper,
+        "hover": f'Opposition GK ({opposition_goalkeeper})'
+    }]
+    passing_lines = []
     
     # Add distribution patterns with player names
     # Short distribution
@@ -224,32 +206,22 @@ with col2:
         opacity = target["success"]
         
         # Add passing line
-        pitch_fig.add_trace(go.Scatter(
-            x=[gk_pos[0], target["pos"][0]],
-            y=[gk_pos[1], target["pos"][1]],
-            mode='lines',
-            line=dict(
-                color=f'rgba(255, 0, 0, {opacity})',
-                width=width
-            ),
-            name=f'Short Pass to {target["role"]} ({target["freq"]:.0%}, {target["success"]:.0%} success)'
-        ))
+        passing_lines.append({
+            "start": gk_pos,
+            "end": target["pos"],
+            "color": f'rgba(255, 0, 0, {opacity})',
+            "width": width,
+            "hover": f'Short Pass to {target["role"]} ({target["freq"]:.0%}, {target["success"]:.0%} success)',
+            "legend": "Short Passes"
+        })
         
         # Add player position
-        pitch_fig.add_trace(go.Scatter(
-            x=[target["pos"][0]],
-            y=[target["pos"][1]],
-            mode='markers+text',
-            marker=dict(
-                color='red',
-                size=12,
-                symbol='circle',
-                line=dict(color='white', width=1)
-            ),
-            text=f"{target['name']}",
-            textposition="top center",
-            name=f"{target['role']} ({target['name']})"
-        ))
+        opposition_players.append({
+            "pos": target["pos"],
+            "color": 'red',
+            "text": f"{target['name']}",
+            "hover": f"{target['role']} ({target['name']})"
+        })
     
     # Long distribution
     long_targets = [
@@ -266,33 +238,26 @@ with col2:
         opacity = target["success"]
         
         # Add passing line
-        pitch_fig.add_trace(go.Scatter(
-            x=[gk_pos[0], target["pos"][0]],
-            y=[gk_pos[1], target["pos"][1]],
-            mode='lines',
-            line=dict(
-                color=f'rgba(255, 0, 0, {opacity})',
-                width=width,
-                dash='dash'
-            ),
-            name=f'Long Pass to {target["role"]} ({target["freq"]:.0%}, {target["success"]:.0%} success)'
-        ))
+        passing_lines.append({
+            "start": gk_pos,
+            "end": target["pos"],
+            "color": f'rgba(255, 0, 0, {opacity})',
+            "width": width,
+            "dash": 'dash',
+            "hover": f'Long Pass to {target["role"]} ({target["freq"]:.0%}, {target["success"]:.0%} success)',
+            "legend": "Long Passes"
+        })
         
         # Add player position
-        pitch_fig.add_trace(go.Scatter(
-            x=[target["pos"][0]],
-            y=[target["pos"][1]],
-            mode='markers+text',
-            marker=dict(
-                color='red',
-                size=12,
-                symbol='circle',
-                line=dict(color='white', width=1)
-            ),
-            text=f"{target['name']}",
-            textposition="top center",
-            name=f"{target['role']} ({target['name']})"
-        ))
+        opposition_players.append({
+            "pos": target["pos"],
+            "color": 'red',
+            "text": f"{target['name']}",
+            "hover": f"{target['role']} ({target['name']})"
+        })
+    
+    add_passing_lines(pitch_fig, passing_lines)
+    add_markers(pitch_fig, opposition_players, name="Opposition Distribution")
     
     # Add our pressing players with names
     if pressing_structure == "High Press":
@@ -317,21 +282,17 @@ with col2:
             {"pos": (65, 34), "role": "Defender", "name": "Militão"}
         ]
     
-    for player in our_positions:
-        pitch_fig.add_trace(go.Scatter(
-            x=[player["pos"][0]],
-            y=[player["pos"][1]],
-            mode='markers+text',
-            marker=dict(
-                color='blue',
-                size=12,
-                symbol='x',
-                line=dict(color='white', width=1)
-            ),
-            text=f"{player['name']}",
-            textposition="top center",
-            name=f"Our {player['role']} ({player['name']})"
-        ))
+    add_markers(
+        pitch_fig,
+        [{
+            "pos": player["pos"],
+            "color": 'blue',
+            "symbol": 'x',
+            "text": f"{player['name']}",
+            "hover": f"Our {player['role']} ({player['name']})"
+        } for player in our_positions],
+        name="Our Pressing Players"
+    )
     
     # Update layout to ensure legend is visible
     pitch_fig.update_layout(
@@ -347,6 +308,22 @@ with col2:
     # Display the pitch visualization
     st.plotly_chart(pitch_fig, use_container_width=True)
     
+    # Every pass the opposition goalkeeper played in the loaded matches
+    st.markdown("### Pass Map")
+    
+    with st.spinner("Loading passes..."):
+        gk_passes = get_goalkeeper_passes(opposition_goalkeeper, team_name=opposition_team,
+                                              num_matches=DEFAULT_NUM_MATCHES)
+    
+    if len(gk_passes['x']):
+        st.plotly_chart(create_pass_map(gk_passes), use_container_width=True)
+        st.caption(
+            f"{len(gk_passes['x'])} passes by {opposition_goalkeeper}. Large sets are shown as "
+            "flows between pitch zones; arrow color shows the completion rate."
+        )
+    else:
+        st.info(f"No passes recorded for {opposition_goalkeeper} in the loaded matches.")
+    
     # Pressing strategy recommendations
     st.markdown("### Pressing Strategy Recommendations")
     
@@ -10,7 +10,7 @@ import os
 # Add utils to path
 sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
 from utils.visualizations import create_pitch, create_radar_chart
-from utils.data_loader import StatsBombDataLoader
+from utils.data_service import get_sample_data, get_available_teams, get_team_goalkeepers
 
 st.set_page_config(
     page_title="Training Development | xT-GK",
@@ -18,16 +18,8 @@ st.set_page_config(
     layout="wide"
 )
 
-# Initialize data loader
-@st.cache_resource
-def load_data():
-    data_loader = StatsBombDataLoader()
-    return data_loader
-
-data_loader = load_data()
-
-# Get real data
-real_data = data_loader.get_sample_data()
+# Get real data (shared across pages and sessions)
+real_data = get_sample_data()
 gk_data = real_data['goalkeeper_data']
 pass_events = real_data['pass_events']
 match_info = real_data['match_info']
@@ -52,12 +44,7 @@ with col1:
     st.subheader("Training Development Parameters")
     
     # Select teams from real data
-    available_teams = []
-    for match in match_info:
-        if match['home_team'] not in available_teams:
-            available_teams.append(match['home_team'])
-        if match['away_team'] not in available_teams:
-            available_teams.append(match['away_team'])
+    available_teams = get_available_teams()
     
     if not available_teams:
         available_teams = ["Team A", "Team B", "Team C"]  # Fallback
@@ -69,10 +56,7 @@ with col1:
     )
     
     # Select goalkeeper
-    team_goalkeepers = []
-    for gk in gk_data:
-        if gk['team_name'] == team:
-            team_goalkeepers.append(gk['player_name'])
+    team_goalkeepers = get_team_goalkeepers(team)
     
     if not team_goalkeepers:
         team_goalkeepers = ["Team Goalkeeper"]  # Fallback
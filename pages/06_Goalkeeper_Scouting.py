@@ -10,7 +10,11 @@ import os
 # Add utils to path
 sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
 from utils.visualizations import create_pitch, create_radar_chart
-from utils.data_loader import StatsBombDataLoader
+from utils.data_service import (
+    get_sample_data, get_available_teams, get_team_goalkeepers, get_data_loader, get_similarity_index,
+    DEFAULT_COMPETITION_ID, DEFAULT_SEASON_ID
+)
+from utils.gk_similarity import MIN_PASSES
 from utils.pdf_generator import generate_goalkeeper_scouting_pdf
 
 st.set_page_config(
@@ -19,16 +23,8 @@ st.set_page_config(
     layout="wide"
 )
 
-# Initialize data loader
-@st.cache_resource
-def load_data():
-    data_loader = StatsBombDataLoader()
-    return data_loader
-
-data_loader = load_data()
-
-# Get real data
-real_data = data_loader.get_sample_data()
+# Get real data (shared across pages and sessions)
+real_data = get_sample_data()
 gk_data = real_data['goalkeeper_data']
 pass_events = real_data['pass_events']
 match_info = real_data['match_info']
@@ -53,12 +49,7 @@ with col1:
     st.subheader("Scouting Parameters")
     
     # Select teams from real data
-    available_teams = []
-    for match in match_info:
-        if match['home_team'] not in available_teams:
-            available_teams.append(match['home_team'])
-        if match['away_team'] not in available_teams:
-            available_teams.append(match['away_team'])
+    available_teams = get_available_teams()
     
     if not available_teams:
         available_teams = ["Team A", "Team B", "Team C"]  # Fallback
@@ -77,12 +68,12 @@ with col1:
         default=[available_teams[1] if len(available_teams) > 1 else available_teams[0]]
     )
     
-    # Get goalkeepers from selected teams
-    target_goalkeepers = []
-    for gk in gk_data:
-        if gk['team_name'] in target_teams:
-            if gk['player_name'] not in target_goalkeepers:
-                target_goalkeepers.append(gk['player_name'])
+    # Get goalkeepers from selected teams, with the team each one is scouted at
+    goalkeeper_teams = {}
+    for team in target_teams:
+        for player_name in get_team_goalkeepers(team):
+            goalkeeper_teams.setdefault(player_name, team)
+    target_goalkeepers = list(goalkeeper_teams)
     
     if not target_goalkeepers:
         target_goalkeepers = ["Goalkeeper A", "Goalkeeper B", "Goalkeeper C"]  # Fallback
@@ -146,6 +137,19 @@ with col1:
             default=["Expiring within 1 year", "Expiring within 2 years"]
         )
         
+        # Leagues searched for similar goalkeepers
+        competition_seasons = {
+            f"{comp['competition_name']} {comp['season_name']}": (comp['competition_id'], comp['season_id'])
+            for comp in get_data_loader().competitions
+        }
+        default_league = [label for label, key in competition_seasons.items()
+                          if key == (DEFAULT_COMPETITION_ID, DEFAULT_SEASON_ID)]
+        similarity_leagues = st.multiselect(
+            "Leagues for Similar Goalkeepers",
+            options=list(competition_seasons),
+            default=default_league
+        )
+        
         budget_constraint = st.checkbox("Apply Budget Constraint", value=False)
         
         if budget_constraint:
@@ -168,6 +172,11 @@ with col2:
         else:
             tabs = [st.container()]  # If only one goalkeeper, use a container instead of tabs
         
+        # Distribution profiles of every goalkeeper in the searched leagues
+        compared_leagues = ([competition_seasons[league] for league in similarity_leagues]
+                            or [(DEFAULT_COMPETITION_ID, DEFAULT_SEASON_ID)])
+        similarity_index = get_similarity_index(compared_leagues)
+        
         # Store all radar and pitch figures for PDF export
         all_radar_figs = []
         all_pitch_figs = []
@@ -189,13 +198,30 @@ with col2:
                 # Create metrics display
                 col1_metrics, col2_metrics, col3_metrics = st.columns(3)
                 
-                # Simulate goalkeeper stats based on selected goalkeeper
-                # In a real app, this would use actual data from the database
-                gk_success_rate = 0.75 if i == 0 else 0.68 + (i * 0.02)
-                gk_short_pct = 0.70 if i == 0 else 0.60 + (i * 0.03)
-                gk_long_pct = 0.30 if i == 0 else 0.40 - (i * 0.03)
-                gk_pressure_pct = 0.35 if i == 0 else 0.45 - (i * 0.02)
-                gk_total_passes = 32 if i == 0 else 25 + i
+                # Goalkeeper stats from the distribution profile; league
+                # averages when the goalkeeper is not indexed
+                gk_row = similarity_index.find(goalkeeper, goalkeeper_teams.get(goalkeeper))
+                if gk_row is not None:
+                    gk_profile = similarity_index.profile(gk_row)
+                elif not len(similarity_index):
+                    st.warning(f"No goalkeeper in the compared leagues has {MIN_PASSES} or more passes; "
+                               f"no profile is available for {goalkeeper}.")
+                    continue
+                else:
+                    if (DEFAULT_COMPETITION_ID, DEFAULT_SEASON_ID) not in compared_leagues:
+                        reason = f"the league {goalkeeper} plays in is not selected for comparison"
+                    else:
+                        reason = f"{goalkeeper} has fewer than {MIN_PASSES} passes in the loaded matches"
+                    st.caption(f"No distribution profile as {reason}; showing league averages.")
+                    gk_profile = pd.concat([similarity_index.goalkeepers.mean(numeric_only=True),
+                                            similarity_index.features.mean()])
+                
+                gk_success_rate = gk_profile['success_rate']
+                gk_short_pct = gk_profile['short_pct']
+                gk_medium_pct = gk_profile['medium_pct']
+                gk_long_pct = gk_profile['long_pct']
+                gk_pressure_pct = gk_profile['pressure_pct']
+                gk_total_passes = int(gk_profile['passes'])
                 
                 with col1_metrics:
                     st.metric("Pass Success Rate", f"{gk_success_rate:.1%}")
@@ -203,28 +229,24 @@ with col2:
                 
                 with col2_metrics:
                     st.metric("Total Passes", f"{gk_total_passes}")
+                    st.metric("Medium Pass %", f"{gk_medium_pct:.1%}")
                     st.metric("Long Pass %", f"{gk_long_pct:.1%}")
                 
                 with col3_metrics:
                     st.metric("Under Pressure %", f"{gk_pressure_pct:.1%}")
                     
-                    # Calculate estimated xT-GK value based on available metrics
-                    estimated_xt_gk = (
-                        gk_success_rate * 0.6 + 
-                        (1 - gk_pressure_pct) * 0.4
-                    )
-                    st.metric("Est. xT-GK", f"{estimated_xt_gk:.2f}")
+                    st.metric("xT-GK per Pass", f"{gk_profile['xt_gk']:.3f}")
                 
                 # Distribution radar chart
                 st.markdown("### Distribution Skill Profile")
                 
                 # Create radar chart data
                 gk_data_dict = {
-                    "Short Accuracy": 0.75 if i == 0 else 0.65 + (i * 0.02),
-                    "Long Accuracy": 0.65 if i == 0 else 0.70 - (i * 0.02),
-                    "Under Pressure": 0.70 if i == 0 else 0.60 + (i * 0.03),
-                    "Speed of Release": 0.80 if i == 0 else 0.65 + (i * 0.04),
-                    "Tactical Decisions": 0.75 if i == 0 else 0.70 - (i * 0.01)
+                    "Short Accuracy": gk_profile['short_success'],
+                    "Long Accuracy": gk_profile['long_success'],
+                    "Under Pressure": gk_profile['pressure_success'],
+                    "Speed of Release": (similarity_index.goalkeepers['release_speed'] <= gk_profile['release_speed']).mean(),
+                    "Tactical Decisions": (similarity_index.features['xt_gk'] <= gk_profile['xt_gk']).mean()
                 }
                 
                 # Team requirements based on team style
@@ -280,6 +302,22 @@ with col2:
                 st.plotly_chart(radar_fig, use_container_width=True)
                 all_radar_figs.append(radar_fig)
                 
+                # Goalkeepers with the closest distribution profile
+                if gk_row is not None:
+                    st.markdown("### Similar Goalkeepers")
+                    similar = similarity_index.similar_to(gk_row, k=5)
+                    st.dataframe(
+                        similar[['player_name', 'team_name', 'league', 'passes', 'similarity']].rename(columns={
+                            'player_name': 'Goalkeeper',
+                            'team_name': 'Team',
+                            'league': 'League',
+                            'passes': 'Passes',
+                            'similarity': 'Similarity'
+                        }).style.format({'Similarity': '{:.2f}'}),
+                        hide_index=True,
+                        use_container_width=True
+                    )
+                
                 # Distribution pattern visualization
                 st.markdown("### Distribution Pattern Analysis")
                 
@@ -0,0 +1,156 @@
+import os
+import sys
+import json
+import random
+import functools
+
+import pytest
+
+# Add the repository root to path, as the app and pages do
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+from utils.data_loader import StatsBombDataLoader
+
+COMPETITION_ID = 11
+SEASON_ID = 90
+NUM_MATCHES = 4
+EVENTS_PER_MATCH = 600
+
+TEAMS = [(200 + i, f"Team {i}") for i in range(4)]
+POSITIONS = ['Left Back', 'Center Back', 'Right Back', 'Center Midfield', 'Left Wing', 'Right Wing',
+             'Center Forward']
+EVENT_TYPES = ['Pass', 'Carry', 'Shot', 'Pressure', 'Ball Receipt*', 'Duel']
+EVENT_WEIGHTS = [40, 30, 2, 10, 15, 3]
+
+
+def _match_events(match_id, teams, lineups, rng, num_events):
+    """Random but well-formed StatsBomb events for one match."""
+    events = []
+    possession = 1
+    team = teams[0]
+    for i in range(num_events):
+        if rng.random() < 0.08:
+            possession += 1
+            team = teams[1] if team == teams[0] else teams[0]
+
+        lineup = lineups[team]
+        player = rng.choice(lineup[:6] if rng.random() < 0.5 else lineup)
+        event_type = rng.choices(EVENT_TYPES, EVENT_WEIGHTS)[0]
+        position = player['position']['name']
+
+        x = rng.uniform(0, 20) if position == 'Goalkeeper' else rng.uniform(0, 120)
+        y = rng.uniform(0, 80)
+        event = {
+            'id': f"{match_id}-{i}",
+            'index': i + 1,
+            'period': 1 if i < num_events / 2 else 2,
+            'minute': i * 90 // num_events,
+            'second': i % 60,
+            'possession': possession,
+            'possession_team': {'id': team[0], 'name': team[1]},
+            'play_pattern': {'id': 1, 'name': rng.choice(['Regular Play', 'From Goal Kick', 'From Counter'])},
+            'type': {'id': 1, 'name': event_type},
+            'team': {'id': team[0], 'name': team[1]},
+            'player': {'id': player['player_id'], 'name': player['player_name']},
+            'position': {'id': 1, 'name': position},
+            'location': [round(x, 1), round(y, 1)],
+            'duration': round(rng.random(), 3),
+            'related_events': []
+        }
+        if rng.random() < 0.2:
+            event['under_pressure'] = True
+
+        if event_type == 'Pass':
+            end_x = min(120, max(0, x + rng.gauss(10, 25)))
+            end_y = min(80, max(0, y + rng.gauss(0, 15)))
+            event['pass'] = {
+                'end_location': [round(end_x, 1), round(end_y, 1)],
+                'length': round(((end_x - x) ** 2 + (end_y - y) ** 2) ** 0.5, 2),
+                'height': {'name': rng.choice(['Ground Pass', 'High Pass'])},
+                'body_part': {'name': 'Right Foot'},
+                'recipient': {'id': rng.choice(lineup)['player_id'], 'name': 'Recipient'}
+            }
+            if rng.random() < 0.2:
+                event['pass']['outcome'] = {'name': rng.choice(['Incomplete', 'Out'])}
+        elif event_type == 'Carry':
+            event['carry'] = {'end_location': [round(min(120, x + rng.uniform(0, 8)), 1), round(y, 1)]}
+        elif event_type == 'Shot':
+            event['shot'] = {
+                'end_location': [120, 40, 1],
+                'statsbomb_xg': round(rng.random() * 0.3, 4),
+                'outcome': {'name': 'Goal' if rng.random() < 0.15 else 'Saved'}
+            }
+        events.append(event)
+    return events
+
+
+def write_statsbomb_data(root, num_matches=NUM_MATCHES, events_per_match=EVENTS_PER_MATCH, seed=0):
+    """
+    Write a synthetic StatsBomb open data tree with one La Liga season.
+
+    Returns the list of written matches.
+    """
+    rng = random.Random(seed)
+    for directory in (os.path.join('matches', str(COMPETITION_ID)), 'events', 'lineups'):
+        os.makedirs(os.path.join(root, directory), exist_ok=True)
+
+    with open(os.path.join(root, 'competitions.json'), 'w', encoding='utf-8') as f:
+        json.dump([{'competition_id': COMPETITION_ID, 'season_id': SEASON_ID,
+                    'competition_name': 'La Liga', 'season_name': '2020/2021'}], f)
+
+    matches = []
+    for m in range(num_matches):
+        match_id = 1000 + m
+        home, away = TEAMS[(2 * m) % len(TEAMS)], TEAMS[(2 * m + 1) % len(TEAMS)]
+        matches.append({
+            'match_id': match_id,
+            'home_team': {'home_team_id': home[0], 'home_team_name': home[1]},
+            'away_team': {'away_team_id': away[0], 'away_team_name': away[1]},
+            'competition': {'competition_name': 'La Liga'},
+            'season': {'season_name': '2020/2021'}
+        })
+
+        lineups = {}
+        for team in (home, away):
+            lineups[team] = [{
+                'player_id': team[0] * 100 + k,
+                'player_name': f"Player {team[0] * 100 + k}",
+                'position': {'name': 'Goalkeeper' if k == 0 else rng.choice(POSITIONS)}
+            } for k in range(11)]
+
+        with open(os.path.join(root, 'events', f"{match_id}.json"), 'w', encoding='utf-8') as f:
+            json.dump(_match_events(match_id, (home, away), lineups, rng, events_per_match), f)
+        with open(os.path.join(root, 'lineups', f"{match_id}.json"), 'w', encoding='utf-8') as f:
+            json.dump([{'team_id': team[0], 'team_name': team[1], 'lineup': lineup}
+                       for team, lineup in lineups.items()], f)
+
+    with open(os.path.join(root, 'matches', str(COMPETITION_ID), f"{SEASON_ID}.json"), 'w',
+              encoding='utf-8') as f:
+        json.dump(matches, f)
+
+    return matches
+
+
+@pytest.fixture
+def statsbomb_dir(tmp_path):
+    """Directory holding a fresh synthetic StatsBomb data tree."""
+    write_statsbomb_data(str(tmp_path))
+    return str(tmp_path)
+
+
+@pytest.fixture
+def data_loader(statsbomb_dir):
+    """Data loader over the synthetic data tree."""
+    return StatsBombDataLoader(data_dir=statsbomb_dir)
+
+
+@pytest.fixture
+def data_service(statsbomb_dir, monkeypatch):
+    """The shared dataset service, reading the synthetic data tree."""
+    from utils import data_service
+
+    monkeypatch.setattr(data_service, 'StatsBombDataLoader',
+                        functools.partial(StatsBombDataLoader, data_dir=statsbomb_dir))
+    data_service.invalidate()
+    yield data_service
+    data_service.invalidate()
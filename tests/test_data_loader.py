@@ -0,0 +1,111 @@
+import os
+import json
+
+import pandas as pd
+import pytest
+
+from utils.data_loader import EVENT_COLUMNS, events_to_frame
+from conftest import COMPETITION_ID, SEASON_ID, NUM_MATCHES
+
+pytest.importorskip('pyarrow')
+
+MATCH_ID = 1000
+
+
+def assert_same_frame(frame, expected):
+    """
+    Compare event frames by values and dtype names. The categories of empty
+    category columns may be typed differently depending on how the frame
+    was built.
+    """
+    assert list(frame.dtypes.astype(str)) == list(expected.dtypes.astype(str))
+    pd.testing.assert_frame_equal(frame, expected, check_dtype=False, check_categorical=False)
+
+
+def test_event_store_round_trip(data_loader):
+    frame = data_loader.get_match_events_frame(MATCH_ID)
+    assert os.path.exists(data_loader._event_store_file(MATCH_ID))
+    assert data_loader._store_is_fresh(MATCH_ID)
+
+    stored = data_loader._read_event_store(MATCH_ID, [name for name, _, _ in EVENT_COLUMNS])
+    assert stored is not None
+    assert_same_frame(stored, frame)
+    assert_same_frame(stored, events_to_frame(data_loader.get_match_events(MATCH_ID)))
+
+
+def test_match_events_read_from_store(data_loader, monkeypatch):
+    with open(data_loader._events_file(MATCH_ID), 'r', encoding='utf-8') as f:
+        source = json.load(f)
+
+    # The first read builds the store, later reads do not parse the JSON file
+    assert data_loader.get_match_events(MATCH_ID) == source
+    assert data_loader._store_is_fresh(MATCH_ID)
+    monkeypatch.setattr(data_loader, '_load_events_json', lambda match_id: pytest.fail("events JSON parsed"))
+    assert data_loader.get_match_events(MATCH_ID) == source
+
+
+def test_event_store_keeps_dtypes_of_empty_columns(data_loader):
+    # Keep only the passes, so the shot and carry columns are all missing
+    events = [event for event in data_loader.get_match_events(MATCH_ID) if event['type']['name'] == 'Pass']
+    with open(data_loader._events_file(MATCH_ID), 'w', encoding='utf-8') as f:
+        json.dump(events, f)
+
+    data_loader.get_match_events_frame(MATCH_ID)
+    stored = data_loader.get_match_events_frame(MATCH_ID)
+    assert data_loader._store_is_fresh(MATCH_ID)
+
+    for name, _, dtype in EVENT_COLUMNS:
+        assert str(stored[name].dtype) == dtype, name
+    assert stored['shot.outcome.name'].isna().all()
+
+
+def test_event_store_rebuilds_when_source_changes(data_loader):
+    events = data_loader.get_match_events(MATCH_ID)
+    assert len(data_loader.get_match_events_frame(MATCH_ID)) == len(events)
+
+    with open(data_loader._events_file(MATCH_ID), 'w', encoding='utf-8') as f:
+        json.dump(events[:100], f)
+
+    assert not data_loader._store_is_fresh(MATCH_ID)
+    assert len(data_loader.get_match_events_frame(MATCH_ID)) == 100
+    assert data_loader._store_is_fresh(MATCH_ID)
+
+
+def test_parallel_ingestion_matches_serial(data_loader):
+    serial = data_loader.get_goalkeeper_distribution_data(COMPETITION_ID, SEASON_ID, NUM_MATCHES)
+    parallel = data_loader.get_goalkeeper_distribution_data(COMPETITION_ID, SEASON_ID, NUM_MATCHES, workers=2)
+
+    assert serial['pass_events']
+    assert parallel == serial
+
+
+def test_goalkeeper_counters_match_recount(data_loader):
+    data = data_loader.get_goalkeeper_distribution_data(COMPETITION_ID, SEASON_ID, num_matches=1)
+
+    assert data['goalkeeper_data']
+    for row in data['goalkeeper_data']:
+        passes = [event for event in data['pass_events'] if event['player']['id'] == row['player_id']]
+        lengths = [event['pass'].get('length') for event in passes]
+        assert row['total_passes'] == len(passes)
+        assert row['successful_passes'] == sum(not event['pass'].get('outcome') for event in passes)
+        assert row['short_passes'] == sum(1 for length in lengths if length and length < 30)
+        assert row['long_passes'] == sum(1 for length in lengths if length and length >= 30)
+        assert row['under_pressure'] == sum(1 for event in passes if event.get('under_pressure'))
+
+
+def test_pass_events_are_source_events(data_loader):
+    source = {
+        event['id']: event
+        for match in data_loader.get_matches(COMPETITION_ID, SEASON_ID)
+        for event in data_loader.get_match_events(match['match_id'])
+    }
+
+    # First call ingests the JSON, second reads the columnar store
+    cold = data_loader.get_goalkeeper_distribution_data(COMPETITION_ID, SEASON_ID, NUM_MATCHES)
+    warm = data_loader.get_goalkeeper_distribution_data(COMPETITION_ID, SEASON_ID, NUM_MATCHES)
+
+    assert warm == cold
+    for event in warm['pass_events']:
+        assert event == source[event['id']]
+        assert event['type']['name'] == 'Pass'
+        assert event['position']['name'] == 'Goalkeeper'
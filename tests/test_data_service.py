@@ -0,0 +1,143 @@
+import os
+import sys
+import subprocess
+
+import numpy as np
+import pytest
+
+from utils.visualizations import PITCH_LENGTH, PITCH_WIDTH, pressing_surface
+from conftest import COMPETITION_ID, SEASON_ID, NUM_MATCHES
+
+
+def test_data_service_imports_without_analysis_modules():
+    # Pages that only read cached data do not pay for the analyzer or plotting
+    code = (
+        "import sys; import utils.data_service; "
+        "print(sorted(name for name in ('utils.xt_gk_analyzer', 'utils.visualizations', 'utils.gk_similarity') "
+        "if name in sys.modules))"
+    )
+    root = os.path.join(os.path.dirname(__file__), '..')
+    result = subprocess.run([sys.executable, '-c', code], cwd=root, capture_output=True, text=True, check=True)
+    assert result.stdout.strip() == '[]'
+
+
+def test_datasets_are_shared_until_invalidated(data_service):
+    data = data_service.get_sample_data()
+    assert data['goalkeeper_data']
+    assert data_service.get_sample_data() is data
+    assert data_service.get_data_loader() is data_service.get_data_loader()
+
+    data_service.invalidate()
+    reloaded = data_service.get_sample_data()
+    assert reloaded is not data
+    assert reloaded == data
+
+
+def test_teams_and_goalkeepers_follow_loaded_matches(data_service):
+    data = data_service.get_distribution_data(COMPETITION_ID, SEASON_ID, num_matches=2)
+
+    teams = data_service.get_available_teams(COMPETITION_ID, SEASON_ID, num_matches=2)
+    expected_teams = []
+    for match in data['match_info']:
+        for team in (match['home_team'], match['away_team']):
+            if team not in expected_teams:
+                expected_teams.append(team)
+    assert teams == expected_teams
+
+    goalkeepers = data_service.get_team_goalkeepers(teams[0], COMPETITION_ID, SEASON_ID, num_matches=2)
+    assert goalkeepers == list(dict.fromkeys(
+        gk['player_name'] for gk in data['goalkeeper_data'] if gk['team_name'] == teams[0]
+    ))
+
+
+def test_pressing_surface_turns_pressing_team_around(data_service, data_loader):
+    x, y = [], []
+    for match in data_loader.get_matches(COMPETITION_ID, SEASON_ID):
+        events = data_loader.get_match_events(match['match_id'])
+        for event in events:
+            if event['type']['name'] == 'Pressure' and event['team']['name'] == "Team 1":
+                x.append((120 - event['location'][0]) * PITCH_LENGTH / 120)
+                y.append((80 - event['location'][1]) * PITCH_WIDTH / 80)
+
+    surface = data_service.get_pressing_surface("Team 1", COMPETITION_ID, SEASON_ID)
+
+    np.testing.assert_allclose(surface, pressing_surface(x, y))
+    assert not surface.flags.writeable
+    assert data_service.get_pressing_surface("Team 1", COMPETITION_ID, SEASON_ID) is surface
+    assert data_service.get_pressing_surface("Unknown Team", COMPETITION_ID, SEASON_ID) is None
+
+
+def test_goalkeeper_passes_in_meters(data_service):
+    pass_events = data_service.get_distribution_data(COMPETITION_ID, SEASON_ID, NUM_MATCHES)['pass_events']
+    goalkeeper = pass_events[0]['player']['name']
+
+    passes = data_service.get_goalkeeper_passes(goalkeeper, competition_id=COMPETITION_ID, season_id=SEASON_ID,
+                                                num_matches=NUM_MATCHES)
+
+    events = [event for event in pass_events if event['player']['name'] == goalkeeper]
+    np.testing.assert_allclose(passes['x'], [event['location'][0] * PITCH_LENGTH / 120 for event in events])
+    np.testing.assert_allclose(passes['end_y'], [event['pass']['end_location'][1] * PITCH_WIDTH / 80
+                                                 for event in events])
+    assert list(passes['completed']) == [not event['pass'].get('outcome') for event in events]
+    assert set(passes['team_name']) == {events[0]['team']['name']}
+
+
+def test_team_shape_averages_player_locations(data_service, data_loader):
+    match_info = data_service.get_distribution_data(COMPETITION_ID, SEASON_ID, NUM_MATCHES)['match_info']
+    events = [
+        event
+        for match in match_info if "Team 0" in (match['home_team'], match['away_team'])
+        for event in data_loader.get_match_events(match['match_id'])
+        if event['team']['name'] == "Team 0"
+    ]
+
+    shape = data_service.get_team_shape("Team 0", competition_id=COMPETITION_ID, season_id=SEASON_ID,
+                                        num_matches=NUM_MATCHES)
+
+    assert len(shape) == 11
+    assert list(shape['is_goalkeeper']) == [True] + [False] * 10
+    assert shape['position'].iat[0] == 'Goalkeeper'
+    for row in shape.itertuples():
+        player_events = [event for event in events if event['player']['id'] == row[1]]
+        assert row.events == len(player_events)
+        assert row.x == pytest.approx(np.mean([event['location'][0] for event in player_events]) * PITCH_LENGTH / 120)
+        assert row.gk_passes == sum(
+            1 for event in events
+            if event['type']['name'] == 'Pass' and event['position']['name'] == 'Goalkeeper'
+            and event['pass']['recipient']['id'] == row[1]
+        )
+
+    goal_kicks = data_service.get_team_shape("Team 0", 'Goal Kick', COMPETITION_ID, SEASON_ID, NUM_MATCHES)
+    assert goal_kicks['events'].sum() < shape['events'].sum()
+
+
+def test_analyzer_uses_grid_fitted_on_default_season(data_service, data_loader):
+    analyzer = data_service.get_analyzer()
+
+    assert analyzer.pitch_dimensions == (120, 80)
+    assert data_service.get_analyzer() is analyzer
+    assert not np.array_equal(analyzer.base_values, analyzer._initialize_base_values())
+    assert os.listdir(os.path.join(data_loader.data_dir, 'models'))
+
+
+def test_analyzer_warms_up_in_background(data_service, data_loader):
+    thread = data_service.warm_up_analyzer()
+    assert data_service.warm_up_analyzer() is thread
+    thread.join()
+
+    # The grid was fitted and written off the request path
+    assert data_service.get_analyzer()._pending_base_values is None
+    assert os.listdir(os.path.join(data_loader.data_dir, 'models'))
+
+    data_service.invalidate()
+    reloaded = data_service.warm_up_analyzer()
+    assert reloaded is not thread
+    reloaded.join()
+
+
+def test_goalkeeper_passes_default_to_loaded_matches(data_service):
+    loaded = data_service.get_sample_data()['pass_events']
+    season = data_service.get_goalkeeper_passes(num_matches=NUM_MATCHES)
+
+    assert data_service.DEFAULT_NUM_MATCHES < NUM_MATCHES
+    assert len(data_service.get_goalkeeper_passes()['x']) == len(loaded) < len(season['x'])
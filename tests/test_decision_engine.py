@@ -0,0 +1,72 @@
+import numpy as np
+import pytest
+
+from utils import decision_engine
+from utils.decision_engine import MIN_PASS_DISTANCE, PITCH_LENGTH, PITCH_WIDTH, decision_surface, top_targets
+from utils.xt_gk_analyzer import XtGkAnalyzer
+
+
+@pytest.fixture(autouse=True)
+def fitted_grid(data_service):
+    """Evaluate surfaces on the xT grid fitted on the synthetic season."""
+    return data_service
+
+
+def test_surface_covers_the_pitch():
+    surface = decision_surface(goalkeeper_position=(5, 34))
+
+    assert surface['value'].shape == (PITCH_WIDTH, PITCH_LENGTH)
+    assert surface['x'][0] == 0.5 and surface['y'][-1] == PITCH_WIDTH - 0.5
+    np.testing.assert_array_equal(np.isnan(surface['value']), surface['distance'] < MIN_PASS_DISTANCE)
+    assert ((surface['success'] > 0) & (surface['success'] <= 1)).all()
+
+
+def test_opponent_on_passing_lane_lowers_completion():
+    free = decision_surface(goalkeeper_position=(5, 34), pressure_level=8)
+    pressed = decision_surface(goalkeeper_position=(5, 34), pressure_level=8, opponent_positions=[(15, 34)])
+
+    # Targets at (25.5, 34.5) behind the opponent and (25.5, 10.5) away from it
+    behind = pressed['success'][34, 25] / free['success'][34, 25]
+    wide = pressed['success'][10, 25] / free['success'][10, 25]
+    assert behind < 0.7
+    assert wide > 0.95
+
+
+def test_top_targets_are_best_first_and_apart():
+    surface = decision_surface(goalkeeper_position=(5, 34), opponent_positions=[(15, 34), (20, 20)])
+
+    targets = top_targets(surface, n=5, min_separation=10.0)
+
+    assert len(targets) == 5
+    values = [target['value'] for target in targets]
+    assert values == sorted(values, reverse=True)
+    assert values[0] == np.nanmax(surface['value'])
+    for i, first in enumerate(targets):
+        for second in targets[i + 1:]:
+            assert np.hypot(first['position'][0] - second['position'][0],
+                            first['position'][1] - second['position'][1]) >= 10.0
+
+
+def test_zone_values_broadcast():
+    analyzer = XtGkAnalyzer(pitch_dimensions=(PITCH_LENGTH, PITCH_WIDTH), interpolate=True)
+    x = np.arange(0.5, PITCH_LENGTH, 5.0)
+    y = np.arange(0.5, PITCH_WIDTH, 5.0)
+
+    grid = analyzer.zone_values(x[None, :], y[:, None])
+
+    assert grid.shape == (len(y), len(x))
+    for i, target_y in enumerate(y):
+        for j, target_x in enumerate(x):
+            assert grid[i, j] == analyzer.zone_values(target_x, target_y)
+
+
+def test_surface_follows_reloaded_grid(fitted_grid):
+    before = decision_surface(goalkeeper_position=(5, 34))
+
+    fitted_grid.invalidate()
+    analyzer = fitted_grid.get_analyzer()
+    analyzer.base_values = np.zeros_like(analyzer.base_values)
+    after = decision_surface(goalkeeper_position=(5, 34))
+
+    assert decision_engine._analyzer().base_values is analyzer.base_values
+    assert not np.allclose(after['value'], before['value'], equal_nan=True)
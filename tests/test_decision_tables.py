@@ -0,0 +1,97 @@
+import itertools
+
+import numpy as np
+import pytest
+
+from utils.decision_tables import (
+    PRESSURE_LEVELS, GAME_STATES, SCORE_STATES, TACTICAL_APPROACHES, FIELD_CONDITIONS,
+    build_decision_tables, load_decision_tables, lookup_options
+)
+
+CONTEXTS = list(itertools.product(PRESSURE_LEVELS, GAME_STATES, SCORE_STATES, TACTICAL_APPROACHES,
+                                  FIELD_CONDITIONS))
+
+
+def page_options(pressure_level, game_state, score_state, team_tactical_approach):
+    """The In-Game Decision page's option logic before the tables existed."""
+    short_options = [
+        {"name": "Left Center Back", "distance": "short", "xT_value": 0.65},
+        {"name": "Right Center Back", "distance": "short", "xT_value": 0.68}
+    ]
+    if game_state in ["Build-up from Goal Kick", "Build-up from Open Play"]:
+        short_options.extend([
+            {"name": "Left Full Back", "distance": "short", "xT_value": 0.58},
+            {"name": "Right Full Back", "distance": "short", "xT_value": 0.56}
+        ])
+    medium_options = [
+        {"name": "Defensive Midfielder", "distance": "medium", "xT_value": 0.52},
+        {"name": "Left Midfielder", "distance": "medium", "xT_value": 0.48},
+        {"name": "Right Midfielder", "distance": "medium", "xT_value": 0.45}
+    ]
+    long_options = [
+        {"name": "Left Winger", "distance": "long", "xT_value": 0.35},
+        {"name": "Striker", "distance": "long", "xT_value": 0.32},
+        {"name": "Right Winger", "distance": "long", "xT_value": 0.30}
+    ]
+
+    if game_state == "Counter-Attack Opportunity":
+        distribution_options = short_options[:1] + medium_options[1:] + long_options
+    elif game_state == "Defensive Reset":
+        distribution_options = short_options + medium_options[:1]
+    else:
+        distribution_options = short_options + medium_options + long_options
+
+    pressure_factor = 1.0 - (pressure_level / 20)
+    for option in distribution_options:
+        base_xt = option["xT_value"]
+        if option["distance"] == "short" and pressure_level > 7:
+            option["xT_value"] = base_xt * (pressure_factor * 0.8)
+        elif option["distance"] == "long" and pressure_level > 5:
+            option["xT_value"] = base_xt * (pressure_factor * 0.9)
+        else:
+            option["xT_value"] = base_xt * pressure_factor
+
+    for option in distribution_options:
+        if team_tactical_approach == "Possession-Based" and option["distance"] == "short":
+            option["xT_value"] *= 1.2
+        elif team_tactical_approach == "Direct Play" and option["distance"] == "long":
+            option["xT_value"] *= 1.2
+        elif team_tactical_approach == "Counter-Attacking" and option["distance"] in ["medium", "long"]:
+            option["xT_value"] *= 1.15
+
+    for option in distribution_options:
+        if score_state == "Winning" and option["distance"] == "short":
+            option["xT_value"] *= 1.1
+        elif score_state == "Losing" and option["distance"] == "long":
+            option["xT_value"] *= 1.1
+
+    return distribution_options
+
+
+@pytest.fixture
+def tables_path(tmp_path):
+    return str(tmp_path / 'decision_tables.npz')
+
+
+def test_tables_match_page_logic(tables_path):
+    for pressure_level, game_state, score_state, tactical_approach, field_conditions in CONTEXTS:
+        expected = page_options(pressure_level, game_state, score_state, tactical_approach)
+        options = lookup_options(pressure_level, game_state, score_state, tactical_approach, field_conditions,
+                                 path=tables_path)
+
+        # Same options and values, ranked best first with ties in page order
+        expected_ranked = sorted(expected, key=lambda option: -option["xT_value"])
+        assert [option["name"] for option in options] == [option["name"] for option in expected_ranked]
+        np.testing.assert_allclose([option["xT_value"] for option in options],
+                                   [option["xT_value"] for option in expected_ranked], rtol=1e-6)
+
+
+def test_tables_are_cached(tables_path):
+    tables = load_decision_tables(tables_path)
+    load_decision_tables.cache_clear()
+    cached = load_decision_tables(tables_path)
+
+    built = build_decision_tables()
+    np.testing.assert_array_equal(cached['ranking'], built['ranking'])
+    np.testing.assert_array_equal(cached['values'], tables['values'])
+    assert not cached['values'].flags.writeable
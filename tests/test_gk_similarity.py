@@ -0,0 +1,81 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from utils.gk_similarity import FEATURE_NAMES, GoalkeeperSimilarityIndex, goalkeeper_features
+from conftest import COMPETITION_ID, SEASON_ID, NUM_MATCHES
+
+
+@pytest.fixture
+def features():
+    rng = np.random.default_rng(0)
+    num_goalkeepers = 200
+    frame = pd.DataFrame(rng.random((num_goalkeepers, len(FEATURE_NAMES))), columns=FEATURE_NAMES)
+    frame.insert(0, 'player_id', np.arange(num_goalkeepers))
+    frame.insert(1, 'player_name', [f"Goalkeeper {i}" for i in range(num_goalkeepers)])
+    frame.insert(2, 'team_name', [f"Team {i % 20}" for i in range(num_goalkeepers)])
+    frame.insert(3, 'passes', rng.integers(10, 500, num_goalkeepers))
+    return frame
+
+
+def brute_force_similarity(features, query):
+    """Cosine similarity of standardized features, one goalkeeper at a time."""
+    values = features[FEATURE_NAMES].to_numpy(dtype=float)
+    mean = values.mean(axis=0)
+    scale = values.std(axis=0)
+
+    target = (np.asarray(query, dtype=float) - mean) / scale
+    similarity = []
+    for row in values:
+        standardized = (row - mean) / scale
+        similarity.append(standardized @ target / (np.linalg.norm(standardized) * np.linalg.norm(target)))
+    return np.array(similarity)
+
+
+@pytest.mark.parametrize('k', [1, 5, 20])
+def test_query_returns_top_k(features, k):
+    index = GoalkeeperSimilarityIndex(features)
+    query = features[FEATURE_NAMES].iloc[7].to_numpy() * 0.9
+
+    result = index.query(query, k=k)
+
+    expected = brute_force_similarity(features, query)
+    top = np.argsort(-expected, kind='stable')[:k]
+    assert list(result['player_id']) == list(features['player_id'].iloc[top])
+    np.testing.assert_allclose(result['similarity'], expected[top])
+
+
+def test_query_by_feature_name(features):
+    index = GoalkeeperSimilarityIndex(features)
+    query = features[FEATURE_NAMES].iloc[3]
+
+    pd.testing.assert_frame_equal(index.query(query.to_dict(), k=5), index.query(query.to_numpy(), k=5))
+
+
+def test_similar_to_excludes_goalkeeper(features):
+    index = GoalkeeperSimilarityIndex(features)
+    row = index.find("Goalkeeper 12")
+
+    result = index.similar_to(row, k=len(index))
+
+    assert len(result) == len(index) - 1
+    assert "Goalkeeper 12" not in set(result['player_name'])
+    assert result['similarity'].is_monotonic_decreasing
+
+
+def test_features_from_pass_events(data_loader):
+    pass_events = data_loader.get_goalkeeper_distribution_data(COMPETITION_ID, SEASON_ID, NUM_MATCHES)['pass_events']
+    features = goalkeeper_features(pass_events, min_passes=1)
+
+    assert len(features) == len({event['player']['id'] for event in pass_events})
+    assert features['passes'].sum() == len(pass_events)
+    np.testing.assert_allclose(features[['short_pct', 'medium_pct', 'long_pct']].sum(axis=1), 1.0)
+    assert features[['short_success', 'medium_success', 'long_success']].le(1).all().all()
+
+    # Speed of release: mean ball speed of each goalkeeper's passes
+    for row in features.itertuples(index=False):
+        speeds = [
+            np.hypot(*np.subtract(event['pass']['end_location'], event['location'])) / event['duration']
+            for event in pass_events if event['player']['id'] == row.player_id and event['duration']
+        ]
+        assert row.release_speed == pytest.approx(np.mean(speeds))
@@ -0,0 +1,243 @@
+import os
+import re
+import concurrent.futures
+
+import pandas as pd
+import plotly.graph_objects as go
+import pytest
+
+try:
+    from utils import pdf_generator
+    from utils.report_cache import cached_report
+except (ImportError, OSError):  # WeasyPrint or its system libraries are missing
+    pytest.skip("WeasyPrint is not available", allow_module_level=True)
+
+
+class FakeRenderer:
+    """Stands in for the persistent Kaleido renderer."""
+
+    def __init__(self, result=None, error=None):
+        self.result = result
+        self.error = error
+        self.calls = 0
+        self.closed = False
+
+    def render(self, figs, opts, timeout):
+        self.calls += 1
+        if self.error is not None:
+            raise self.error
+        return self.result(figs)
+
+    def close(self):
+        self.closed = True
+
+
+@pytest.fixture(autouse=True)
+def image_store(tmp_path, monkeypatch):
+    """Keep figure images in a store private to the test."""
+    store_dir = str(tmp_path / 'figures')
+    monkeypatch.setattr(pdf_generator, 'IMAGE_STORE_DIR', store_dir)
+    return store_dir
+
+
+@pytest.fixture
+def figures():
+    return [go.Figure(go.Scatter(x=[0, i], y=[i, 0])) for i in range(3)]
+
+
+@pytest.fixture
+def to_image(monkeypatch):
+    """Record the figures rendered one at a time with pio.to_image."""
+    rendered = []
+
+    def fake_to_image(fig, format='png', **kwargs):
+        rendered.append(fig)
+        return f"{format}:{fig.data[0].y[0]}".encode('utf-8')
+
+    monkeypatch.setattr(pdf_generator.pio, 'to_image', fake_to_image)
+    return rendered
+
+
+def test_renderer_draws_all_figures_at_once(monkeypatch, figures, to_image):
+    renderer = FakeRenderer(result=lambda figs: [f"tab:{fig['data'][0]['y'][0]}".encode('utf-8') for fig in figs])
+    monkeypatch.setattr(pdf_generator, '_renderer', renderer)
+
+    assert pdf_generator.rasterize_figures(figures) == [b"tab:0", b"tab:1", b"tab:2"]
+    assert renderer.calls == 1
+    assert to_image == []
+
+
+def test_figures_the_renderer_missed_are_retried(monkeypatch, figures, to_image):
+    renderer = FakeRenderer(result=lambda figs: [b"tab:0", None, b"tab:2"])
+    monkeypatch.setattr(pdf_generator, '_renderer', renderer)
+
+    assert pdf_generator.rasterize_figures(figures) == [b"tab:0", b"png:1", b"tab:2"]
+    assert to_image == [figures[1]]
+
+
+@pytest.mark.parametrize('renderer', [None, FakeRenderer(error=RuntimeError("no browser"))])
+def test_unavailable_renderer_falls_back_to_to_image(monkeypatch, figures, to_image, renderer):
+    monkeypatch.setattr(pdf_generator, '_renderer', renderer)
+
+    assert pdf_generator.rasterize_figures(figures, format='svg') == [b"svg:0", b"svg:1", b"svg:2"]
+    assert to_image == figures
+
+
+def test_renderer_timeout_falls_back_to_to_image(monkeypatch, figures, to_image):
+    renderer = FakeRenderer(error=concurrent.futures.TimeoutError())
+    monkeypatch.setattr(pdf_generator, '_renderer', renderer)
+
+    assert pdf_generator.rasterize_figures(figures) == [b"png:0", b"png:1", b"png:2"]
+    # The stuck browser is shut down so the next report starts a fresh one
+    assert renderer.closed
+
+
+class RecordingHTML:
+    """Stands in for weasyprint.HTML and records every document written."""
+
+    documents = []
+
+    def __init__(self, string=None, **kwargs):
+        self.string = string
+
+    def write_pdf(self, target=None, stylesheets=None, **kwargs):
+        RecordingHTML.documents.append((self.string, stylesheets))
+        data = b"%PDF-test"
+        if target is None:
+            return data
+        if hasattr(target, 'write'):
+            target.write(data)
+        else:
+            with open(target, 'wb') as f:
+                f.write(data)
+
+
+@pytest.fixture
+def documents(monkeypatch):
+    RecordingHTML.documents = []
+    monkeypatch.setattr(pdf_generator, 'HTML', RecordingHTML)
+    return RecordingHTML.documents
+
+
+def test_report_renders_compiled_template(monkeypatch, figures, to_image, documents):
+    monkeypatch.setattr(pdf_generator, '_renderer', None)
+    table = pd.DataFrame({'Player': ["Goalkeeper 1"], 'xT-GK': [0.25]})
+
+    for title in ("First Report", "Second Report"):
+        pdf_bytes = pdf_generator.generate_pdf_report(
+            title,
+            {"Summary": "<p>Distribution summary</p>"},
+            figures=[{'figure': figures[1], 'caption': "Pass map"}],
+            tables=[{'data': table, 'caption': "Key metrics"}],
+            metadata={'author': "Analyst", 'date': "2025-01-01"}
+        )
+        assert pdf_bytes == b"%PDF-test"
+
+    (first, first_styles), (second, second_styles) = documents
+    assert "<h1>First Report</h1>" in first and "<h1>Second Report</h1>" in second
+    assert "<p>Distribution summary</p>" in first
+    assert '<img src="' in first
+    assert "Pass map" in first and "Key metrics" in first
+    assert "Goalkeeper 1" in first
+    assert "Date: 2025-01-01" in first
+
+    # Template and stylesheet are built once and shared by every report
+    assert pdf_generator._get_report_template() is pdf_generator._get_report_template()
+    assert first_styles[0] is second_styles[0]
+
+
+def test_figure_store_renders_each_figure_once(monkeypatch, figures, to_image, image_store):
+    monkeypatch.setattr(pdf_generator, '_renderer', None)
+
+    first = pdf_generator.store_figure_images([figures[0], figures[1], go.Figure(go.Scatter(x=[0, 0], y=[0, 0]))],
+                                                format='svg')
+    assert to_image == [figures[0], figures[1]]
+    assert first[0] == first[2] != first[1]
+    assert all(url.startswith('data:image/svg+xml;base64,') for url in first)
+
+    # Stored figures are served without rendering again
+    assert pdf_generator.store_figure_images([figures[1], figures[0]], format='svg') == [first[1], first[0]]
+    assert len(to_image) == 2
+    assert len(os.listdir(image_store)) == 2
+
+    with pytest.raises(ValueError):
+        pdf_generator.store_figure_images(figures, format='jpeg')
+
+
+def test_figure_store_keeps_figures_of_current_report(monkeypatch, figures, to_image, image_store):
+    monkeypatch.setattr(pdf_generator, '_renderer', None)
+    # Room for a single stored figure
+    monkeypatch.setattr(pdf_generator, 'IMAGE_STORE_MAX_BYTES', len(b'svg:0'))
+
+    old, = pdf_generator.store_figure_images([figures[0]], format='svg')
+    stored, = os.listdir(image_store)
+    os.utime(os.path.join(image_store, stored), (0, 0))
+
+    # The old figure is reused and must not be evicted for the new one
+    urls = pdf_generator.store_figure_images([figures[0], figures[1]], format='svg')
+    assert urls[0] == old
+    assert urls[1] is not None and urls[1] != old
+    assert len(to_image) == 2
+    assert len(os.listdir(image_store)) == 2
+
+    # Once no longer needed, the least recently used figure goes first
+    pdf_generator.store_figure_images([figures[2]], format='svg')
+    assert len(os.listdir(image_store)) == 1
+
+
+def test_report_book_links_contents_to_each_report(monkeypatch, tmp_path, figures, to_image, documents):
+    monkeypatch.setattr(pdf_generator, '_renderer', None)
+    reports = [
+        {'title': f"Report {i}", 'content': {"Summary": f"<p>Summary {i}</p>"},
+         'figures': [{'figure': figures[i], 'caption': f"Figure of report {i}"}]}
+        for i in range(3)
+    ]
+    output_path = str(tmp_path / 'book.pdf')
+
+    assert pdf_generator.generate_report_book(reports, output_path, title="Season Book") == output_path
+
+    with open(output_path, 'rb') as f:
+        assert f.read() == b"%PDF-test"
+    assert os.listdir(tmp_path / 'figures') and len(os.listdir(tmp_path)) == 2
+
+    (html, _), = documents
+    toc = html[html.index('class="toc"'):html.index('class="book-report"')]
+    links = re.findall(r'<a href="#([^"]+)">([^<]+)</a>', toc)
+    assert [title for _, title in links] == ["Report 0", "Report 1", "Report 2"]
+    for anchor, title in links:
+        assert f'id="{anchor}">{title}</h1>' in html
+    assert to_image == figures
+
+
+def test_failed_report_book_leaves_no_file(monkeypatch, tmp_path, documents):
+    def write_partial_pdf(html_content, target):
+        with open(target, 'wb') as f:
+            f.write(b"%PDF-partial")
+        raise OSError("No space left on device")
+
+    monkeypatch.setattr(pdf_generator, '_write_pdf', write_partial_pdf)
+    reports = [{'title': "Report", 'content': {"Summary": "<p>Summary</p>"}}]
+
+    with pytest.raises(OSError):
+        pdf_generator.generate_report_book(reports, str(tmp_path / 'book.pdf'))
+    assert [name for name in os.listdir(tmp_path) if name != 'figures'] == []
+
+
+def test_report_with_missing_figure_is_not_cached(monkeypatch, tmp_path, figures, documents):
+    def broken_to_image(fig, **kwargs):
+        raise ValueError("Kaleido requires Chrome")
+
+    monkeypatch.setattr(pdf_generator, '_renderer', None)
+    monkeypatch.setattr(pdf_generator.pio, 'to_image', broken_to_image)
+    cache_dir = str(tmp_path / 'reports')
+
+    with pytest.raises(RuntimeError):
+        cached_report(pdf_generator.generate_pdf_report, cache_dir=cache_dir, title="Report",
+                      content={}, figures=[{'figure': figures[0]}])
+    with pytest.raises(RuntimeError):
+        pdf_generator.generate_report_book([{'title': "Report", 'content': {}, 'figures': [{'figure': figures[0]}]}],
+                                           str(tmp_path / 'book.pdf'))
+
+    assert documents == []
+    assert not os.path.exists(cache_dir) or not os.listdir(cache_dir)
+    assert not os.path.exists(tmp_path / 'book.pdf')
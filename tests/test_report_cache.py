@@ -0,0 +1,87 @@
+import os
+from datetime import datetime, timedelta
+
+import pandas as pd
+import plotly.graph_objects as go
+
+from utils import report_cache
+from utils.report_cache import report_key, load_report, store_report, evict_reports, cached_report, find_report
+
+
+def generate_report(title, figure=None, table=None):
+    return f"%PDF {title}".encode('utf-8')
+
+
+def other_report(title):
+    return b"%PDF other"
+
+
+def make_figure():
+    return go.Figure(go.Scatter(x=[1, 2], y=[3, 4]))
+
+
+def test_report_key_follows_inputs():
+    figure = make_figure()
+    table = pd.DataFrame({'a': [1, 2]})
+    key = report_key(generate_report, title="Report", figure=figure, table=table)
+
+    # Rebuilding the same inputs on a rerun finds the same report
+    assert key == report_key(generate_report, table=table.copy(), figure=make_figure(), title="Report")
+    assert key != report_key(generate_report, title="Other", figure=figure, table=table)
+    assert key != report_key(generate_report, title="Report", figure=go.Figure(go.Bar(x=[1])), table=table)
+    assert key != report_key(generate_report, title="Report", figure=figure, table=table + 1)
+    assert report_key(generate_report, title="Report") != report_key(other_report, title="Report")
+
+
+def test_cached_report_generates_on_miss_only(tmp_path):
+    calls = []
+
+    def generator(title):
+        calls.append(title)
+        return generate_report(title)
+
+    cache_dir = str(tmp_path)
+    assert find_report(generator, cache_dir, title="A") is None
+
+    assert cached_report(generator, cache_dir=cache_dir, title="A") == b"%PDF A"
+    assert cached_report(generator, cache_dir=cache_dir, title="A") == b"%PDF A"
+    assert cached_report(generator, cache_dir=cache_dir, title="B") == b"%PDF B"
+    assert calls == ["A", "B"]
+    assert find_report(generator, cache_dir, title="A") == b"%PDF A"
+
+
+def test_cached_reports_expire_with_their_date(tmp_path, monkeypatch):
+    calls = []
+
+    def generator(title):
+        calls.append(datetime.now().date())
+        return generate_report(title)
+
+    cache_dir = str(tmp_path)
+    cached_report(generator, cache_dir=cache_dir, title="A")
+    cached_report(generator, cache_dir=cache_dir, title="A")
+
+    class Tomorrow(datetime):
+        @classmethod
+        def now(cls, tz=None):
+            return datetime.now(tz) + timedelta(days=1)
+
+    # The next day the report is dated again instead of served stale
+    monkeypatch.setattr(report_cache, 'datetime', Tomorrow)
+    assert find_report(generator, cache_dir, title="A") is None
+    cached_report(generator, cache_dir=cache_dir, title="A")
+    assert len(calls) == 2
+
+
+def test_reports_evicted_least_recently_used_first(tmp_path):
+    cache_dir = str(tmp_path)
+    for age, key in enumerate(['recent', 'old', 'oldest']):
+        store_report(key, b"x" * 100, cache_dir)
+        path = os.path.join(cache_dir, f"{key}.pdf")
+        os.utime(path, ns=(0, 10 ** 18 - age * 10 ** 9))
+
+    # Reading a report makes it the most recently used one
+    assert load_report('oldest', cache_dir) == b"x" * 100
+    evict_reports(cache_dir, max_bytes=200)
+
+    assert sorted(os.listdir(cache_dir)) == ['oldest.pdf', 'recent.pdf']
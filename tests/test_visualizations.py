@@ -0,0 +1,200 @@
+import numpy as np
+import pandas as pd
+import plotly.graph_objects as go
+import pytest
+
+from utils.visualizations import (
+    PITCH_LENGTH, PITCH_WIDTH, add_labels, add_markers, add_passing_lines, create_pitch, create_radar_chart, create_team_coordination_diagram,
+    create_opposition_heatmap, create_pass_map, create_team_shape_diagram, pass_flows, pressing_surface, pressure_field, pressure_layout, PRESSURE_LAYOUTS
+)
+
+
+def test_pitch_copies_are_independent():
+    pitch = create_pitch()
+    pitch.add_trace(go.Scatter(x=[10], y=[20]))
+    pitch.layout.shapes[0].line.color = 'red'
+
+    fresh = create_pitch()
+    assert len(fresh.data) == len(pitch.data) - 1
+    assert fresh.layout.shapes[0].line.color == 'white'
+    assert fresh.to_dict() == create_pitch().to_dict()
+    assert fresh.layout.template == go.Figure().layout.template
+    assert create_pitch(pitch_color='#000000').to_dict() != fresh.to_dict()
+
+    # Whatever the caller adds is still validated
+    with pytest.raises(ValueError):
+        fresh.update_layout(not_a_property=1)
+
+
+def test_radar_chart_closes_each_polygon():
+    attributes = {"Short Accuracy": 0.8, "Long Accuracy": 0.5, "Under Pressure": 0.6}
+    comparison = {"Short Accuracy": 0.7, "Long Accuracy": 0.6}
+
+    fig = create_radar_chart(attributes, comparison)
+
+    goalkeeper, league = fig.data
+    assert list(goalkeeper.theta) == ["Short Accuracy", "Long Accuracy", "Under Pressure", "Short Accuracy"]
+    assert list(goalkeeper.r) == [0.8, 0.5, 0.6, 0.8]
+    assert list(league.r) == [0.7, 0.6, 0, 0.7]
+    assert len(create_radar_chart(attributes).data) == 1
+
+
+@pytest.mark.parametrize('formation', ["4-3-3", "4-4-2", "3-5-2", "4-2-3-1"])
+def test_team_coordination_diagram(formation):
+    fig = create_team_coordination_diagram(formation, "Central")
+
+    assert isinstance(fig, go.Figure)
+    assert fig.data
+
+
+def test_pressing_surface_peaks_at_pressure_location():
+    surface = pressing_surface([10.5, 10.5, 80.0], [6.8, 6.8, 40.0])
+
+    # 30 cells across the width, 50 along the length
+    assert surface.shape == (30, 50)
+    assert surface.max() == 1.0
+    assert np.unravel_index(surface.argmax(), surface.shape) == (3, 5)
+    np.testing.assert_array_equal(surface, pressing_surface([10.5, 10.5, 80.0], [6.8, 6.8, 40.0]))
+
+
+def test_opposition_heatmap_accepts_surface_or_locations():
+    locations = {'x': np.array([20.0, 30.0, 90.0]), 'y': np.array([10.0, 34.0, 60.0])}
+
+    from_locations = create_opposition_heatmap(locations)
+    from_surface = create_opposition_heatmap(pressing_surface(locations['x'], locations['y']))
+
+    contour = from_surface.data[-1]
+    np.testing.assert_array_equal(contour.z, from_locations.data[-1].z)
+    assert contour.x[0] > 0 and contour.x[-1] < PITCH_LENGTH
+    assert contour.y[0] > 0 and contour.y[-1] < PITCH_WIDTH
+
+
+def test_pressure_field_matches_per_point_loop():
+    opponents = [(8, 34), (12, 20), (30, 48)]
+    weights = [1.0, 0.5, 2.0]
+
+    x, y, Z = pressure_field(opponents, weights)
+
+    expected = np.zeros((len(y), len(x)))
+    for i, y_value in enumerate(y):
+        for j, x_value in enumerate(x):
+            for (opponent_x, opponent_y), weight in zip(opponents, weights):
+                distance = np.hypot(x_value - opponent_x, y_value - opponent_y)
+                expected[i, j] += weight * np.exp(-0.05 * distance)
+    np.testing.assert_allclose(Z, expected / expected.max())
+
+    # Memoized per set of positions and shared read-only
+    assert pressure_field(opponents, weights)[2] is Z
+    assert not Z.flags.writeable
+    assert not pressure_field([])[2].any()
+
+
+def test_pressure_layout_by_level():
+    assert [pressure_layout(level) for level in (1, 3, 4, 7, 8, 10)] == [
+        PRESSURE_LAYOUTS['low'], PRESSURE_LAYOUTS['low'], PRESSURE_LAYOUTS['medium'],
+        PRESSURE_LAYOUTS['medium'], PRESSURE_LAYOUTS['high'], PRESSURE_LAYOUTS['high']
+    ]
+
+
+def test_markers_and_labels_take_one_trace_each():
+    points = [{'pos': (i, 2 * i), 'color': color, 'text': f"P{i}"}
+              for i, color in enumerate(['red', 'blue'] * 10)]
+    fig = go.Figure()
+
+    add_markers(fig, points, name="Players")
+    add_labels(fig, [{'pos': (i, i), 'text': f"{i / 10:.1f}"} for i in range(5)])
+
+    markers, labels = fig.data
+    assert list(markers.x) == list(range(20)) and list(markers.y) == list(range(0, 40, 2))
+    assert list(markers.marker.color) == ['red', 'blue'] * 10
+    assert list(markers.text) == [f"P{i}" for i in range(20)]
+    assert labels.mode == 'text' and len(labels.text) == 5
+    assert len(add_markers(go.Figure(), []).data) == 0
+
+
+def test_passing_lines_batched_per_style():
+    lines = [{'start': (0, i), 'end': (10, i), 'color': 'green' if i % 2 else 'yellow', 'legend': "Option"}
+             for i in range(6)]
+    lines.append({'start': (0, 0), 'end': (20, 20), 'dash': 'dot'})
+    fig = go.Figure()
+
+    add_passing_lines(fig, lines)
+
+    yellow, green, dotted = fig.data
+    assert yellow.line.color == 'yellow' and green.line.color == 'green' and dotted.line.dash == 'dot'
+    assert list(green.x) == [0, 10, None] * 3
+    assert list(green.y) == [1, 1, None, 3, 3, None, 5, 5, None]
+    # One legend entry per legend value
+    assert [trace.showlegend for trace in fig.data] == [True, False, False]
+
+
+@pytest.fixture
+def passes():
+    rng = np.random.default_rng(0)
+    num_passes = 500
+    return {
+        'x': rng.uniform(0, 20, num_passes),
+        'y': rng.uniform(0, PITCH_WIDTH, num_passes),
+        'end_x': rng.uniform(0, PITCH_LENGTH, num_passes),
+        'end_y': rng.uniform(0, PITCH_WIDTH, num_passes),
+        'completed': rng.random(num_passes) < 0.7
+    }
+
+
+def test_pass_map_draws_each_outcome_as_one_trace(passes):
+    passes['x'][0] = np.nan
+    base_traces = len(create_pitch().data)
+
+    fig = create_pass_map(passes)
+
+    completed, incomplete = fig.data[base_traces:]
+    num_completed = int(passes['completed'][1:].sum())
+    assert completed.name == f"Completed ({num_completed})"
+    assert incomplete.name == f"Incomplete ({499 - num_completed})"
+    # Start, end and a gap per pass
+    assert len(completed.x) == 3 * num_completed
+    assert len(incomplete.x) == 3 * (499 - num_completed)
+
+
+def test_pass_map_aggregates_large_sets_into_flows(passes):
+    fig = create_pass_map(passes, max_segments=100)
+
+    heads = fig.data[-1]
+    flows = pass_flows(passes['x'], passes['y'], passes['end_x'], passes['end_y'], passes['completed'])
+    assert heads.name == "Pass flows (500 passes)"
+    np.testing.assert_array_equal(heads.x, flows['end_x'])
+    assert flows['count'].sum() == 500
+
+
+def test_pass_flows_match_per_pass_grouping(passes):
+    flows = pass_flows(passes['x'], passes['y'], passes['end_x'], passes['end_y'], passes['completed'])
+
+    groups = {}
+    for x, y, end_x, end_y, completed in zip(*passes.values()):
+        route = (int(x / PITCH_LENGTH * 12), int(y / PITCH_WIDTH * 8),
+                 int(end_x / PITCH_LENGTH * 12), int(end_y / PITCH_WIDTH * 8))
+        groups.setdefault(route, []).append((x, y, end_x, end_y, completed))
+
+    expected = sorted((len(group), *np.mean(group, axis=0)) for group in groups.values())
+    actual = sorted(zip(flows['count'], flows['x'], flows['y'], flows['end_x'], flows['end_y'],
+                        flows['completion']))
+    np.testing.assert_allclose(actual, expected)
+
+
+def test_team_shape_diagram_draws_lanes_to_receivers():
+    shape = pd.DataFrame({
+        'player_name': ["Keeper One", "Back Two", "Mid Three", "Wing Four"],
+        'position': ['Goalkeeper', 'Center Back', 'Center Midfield', 'Left Wing'],
+        'x': [5.0, 20.0, 40.0, 70.0],
+        'y': [34.0, 20.0, 34.0, 60.0],
+        'events': [40, 80, 90, 50],
+        'gk_passes': [0, 12, 6, 0],
+        'is_goalkeeper': [True, False, False, False]
+    })
+
+    fig = create_team_shape_diagram(shape)
+
+    markers = fig.data[-1]
+    assert list(markers.text) == ["One", "Two", "Three", "Four"]
+    lanes = [trace for trace in fig.data if trace.mode == 'lines']
+    assert sorted(trace.line.width for trace in lanes) == [5, 8]
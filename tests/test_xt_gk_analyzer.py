@@ -0,0 +1,247 @@
+import os
+import concurrent.futures
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from utils.xt_gk_analyzer import XtGkAnalyzer
+from conftest import COMPETITION_ID, SEASON_ID
+
+# StatsBomb event coordinates (yards)
+STATSBOMB_PITCH = (120, 80)
+
+
+@pytest.fixture
+def analyzer():
+    return XtGkAnalyzer(pitch_dimensions=STATSBOMB_PITCH)
+
+
+@pytest.fixture
+def match_events(data_loader):
+    match_id = data_loader.get_matches(COMPETITION_ID, SEASON_ID)[0]['match_id']
+    return data_loader.get_match_events(match_id), data_loader.get_match_events_frame(match_id)
+
+
+def possession_chains(analyzer, events):
+    """
+    Possession chain of every event, computed one event at a time as the
+    per-event reference for build_possession_index.
+    """
+    chains = []
+    chain = None
+    for event in events:
+        if chain is None or event['possession'] != chain['possession']:
+            chain = {'possession': event['possession'], 'team_id': event['possession_team']['id'], 'xt_gained': 0.0}
+
+        event_type = event['type']['name']
+        if event['team']['id'] == chain['team_id']:
+            if event_type == 'Carry':
+                end = event['carry']['end_location']
+            elif event_type == 'Pass' and not event['pass'].get('outcome'):
+                end = event['pass']['end_location']
+            else:
+                end = None
+            if end is not None:
+                start = event['location']
+                chain['xt_gained'] += float(
+                    analyzer._zone_values(end[0], end[1]) - analyzer._zone_values(start[0], start[1])
+                )
+        chains.append(chain)
+    return chains
+
+
+@pytest.mark.parametrize('interpolate', [False, True])
+def test_batch_matches_per_event(match_events, interpolate):
+    analyzer = XtGkAnalyzer(pitch_dimensions=STATSBOMB_PITCH, interpolate=interpolate)
+    events, frame = match_events
+    gk_events = [event for event in events if event['position']['name'] == 'Goalkeeper']
+    expected = [analyzer.calculate_xt_gk(event) for event in gk_events]
+
+    # Nested StatsBomb dictionaries and the flat columnar frame
+    nested = analyzer.calculate_xt_gk_batch(pd.DataFrame(gk_events))
+    flat = analyzer.calculate_xt_gk_batch(analyzer.filter_goalkeeper_events(frame))
+
+    np.testing.assert_allclose(nested, expected)
+    np.testing.assert_allclose(flat, expected)
+
+
+def test_possession_index_matches_per_event(analyzer, match_events):
+    events, frame = match_events
+    chains = possession_chains(analyzer, events)
+
+    expected = {
+        event['id']: analyzer.calculate_xt_gk(event, chain)
+        for event, chain in zip(events, chains)
+        if event['position']['name'] == 'Goalkeeper'
+    }
+    assert any(chain['xt_gained'] > 0 for chain in chains)
+
+    processed = analyzer.process_match_events(frame)
+    result = dict(zip(processed['id'], processed['xt_gk']))
+
+    assert result.keys() == expected.keys()
+    np.testing.assert_allclose([result[key] for key in expected], list(expected.values()))
+
+
+def test_build_up_contribution_uses_possession_chain(analyzer, match_events):
+    events, frame = match_events
+    index = analyzer.build_possession_index(frame)
+
+    assert index['num_events'].sum() == len(frame)
+    assert (index['start_offset'].to_numpy()[1:] == index['end_offset'].to_numpy()[:-1]).all()
+
+    chains = possession_chains(analyzer, events)
+    sequences = analyzer.lookup_possession_sequences(index, np.arange(len(frame)))
+    np.testing.assert_allclose(sequences['xt_gained'], [chain['xt_gained'] for chain in chains])
+    assert list(sequences['team_id']) == [chain['team_id'] for chain in chains]
+
+
+def test_interpolation_agrees_at_zone_centres():
+    zoned = XtGkAnalyzer(pitch_dimensions=STATSBOMB_PITCH, grid_resolution=(48, 32))
+    interpolated = XtGkAnalyzer(pitch_dimensions=STATSBOMB_PITCH, grid_resolution=(48, 32), interpolate=True)
+    assert zoned.base_values.shape == (48, 32)
+
+    # Zone centres of a 48x32 grid on a 120x80 pitch
+    x, y = np.meshgrid(np.arange(48) * 2.5 + 1.25, np.arange(32) * 2.5 + 1.25, indexing='ij')
+    np.testing.assert_allclose(interpolated._zone_values(x, y), zoned.base_values)
+    np.testing.assert_allclose(zoned._zone_values(x, y), zoned.base_values)
+
+    # Halfway between two centres the interpolation takes their mean
+    np.testing.assert_allclose(
+        interpolated._zone_values(np.array([2.5]), np.array([1.25])),
+        zoned.base_values[:2, 0].mean()
+    )
+
+
+def test_heatmap_sums_xt_gk_per_zone(analyzer, match_events):
+    _, frame = match_events
+    processed = analyzer.process_match_events(frame)
+    player_id = processed['player.id'].iloc[0]
+
+    fig = analyzer.plot_xt_gk_heatmap(processed, player_id=player_id)
+
+    zone_totals = fig.axes[0].images[0].get_array()
+    assert zone_totals.shape == analyzer.zone_grid.T.shape
+    expected = processed.loc[processed['player.id'] == player_id, 'xt_gk'].sum()
+    np.testing.assert_allclose(zone_totals.sum(), expected)
+
+
+def test_fit_base_values_solves_markov_chain(analyzer):
+    # Two shots from a zone in front of goal, one of them scored, and one
+    # zone further out that passes into it once and shoots once
+    near, far = [115, 45], [95, 45]
+    events = pd.DataFrame([
+        {'type': {'name': 'Shot'}, 'location': near, 'shot': {'outcome': {'name': 'Goal'}}},
+        {'type': {'name': 'Shot'}, 'location': near, 'shot': {'outcome': {'name': 'Saved'}}},
+        {'type': {'name': 'Pass'}, 'location': far, 'pass': {'end_location': near}},
+        {'type': {'name': 'Shot'}, 'location': far, 'shot': {'outcome': {'name': 'Saved'}}},
+    ])
+
+    fitted = analyzer.fit_base_values(events)
+
+    expected = np.zeros(analyzer.zone_grid.shape)
+    expected[11, 4] = 0.5
+    expected[9, 4] = 0.5 * 0.0 + 0.5 * 0.5
+    np.testing.assert_allclose(fitted, expected)
+    np.testing.assert_array_equal(analyzer.base_values, fitted)
+
+
+def test_saved_base_values_round_trip(analyzer, data_loader, tmp_path):
+    match_id = data_loader.get_matches(COMPETITION_ID, SEASON_ID)[0]['match_id']
+    fitted = analyzer.fit_base_values(data_loader.get_match_events_frame(match_id))
+    path = str(tmp_path / 'xt_grid.npz')
+    analyzer.save_base_values(path)
+
+    loaded = XtGkAnalyzer(pitch_dimensions=STATSBOMB_PITCH, base_values_path=path)
+    np.testing.assert_array_equal(loaded.base_values, fitted)
+
+
+def test_fitted_base_values_are_cached(analyzer, data_loader, tmp_path, monkeypatch):
+    path = analyzer.use_fitted_base_values(data_loader, COMPETITION_ID, SEASON_ID,
+                                           artifact_dir=str(tmp_path))
+    # The grid is only fitted once it is needed
+    assert not os.path.exists(path)
+    fitted = analyzer.base_values
+    assert fitted.shape == analyzer.zone_grid.shape
+    assert os.path.exists(path)
+
+    # A second analyzer loads the artifact instead of fitting again
+    cached = XtGkAnalyzer(pitch_dimensions=STATSBOMB_PITCH)
+    monkeypatch.setattr(cached, 'fit_base_values', lambda events: pytest.fail("grid fitted twice"))
+    assert cached.use_fitted_base_values(data_loader, COMPETITION_ID, SEASON_ID,
+                                         artifact_dir=str(tmp_path)) == path
+    np.testing.assert_array_equal(cached.base_values, fitted)
+
+    # The artifact only applies to the pitch it was fitted on
+    assert '_120x80_' in os.path.basename(path)
+    with pytest.raises(ValueError):
+        XtGkAnalyzer(pitch_dimensions=(105, 68), base_values_path=path)
+
+
+def test_fitted_base_values_are_resolved_once_across_threads(analyzer, data_loader, tmp_path, monkeypatch):
+    artifact_dir = tmp_path / 'models'
+    path = analyzer.use_fitted_base_values(data_loader, COMPETITION_ID, SEASON_ID,
+                                           artifact_dir=str(artifact_dir))
+    fit = analyzer.fit_base_values
+    calls = []
+
+    def counting_fit(events):
+        calls.append(events)
+        return fit(events)
+
+    monkeypatch.setattr(analyzer, 'fit_base_values', counting_fit)
+    handcrafted = analyzer._initialize_base_values()
+    with concurrent.futures.ThreadPoolExecutor(max_workers=4) as executor:
+        grids = list(executor.map(lambda _: analyzer.base_values, range(8)))
+
+    # Every thread waits for the fitted grid instead of the handcrafted one
+    assert len(calls) == 1
+    for grid in grids:
+        assert grid is grids[0]
+        assert not np.array_equal(grid, handcrafted)
+    # No temporary files are left behind
+    assert os.listdir(artifact_dir) == [os.path.basename(path)]
+
+
+def test_failed_fit_is_retried(analyzer, data_loader, tmp_path, monkeypatch):
+    analyzer.use_fitted_base_values(data_loader, COMPETITION_ID, SEASON_ID, artifact_dir=str(tmp_path))
+    fit = analyzer.fit_base_values
+
+    def failing_fit(events):
+        raise MemoryError()
+
+    monkeypatch.setattr(analyzer, 'fit_base_values', failing_fit)
+    with pytest.raises(MemoryError):
+        analyzer.base_values
+
+    monkeypatch.setattr(analyzer, 'fit_base_values', fit)
+    assert analyzer.base_values.shape == analyzer.zone_grid.shape
+
+
+def test_performance_table_matches_per_player_loop(analyzer, data_loader):
+    frames = []
+    for match in data_loader.get_matches(COMPETITION_ID, SEASON_ID):
+        processed = analyzer.process_match_events(data_loader.get_match_events_frame(match['match_id']))
+        frames.append(processed.assign(match_id=match['match_id']))
+    gk_events = pd.concat(frames, ignore_index=True)
+
+    table = analyzer.goalkeeper_performance_table(gk_events)
+
+    assert list(table['player.id']) == sorted(gk_events['player.id'].unique())
+    for row in table.itertuples(index=False):
+        player_events = gk_events[gk_events['player.id'] == row[0]]
+        passes = player_events[player_events['type.name'] == 'Pass']
+        completed = passes[~passes['pass.outcome.name'].isin(['Incomplete', 'Out'])]
+        assert row.num_actions == len(player_events)
+        assert row.num_passes == len(passes)
+        assert row.completed_passes == len(completed)
+        assert row.total_xt_gk == pytest.approx(player_events['xt_gk'].sum())
+        assert row.avg_xt_gk == pytest.approx(player_events['xt_gk'].mean())
+        assert row.pass_completion_rate == pytest.approx(len(completed) / len(passes) if len(passes) else 0)
+
+    # Splitting by match only partitions each goalkeeper's totals
+    by_match = analyzer.goalkeeper_performance_table(gk_events, group_by=['match_id'])
+    totals = by_match.groupby('player.id')[['num_actions', 'completed_passes']].sum()
+    np.testing.assert_array_equal(totals.to_numpy(), table[['num_actions', 'completed_passes']].to_numpy())
+    assert analyzer.aggregate_goalkeeper_performance(gk_events).keys() == set(table['player.id'])
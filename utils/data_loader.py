@@ -1,14 +1,135 @@
 import os
 import json
+import hashlib
+from concurrent.futures import ProcessPoolExecutor
 import pandas as pd
 import numpy as np
 
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:  # Columnar event store is optional
+    pa = None
+    pq = None
+
+# Version of the columnar event store layout. Bump this whenever the columns
+# below change so that stale Parquet files are rebuilt from the source JSON.
+EVENT_STORE_VERSION = 3
+
+# Typed columns kept in the columnar event store. Each entry maps a flat column
+# name to the path of the value in the StatsBomb event dictionary and the
+# pandas dtype used for the column. Coordinates are split into x/y columns.
+EVENT_COLUMNS = [
+    ('id', ('id',), 'string'),
+    ('index', ('index',), 'Int32'),
+    ('period', ('period',), 'Int8'),
+    ('minute', ('minute',), 'Int16'),
+    ('second', ('second',), 'Int8'),
+    ('possession', ('possession',), 'Int32'),
+    ('possession_team.id', ('possession_team', 'id'), 'Int32'),
+    ('play_pattern.name', ('play_pattern', 'name'), 'category'),
+    ('type.name', ('type', 'name'), 'category'),
+    ('team.id', ('team', 'id'), 'Int32'),
+    ('team.name', ('team', 'name'), 'category'),
+    ('player.id', ('player', 'id'), 'Int64'),
+    ('player.name', ('player', 'name'), 'category'),
+    ('position.name', ('position', 'name'), 'category'),
+    ('location.x', ('location', 0), 'float64'),
+    ('location.y', ('location', 1), 'float64'),
+    ('under_pressure', ('under_pressure',), 'bool'),
+    ('duration', ('duration',), 'float64'),
+    ('pass.end_location.x', ('pass', 'end_location', 0), 'float64'),
+    ('pass.end_location.y', ('pass', 'end_location', 1), 'float64'),
+    ('pass.length', ('pass', 'length'), 'float64'),
+    ('pass.height.name', ('pass', 'height', 'name'), 'category'),
+    ('pass.type.name', ('pass', 'type', 'name'), 'category'),
+    ('pass.outcome.name', ('pass', 'outcome', 'name'), 'category'),
+    ('pass.recipient.id', ('pass', 'recipient', 'id'), 'Int64'),
+    ('carry.end_location.x', ('carry', 'end_location', 0), 'float64'),
+    ('carry.end_location.y', ('carry', 'end_location', 1), 'float64'),
+    ('shot.outcome.name', ('shot', 'outcome', 'name'), 'category'),
+    ('shot.statsbomb_xg', ('shot', 'statsbomb_xg'), 'float64'),
+]
+
+# Store-only column holding the source JSON of every event, so that events
+# can be handed out exactly as StatsBomb publishes them
+SOURCE_COLUMN = 'source_json'
+
+# Arrow types of the stored columns by pandas dtype. The schema is given
+# explicitly so that columns which are empty in a match keep their type.
+_ARROW_TYPES = {
+    'string': 'string',
+    'Int8': 'int8',
+    'Int16': 'int16',
+    'Int32': 'int32',
+    'Int64': 'int64',
+    'float64': 'float64',
+    'bool': 'bool_',
+}
+
+
+def _lookup(event, path):
+    """
+    Follow a key/index path into a nested event dictionary.
+    
+    Returns None as soon as a step along the path is missing.
+    """
+    value = event
+    for step in path:
+        try:
+            value = value[step]
+        except (KeyError, IndexError, TypeError):
+            return None
+    return value
+
+
+def events_to_frame(events):
+    """
+    Flatten a list of StatsBomb event dictionaries into a typed DataFrame.
+    
+    Parameters:
+    -----------
+    events : list
+        List of event dictionaries
+        
+    Returns:
+    --------
+    pd.DataFrame
+        One row per event with the columns listed in EVENT_COLUMNS
+    """
+    columns = {}
+    for name, path, dtype in EVENT_COLUMNS:
+        values = [_lookup(event, path) for event in events]
+        if dtype == 'bool':
+            columns[name] = pd.Series([bool(v) for v in values], dtype='bool')
+        elif dtype == 'float64':
+            columns[name] = pd.Series(
+                [np.nan if v is None else v for v in values], dtype='float64'
+            )
+        else:
+            columns[name] = pd.Series(values, dtype=dtype)
+    return pd.DataFrame(columns)
+
+
+# Loader used by the worker processes of a parallel ingestion pool
+_worker_loader = None
+
+
+def _init_match_worker(loader):
+    global _worker_loader
+    _worker_loader = loader
+
+
+def _collect_match_worker(match):
+    return _worker_loader._collect_match_data(match)
+
+
 class StatsBombDataLoader:
     """
     Utility class for loading and processing StatsBomb open data for xT-GK analysis.
     """
     
-    def __init__(self, data_dir='/home/ubuntu/statsbomb_open_data/data'):
+    def __init__(self, data_dir='/home/ubuntu/statsbomb_open_data/data', store_dir=None):
         """
         Initialize the data loader with the path to the StatsBomb data directory.
         
@@ -16,8 +137,13 @@ class StatsBombDataLoader:
         -----------
         data_dir : str
             Path to the StatsBomb data directory
+        store_dir : str, optional
+            Directory for the columnar (Parquet) event store. Defaults to
+            ``<data_dir>/columnar``. The store is only used when pyarrow is
+            installed.
         """
         self.data_dir = data_dir
+        self.store_dir = store_dir or os.path.join(data_dir, 'columnar')
         self.competitions = self._load_competitions()
         
     def _load_competitions(self):
@@ -81,6 +207,9 @@ class StatsBombDataLoader:
         """
         Get events for a specific match.
         
+        The events are read from the columnar store while it is up to date
+        with the match's events JSON, and the store is built on a miss.
+        
         Parameters:
         -----------
         match_id : int
@@ -91,7 +220,141 @@ class StatsBombDataLoader:
         list
             List of event dictionaries
         """
-        events_file = os.path.join(self.data_dir, 'events', str(match_id) + '.json')
+        stored = self._read_event_store(match_id, [SOURCE_COLUMN])
+        if stored is not None:
+            # One parse of the joined source JSON instead of one per event
+            return json.loads('[' + ','.join(stored[SOURCE_COLUMN]) + ']')
+        
+        events = self._load_events_json(match_id)
+        if events:
+            self._write_event_store(match_id, self._store_frame(events))
+        
+        return events
+    
+    def get_match_events_frame(self, match_id):
+        """
+        Get events for a specific match as a typed, flat DataFrame.
+        
+        The frame is read from the columnar store, which is (re)built from the
+        match's events JSON whenever the source file's size or mtime changes.
+        
+        Parameters:
+        -----------
+        match_id : int
+            Match ID
+            
+        Returns:
+        --------
+        pd.DataFrame
+            One row per event with the columns listed in EVENT_COLUMNS
+        """
+        columns = [name for name, _, _ in EVENT_COLUMNS]
+        return self._match_events_store_frame(match_id, columns)
+    
+    def _match_events_store_frame(self, match_id, columns=None):
+        """
+        Read the stored event frame of a match, building it on a miss.
+        
+        Returns the EVENT_COLUMNS and SOURCE_COLUMN, or only ``columns``.
+        """
+        frame = self._read_event_store(match_id, columns)
+        if frame is not None:
+            return frame
+        
+        frame = self._store_frame(self._load_events_json(match_id))
+        if not frame.empty:
+            self._write_event_store(match_id, frame)
+        
+        return frame if columns is None else frame[columns]
+    
+    def _store_frame(self, events):
+        """
+        Flatten events into the stored layout: EVENT_COLUMNS plus the source
+        JSON of every event in SOURCE_COLUMN.
+        """
+        frame = events_to_frame(events)
+        frame[SOURCE_COLUMN] = pd.Series([json.dumps(event) for event in events], dtype='string')
+        return frame
+    
+    def convert_match_events(self, match_id):
+        """
+        Convert a match's events JSON into the columnar store.
+        
+        Parameters:
+        -----------
+        match_id : int
+            Match ID
+            
+        Returns:
+        --------
+        bool
+            True if the store holds an up-to-date copy of the match afterwards
+        """
+        if self._store_is_fresh(match_id):
+            return True
+        
+        events = self._load_events_json(match_id)
+        if not events:
+            return False
+        
+        return self._write_event_store(match_id, self._store_frame(events))
+    
+    def build_event_store(self, competition_id, season_id):
+        """
+        Convert every match of a competition season into the columnar store.
+        
+        Parameters:
+        -----------
+        competition_id : int
+            Competition ID
+        season_id : int
+            Season ID
+            
+        Returns:
+        --------
+        int
+            Number of matches available in the store
+        """
+        matches = self.get_matches(competition_id, season_id)
+        return sum(
+            1 for match in matches
+            if self.convert_match_events(match.get('match_id'))
+        )
+    
+    def get_events_fingerprint(self, match_ids):
+        """
+        Get a hash identifying the current events files of a set of matches.
+        
+        The hash covers each match's ID and the size and mtime of its events
+        JSON, so it changes whenever any of the input files is replaced.
+        
+        Parameters:
+        -----------
+        match_ids : list
+            List of match IDs
+            
+        Returns:
+        --------
+        str
+            Hex digest of the events files
+        """
+        digest = hashlib.sha256()
+        for match_id in sorted(match_ids):
+            try:
+                stat = os.stat(self._events_file(match_id))
+            except OSError:
+                continue
+            digest.update(f"{match_id}:{stat.st_size}:{stat.st_mtime_ns};".encode())
+        return digest.hexdigest()
+    
+    def _events_file(self, match_id):
+        return os.path.join(self.data_dir, 'events', str(match_id) + '.json')
+    
+    def _event_store_file(self, match_id):
+        return os.path.join(self.store_dir, 'events', str(match_id) + '.parquet')
+    
+    def _load_events_json(self, match_id):
+        events_file = self._events_file(match_id)
         
         if not os.path.exists(events_file):
             return []
@@ -101,6 +364,76 @@ class StatsBombDataLoader:
         
         return events
     
+    def _source_key(self, match_id):
+        """
+        Key identifying the current version of a match's events JSON.
+        """
+        try:
+            stat = os.stat(self._events_file(match_id))
+        except OSError:
+            return None
+        return {
+            b'xtgk.store_version': str(EVENT_STORE_VERSION).encode(),
+            b'xtgk.source_size': str(stat.st_size).encode(),
+            b'xtgk.source_mtime_ns': str(stat.st_mtime_ns).encode(),
+        }
+    
+    def _store_is_fresh(self, match_id):
+        if pq is None:
+            return False
+        
+        store_file = self._event_store_file(match_id)
+        source_key = self._source_key(match_id)
+        if source_key is None or not os.path.exists(store_file):
+            return False
+        
+        try:
+            metadata = pq.read_schema(store_file).metadata or {}
+        except (OSError, pa.ArrowException):
+            return False
+        
+        return all(metadata.get(key) == value for key, value in source_key.items())
+    
+    def _read_event_store(self, match_id, columns=None):
+        if not self._store_is_fresh(match_id):
+            return None
+        
+        try:
+            return pd.read_parquet(self._event_store_file(match_id), columns=columns)
+        except (OSError, pa.ArrowException):
+            return None
+    
+    def _write_event_store(self, match_id, frame):
+        if pa is None:
+            return False
+        
+        source_key = self._source_key(match_id)
+        if source_key is None:
+            return False
+        
+        schema = pa.schema(
+            [
+                (name, pa.dictionary(pa.int32(), pa.string()) if dtype == 'category'
+                 else getattr(pa, _ARROW_TYPES[dtype])())
+                for name, _, dtype in EVENT_COLUMNS
+            ]
+            + [(SOURCE_COLUMN, pa.string())]
+        )
+        table = pa.Table.from_pandas(frame, schema=schema, preserve_index=False)
+        table = table.replace_schema_metadata({**(table.schema.metadata or {}), **source_key})
+        
+        store_file = self._event_store_file(match_id)
+        tmp_file = store_file + '.tmp'
+        try:
+            os.makedirs(os.path.dirname(store_file), exist_ok=True)
+            pq.write_table(table, tmp_file)
+            os.replace(tmp_file, store_file)
+        except OSError:
+            # A read-only data directory simply means no store
+            return False
+        
+        return True
+    
     def get_match_lineups(self, match_id):
         """
         Get lineups for a specific match.
@@ -142,11 +475,7 @@ class StatsBombDataLoader:
             List of goalkeeper event dictionaries
         """
         # Extract goalkeeper player IDs from lineups
-        goalkeeper_ids = []
-        for team_lineup in lineups:
-            for player in team_lineup.get('lineup', []):
-                if player.get('position', {}).get('name') == 'Goalkeeper':
-                    goalkeeper_ids.append(player.get('player_id'))
+        goalkeeper_ids = self._goalkeeper_ids(lineups)
         
         # Filter events for goalkeeper actions
         goalkeeper_events = [
@@ -156,6 +485,17 @@ class StatsBombDataLoader:
         
         return goalkeeper_events
     
+    def _goalkeeper_ids(self, lineups):
+        """
+        Get the set of goalkeeper player IDs listed in a match's lineups.
+        """
+        return {
+            player.get('player_id')
+            for team_lineup in lineups
+            for player in team_lineup.get('lineup', [])
+            if player.get('position', {}).get('name') == 'Goalkeeper'
+        }
+    
     def get_goalkeeper_pass_events(self, events, lineups):
         """
         Filter events to include only goalkeeper pass actions.
@@ -182,7 +522,142 @@ class StatsBombDataLoader:
         
         return goalkeeper_pass_events
     
-    def get_goalkeeper_distribution_data(self, competition_id=11, season_id=90, num_matches=5):
+    def _goalkeeper_pass_events_from_frame(self, events, lineups):
+        """
+        Select goalkeeper passes from a stored event frame as the source
+        StatsBomb event dictionaries.
+        
+        Only the source JSON of the selected rows is parsed, so the rest of
+        the match never leaves the columnar representation.
+        """
+        goalkeeper_ids = self._goalkeeper_ids(lineups)
+        
+        is_goalkeeper_pass = (
+            events['player.id'].isin(list(goalkeeper_ids)).fillna(False)
+            & (events['type.name'] == 'Pass').fillna(False)
+        )
+        
+        sources = events.loc[is_goalkeeper_pass.to_numpy(dtype=bool), SOURCE_COLUMN]
+        return [json.loads(source) for source in sources]
+    
+    def _collect_match_data(self, match):
+        """
+        Collect goalkeeper distribution data for a single match.
+        
+        Parameters:
+        -----------
+        match : dict
+            Match dictionary
+            
+        Returns:
+        --------
+        tuple or None
+            (goalkeeper_data, pass_events, match_info) for the match, or None
+            if the match has no events or lineups
+        """
+        match_id = match.get('match_id')
+        
+        # Get events (from the columnar store) and lineups
+        events = self._match_events_store_frame(match_id)
+        lineups = self.get_match_lineups(match_id)
+        
+        if events.empty or not lineups:
+            return None
+        
+        # Get goalkeeper pass events
+        goalkeeper_pass_events = self._goalkeeper_pass_events_from_frame(events, lineups)
+        
+        # Bucket every goalkeeper pass by player ID and build all of the
+        # per-goalkeeper counters in a single traversal of the match
+        buckets = {}
+        for event in goalkeeper_pass_events:
+            player_id = event.get('player', {}).get('id')
+            bucket = buckets.get(player_id)
+            if bucket is None:
+                bucket = buckets[player_id] = {
+                    'passes': [],
+                    'successful': 0,
+                    'short': 0,
+                    'long': 0,
+                    'under_pressure': 0
+                }
+            
+            pass_data = event.get('pass', {})
+            length = pass_data.get('length')
+            
+            bucket['passes'].append(event)
+            if not pass_data.get('outcome'):
+                bucket['successful'] += 1
+            if length:
+                if length < 30:
+                    bucket['short'] += 1
+                else:
+                    bucket['long'] += 1
+            if event.get('under_pressure'):
+                bucket['under_pressure'] += 1
+        
+        empty_bucket = {'passes': [], 'successful': 0, 'short': 0, 'long': 0, 'under_pressure': 0}
+        
+        match_goalkeeper_data = []
+        match_pass_events = []
+        
+        # Process each goalkeeper's data
+        for team_lineup in lineups:
+            team_id = team_lineup.get('team_id')
+            team_name = team_lineup.get('team_name')
+            
+            for player in team_lineup.get('lineup', []):
+                if player.get('position', {}).get('name') == 'Goalkeeper':
+                    player_id = player.get('player_id')
+                    bucket = buckets.get(player_id, empty_bucket)
+                    
+                    total_passes = len(bucket['passes'])
+                    
+                    if total_passes > 0:
+                        success_rate = bucket['successful'] / total_passes
+                        short_pass_pct = bucket['short'] / total_passes
+                        long_pass_pct = bucket['long'] / total_passes
+                        pressure_pct = bucket['under_pressure'] / total_passes
+                    else:
+                        success_rate = 0
+                        short_pass_pct = 0
+                        long_pass_pct = 0
+                        pressure_pct = 0
+                    
+                    # Store goalkeeper data
+                    goalkeeper_data = {
+                        'match_id': match_id,
+                        'player_id': player_id,
+                        'player_name': player.get('player_name'),
+                        'team_id': team_id,
+                        'team_name': team_name,
+                        'total_passes': total_passes,
+                        'successful_passes': bucket['successful'],
+                        'success_rate': success_rate,
+                        'short_passes': bucket['short'],
+                        'long_passes': bucket['long'],
+                        'short_pass_pct': short_pass_pct,
+                        'long_pass_pct': long_pass_pct,
+                        'under_pressure': bucket['under_pressure'],
+                        'pressure_pct': pressure_pct
+                    }
+                    
+                    match_goalkeeper_data.append(goalkeeper_data)
+                    match_pass_events.extend(bucket['passes'])
+        
+        # Store match info
+        match_info = {
+            'match_id': match_id,
+            'home_team': match.get('home_team', {}).get('home_team_name'),
+            'away_team': match.get('away_team', {}).get('away_team_name'),
+            'competition': match.get('competition', {}).get('competition_name'),
+            'season': match.get('season', {}).get('season_name')
+        }
+        
+        return match_goalkeeper_data, match_pass_events, match_info
+    
+    def get_goalkeeper_distribution_data(self, competition_id=11, season_id=90, num_matches=5,
+                                         workers=1):
         """
         Get goalkeeper distribution data for analysis.
         
@@ -194,11 +669,18 @@ class StatsBombDataLoader:
             Season ID (default: 90 for a specific season)
         num_matches : int
             Number of matches to include (default: 5)
+        workers : int, optional
+            Number of worker processes used to ingest matches (default: 1,
+            i.e. serial). Pass None to use one process per CPU core.
             
         Returns:
         --------
         dict
-            Dictionary containing goalkeeper distribution data
+            Dictionary with 'goalkeeper_data' (per goalkeeper and match
+            counters), 'pass_events' and 'match_info'. 'pass_events' holds
+            every goalkeeper pass as the source StatsBomb event dictionary,
+            with all of its fields, whether the match was read from the
+            JSON or from the columnar store.
         """
         matches = self.get_matches(competition_id, season_id)
         
@@ -216,98 +698,28 @@ class StatsBombDataLoader:
         all_pass_events = []
         match_info = []
         
-        for match in matches:
-            match_id = match.get('match_id')
-            
-            # Get events and lineups
-            events = self.get_match_events(match_id)
-            lineups = self.get_match_lineups(match_id)
-            
-            if not events or not lineups:
+        if workers == 1 or len(matches) < 2:
+            results = [self._collect_match_data(match) for match in matches]
+        else:
+            # Results come back in match order, so the merge below is the
+            # same as in the serial path regardless of worker scheduling
+            max_workers = workers or os.cpu_count() or 1
+            chunksize = max(1, len(matches) // (max_workers * 4))
+            with ProcessPoolExecutor(
+                max_workers=max_workers,
+                initializer=_init_match_worker,
+                initargs=(self,)
+            ) as executor:
+                results = list(executor.map(_collect_match_worker, matches, chunksize=chunksize))
+        
+        for result in results:
+            if result is None:
                 continue
             
-            # Get goalkeeper pass events
-            goalkeeper_pass_events = self.get_goalkeeper_pass_events(events, lineups)
-            
-            # Process each goalkeeper's data
-            for team_lineup in lineups:
-                team_id = team_lineup.get('team_id')
-                team_name = team_lineup.get('team_name')
-                
-                for player in team_lineup.get('lineup', []):
-                    if player.get('position', {}).get('name') == 'Goalkeeper':
-                        player_id = player.get('player_id')
-                        player_name = player.get('player_name')
-                        
-                        # Filter pass events for this goalkeeper
-                        gk_passes = [
-                            event for event in goalkeeper_pass_events 
-                            if event.get('player', {}).get('id') == player_id
-                        ]
-                        
-                        # Calculate basic stats
-                        total_passes = len(gk_passes)
-                        successful_passes = len([
-                            p for p in gk_passes 
-                            if not p.get('pass', {}).get('outcome')
-                        ])
-                        
-                        if total_passes > 0:
-                            success_rate = successful_passes / total_passes
-                        else:
-                            success_rate = 0
-                        
-                        # Categorize passes
-                        short_passes = [
-                            p for p in gk_passes 
-                            if p.get('pass', {}).get('length') and p.get('pass', {}).get('length') < 30
-                        ]
-                        
-                        long_passes = [
-                            p for p in gk_passes 
-                            if p.get('pass', {}).get('length') and p.get('pass', {}).get('length') >= 30
-                        ]
-                        
-                        short_pass_pct = len(short_passes) / total_passes if total_passes > 0 else 0
-                        long_pass_pct = len(long_passes) / total_passes if total_passes > 0 else 0
-                        
-                        # Calculate pressure stats
-                        under_pressure = [
-                            p for p in gk_passes 
-                            if p.get('under_pressure')
-                        ]
-                        
-                        pressure_pct = len(under_pressure) / total_passes if total_passes > 0 else 0
-                        
-                        # Store goalkeeper data
-                        goalkeeper_data = {
-                            'match_id': match_id,
-                            'player_id': player_id,
-                            'player_name': player_name,
-                            'team_id': team_id,
-                            'team_name': team_name,
-                            'total_passes': total_passes,
-                            'successful_passes': successful_passes,
-                            'success_rate': success_rate,
-                            'short_passes': len(short_passes),
-                            'long_passes': len(long_passes),
-                            'short_pass_pct': short_pass_pct,
-                            'long_pass_pct': long_pass_pct,
-                            'under_pressure': len(under_pressure),
-                            'pressure_pct': pressure_pct
-                        }
-                        
-                        all_goalkeeper_data.append(goalkeeper_data)
-                        all_pass_events.extend(gk_passes)
-            
-            # Store match info
-            match_info.append({
-                'match_id': match_id,
-                'home_team': match.get('home_team', {}).get('home_team_name'),
-                'away_team': match.get('away_team', {}).get('away_team_name'),
-                'competition': match.get('competition', {}).get('competition_name'),
-                'season': match.get('season', {}).get('season_name')
-            })
+            goalkeeper_data, pass_events, info = result
+            all_goalkeeper_data.extend(goalkeeper_data)
+            all_pass_events.extend(pass_events)
+            match_info.append(info)
         
         return {
             'goalkeeper_data': all_goalkeeper_data,
@@ -0,0 +1,473 @@
+import functools
+import threading
+
+import numpy as np
+import pandas as pd
+
+from utils.data_loader import StatsBombDataLoader
+
+# Default dataset shown by the app (La Liga, first matches of the season)
+DEFAULT_COMPETITION_ID = 11
+DEFAULT_SEASON_ID = 90
+DEFAULT_NUM_MATCHES = 3
+
+# StatsBomb event coordinates (yards)
+STATSBOMB_PITCH = (120, 80)
+
+# Pitch dimensions in meters, as drawn by create_pitch
+PITCH_LENGTH = 105
+PITCH_WIDTH = 68
+
+# StatsBomb play patterns making up each game phase of get_team_shape
+GAME_PHASES = {
+    'Goal Kick': ('From Goal Kick',),
+    'Open Play': ('Regular Play',),
+    'Counter': ('From Counter',),
+}
+TEAM_SHAPE_PLAYERS = 11
+
+
+@functools.lru_cache(maxsize=None)
+def get_data_loader():
+    """
+    Get the process-wide StatsBomb data loader.
+
+    Returns:
+    --------
+    StatsBombDataLoader
+        Shared data loader instance
+    """
+    return StatsBombDataLoader()
+
+
+@functools.lru_cache(maxsize=None)
+def get_analyzer():
+    """
+    Get the process-wide xT-GK analyzer, on the StatsBomb pitch, with the xT
+    grid fitted on the default season.
+
+    The grid is read from the shared model artifact (or fitted and written
+    once) on first use, see XtGkAnalyzer.use_fitted_base_values. Without
+    match data the handcrafted grid is used.
+
+    Returns:
+    --------
+    XtGkAnalyzer
+        Shared analyzer instance
+    """
+    from utils.xt_gk_analyzer import XtGkAnalyzer
+
+    analyzer = XtGkAnalyzer(pitch_dimensions=STATSBOMB_PITCH)
+    analyzer.use_fitted_base_values(get_data_loader(), DEFAULT_COMPETITION_ID, DEFAULT_SEASON_ID)
+    return analyzer
+
+
+@functools.lru_cache(maxsize=None)
+def warm_up_analyzer():
+    """
+    Resolve the xT grid of get_analyzer in a background thread.
+
+    Called at startup so that fitting the grid on the full season, when no
+    artifact exists yet, does not hold up the first request that needs it.
+    Started once until the next invalidate.
+
+    Returns:
+    --------
+    threading.Thread
+        Thread resolving the grid
+    """
+    analyzer = get_analyzer()
+    thread = threading.Thread(target=lambda: analyzer.base_values, name='xt-grid-warm-up', daemon=True)
+    thread.start()
+    return thread
+
+
+@functools.lru_cache(maxsize=32)
+def get_distribution_data(competition_id=DEFAULT_COMPETITION_ID, season_id=DEFAULT_SEASON_ID,
+                          num_matches=DEFAULT_NUM_MATCHES):
+    """
+    Get goalkeeper distribution data, cached per set of parameters.
+
+    The returned dictionary is shared between all pages and sessions of the
+    process and must be treated as read-only.
+
+    Parameters:
+    -----------
+    competition_id : int
+        Competition ID (default: 11 for La Liga)
+    season_id : int
+        Season ID
+    num_matches : int
+        Number of matches to include
+
+    Returns:
+    --------
+    dict
+        Dictionary containing goalkeeper distribution data
+    """
+    return get_data_loader().get_goalkeeper_distribution_data(
+        competition_id=competition_id,
+        season_id=season_id,
+        num_matches=num_matches
+    )
+
+
+def get_sample_data():
+    """
+    Get the default sample of goalkeeper distribution data shown by the app.
+
+    Returns:
+    --------
+    dict
+        Dictionary containing goalkeeper distribution data
+    """
+    return get_distribution_data(DEFAULT_COMPETITION_ID, DEFAULT_SEASON_ID, DEFAULT_NUM_MATCHES)
+
+
+@functools.lru_cache(maxsize=32)
+def _available_teams(competition_id, season_id, num_matches):
+    match_info = get_distribution_data(competition_id, season_id, num_matches)['match_info']
+
+    teams = {}
+    for match in match_info:
+        teams.setdefault(match['home_team'], None)
+        teams.setdefault(match['away_team'], None)
+    return tuple(teams)
+
+
+def get_available_teams(competition_id=DEFAULT_COMPETITION_ID, season_id=DEFAULT_SEASON_ID,
+                        num_matches=DEFAULT_NUM_MATCHES):
+    """
+    Get the teams appearing in the loaded matches, in order of appearance.
+
+    Parameters:
+    -----------
+    competition_id : int
+        Competition ID
+    season_id : int
+        Season ID
+    num_matches : int
+        Number of matches to include
+
+    Returns:
+    --------
+    list
+        List of team names
+    """
+    return list(_available_teams(competition_id, season_id, num_matches))
+
+
+@functools.lru_cache(maxsize=32)
+def _goalkeeper_rosters(competition_id, season_id, num_matches):
+    gk_data = get_distribution_data(competition_id, season_id, num_matches)['goalkeeper_data']
+
+    rosters = {}
+    for gk in gk_data:
+        rosters.setdefault(gk['team_name'], {}).setdefault(gk['player_name'], None)
+    return {team: tuple(players) for team, players in rosters.items()}
+
+
+def get_team_goalkeepers(team_names, competition_id=DEFAULT_COMPETITION_ID,
+                         season_id=DEFAULT_SEASON_ID, num_matches=DEFAULT_NUM_MATCHES):
+    """
+    Get the goalkeepers who played for one or more teams.
+
+    Parameters:
+    -----------
+    team_names : str or list
+        Team name, or list of team names
+    competition_id : int
+        Competition ID
+    season_id : int
+        Season ID
+    num_matches : int
+        Number of matches to include
+
+    Returns:
+    --------
+    list
+        List of unique goalkeeper names, in order of appearance
+    """
+    if isinstance(team_names, str):
+        team_names = [team_names]
+
+    rosters = _goalkeeper_rosters(competition_id, season_id, num_matches)
+
+    goalkeepers = {}
+    for team_name in team_names:
+        for player_name in rosters.get(team_name, ()):
+            goalkeepers.setdefault(player_name, None)
+    return list(goalkeepers)
+
+
+@functools.lru_cache(maxsize=64)
+def _pressing_surface(team_name, competition_id, season_id):
+    data_loader = get_data_loader()
+
+    locations = []
+    for match in data_loader.get_matches(competition_id, season_id):
+        teams = (match.get('home_team', {}).get('home_team_name'),
+                 match.get('away_team', {}).get('away_team_name'))
+        if team_name not in teams:
+            continue
+
+        events = data_loader.get_match_events_frame(match['match_id'])
+        if events.empty:
+            continue
+
+        pressures = events[(events['type.name'] == 'Pressure') & (events['team.name'] == team_name)]
+        locations.append(pressures[['location.x', 'location.y']].dropna().to_numpy(dtype=float))
+
+    if not locations or not sum(len(xy) for xy in locations):
+        return None
+
+    xy = np.concatenate(locations)
+
+    # StatsBomb records each team's events attacking left to right; turn the
+    # pressing team around so that it presses towards our goal on the left
+    x = (STATSBOMB_PITCH[0] - xy[:, 0]) * PITCH_LENGTH / STATSBOMB_PITCH[0]
+    y = (STATSBOMB_PITCH[1] - xy[:, 1]) * PITCH_WIDTH / STATSBOMB_PITCH[1]
+
+    # Plotting and analysis modules are imported where they are used, so that
+    # the data service itself only depends on the data loader
+    from utils.visualizations import pressing_surface
+
+    surface = pressing_surface(x, y)
+    surface.flags.writeable = False
+    return surface
+
+
+def get_pressing_surface(team_name, competition_id=DEFAULT_COMPETITION_ID, season_id=DEFAULT_SEASON_ID):
+    """
+    Get a team's pressing intensity surface over a season, from its Pressure
+    events, cached per team and season.
+
+    Parameters:
+    -----------
+    team_name : str
+        Name of the pressing team
+    competition_id : int
+        Competition ID
+    season_id : int
+        Season ID
+
+    Returns:
+    --------
+    np.ndarray or None
+        Read-only surface for create_opposition_heatmap, oriented so that the
+        team presses towards the goal on the left, or None if the team has
+        no Pressure events
+    """
+    return _pressing_surface(team_name, competition_id, season_id)
+
+
+@functools.lru_cache(maxsize=8)
+def _goalkeeper_pass_arrays(competition_id, season_id, num_matches):
+    pass_events = get_distribution_data(competition_id, season_id, num_matches)['pass_events']
+
+    start = np.full((len(pass_events), 2), np.nan)
+    end = np.full((len(pass_events), 2), np.nan)
+    for i, event in enumerate(pass_events):
+        location = event.get('location') or ()
+        end_location = event.get('pass', {}).get('end_location') or ()
+        start[i, :len(location[:2])] = location[:2]
+        end[i, :len(end_location[:2])] = end_location[:2]
+
+    scale = np.array([PITCH_LENGTH / STATSBOMB_PITCH[0], PITCH_WIDTH / STATSBOMB_PITCH[1]])
+    start *= scale
+    end *= scale
+
+    arrays = {
+        'player_name': np.array([event.get('player', {}).get('name') for event in pass_events], dtype=object),
+        'team_name': np.array([event.get('team', {}).get('name') for event in pass_events], dtype=object),
+        'x': start[:, 0],
+        'y': start[:, 1],
+        'end_x': end[:, 0],
+        'end_y': end[:, 1],
+        'completed': np.array([not event.get('pass', {}).get('outcome') for event in pass_events], dtype=bool)
+    }
+    for values in arrays.values():
+        values.flags.writeable = False
+    return arrays
+
+
+def get_goalkeeper_passes(goalkeeper=None, team_name=None, competition_id=DEFAULT_COMPETITION_ID,
+                          season_id=DEFAULT_SEASON_ID, num_matches=DEFAULT_NUM_MATCHES):
+    """
+    Get goalkeeper pass locations and outcomes as arrays for create_pass_map.
+
+    The pass events are converted to arrays once per set of matches and
+    cached; filtering by goalkeeper or team is a vectorized mask.
+
+    Parameters:
+    -----------
+    goalkeeper : str, optional
+        Goalkeeper name (default: all goalkeepers)
+    team_name : str, optional
+        Team name (default: all teams)
+    competition_id : int
+        Competition ID
+    season_id : int
+        Season ID
+    num_matches : int, optional
+        Number of matches to include (None for the whole season, which is
+        loaded serially on first use)
+
+    Returns:
+    --------
+    dict
+        Arrays 'x', 'y', 'end_x', 'end_y' in meters on the pitch drawn by
+        create_pitch, 'completed', 'player_name' and 'team_name'
+    """
+    arrays = _goalkeeper_pass_arrays(competition_id, season_id, num_matches)
+
+    mask = np.ones(len(arrays['x']), dtype=bool)
+    if goalkeeper is not None:
+        mask &= arrays['player_name'] == goalkeeper
+    if team_name is not None:
+        mask &= arrays['team_name'] == team_name
+
+    return {key: values[mask] for key, values in arrays.items()}
+
+
+@functools.lru_cache(maxsize=64)
+def _team_shape(team_name, competition_id, season_id, num_matches, phase):
+    data_loader = get_data_loader()
+    match_info = get_distribution_data(competition_id, season_id, num_matches)['match_info']
+
+    columns = ['type.name', 'player.id', 'player.name', 'position.name', 'location.x', 'location.y',
+               'pass.recipient.id']
+    frames = []
+    for match in match_info:
+        if team_name not in (match['home_team'], match['away_team']):
+            continue
+
+        events = data_loader.get_match_events_frame(match['match_id'])
+        if events.empty:
+            continue
+
+        selected = events['team.name'] == team_name
+        if phase is not None:
+            selected &= events['play_pattern.name'].isin(GAME_PHASES[phase])
+        frames.append(events.loc[selected, columns])
+
+    if not frames:
+        return None
+
+    events = pd.concat(frames, ignore_index=True)
+    located = events.dropna(subset=['player.id', 'location.x', 'location.y'])
+    if located.empty:
+        return None
+
+    # Average location and most common position of every player
+    players = located.groupby('player.id').agg(
+        player_name=('player.name', 'first'),
+        x=('location.x', 'mean'),
+        y=('location.y', 'mean'),
+        events=('location.x', 'size')
+    )
+    positions = located.groupby(['player.id', 'position.name']).size().sort_values().reset_index()
+    players['position'] = positions.drop_duplicates('player.id', keep='last').set_index('player.id')['position.name']
+    players['x'] *= PITCH_LENGTH / STATSBOMB_PITCH[0]
+    players['y'] *= PITCH_WIDTH / STATSBOMB_PITCH[1]
+
+    # Passes from the goalkeepers to each player
+    gk_passes = events[(events['type.name'] == 'Pass') & (events['position.name'] == 'Goalkeeper')]
+    players['gk_passes'] = gk_passes.groupby('pass.recipient.id').size().reindex(players.index, fill_value=0)
+
+    # The most involved goalkeeper and outfield players make up the shape
+    is_goalkeeper = players['position'] == 'Goalkeeper'
+    goalkeeper = players[is_goalkeeper].nlargest(1, 'events')
+    outfield = players[~is_goalkeeper].nlargest(TEAM_SHAPE_PLAYERS - len(goalkeeper), 'events')
+
+    shape = pd.concat([goalkeeper, outfield]).reset_index()
+    shape['is_goalkeeper'] = shape.index < len(goalkeeper)
+    return shape
+
+
+def get_team_shape(team_name, phase=None, competition_id=DEFAULT_COMPETITION_ID, season_id=DEFAULT_SEASON_ID,
+                   num_matches=DEFAULT_NUM_MATCHES):
+    """
+    Get a team's average player positions and goalkeeper pass volumes over the
+    selected matches, cached per team, season and game phase.
+
+    Parameters:
+    -----------
+    team_name : str
+        Team name
+    phase : str, optional
+        Game phase, one of GAME_PHASES (default: None for all events)
+    competition_id : int
+        Competition ID
+    season_id : int
+        Season ID
+    num_matches : int
+        Number of matches to include
+
+    Returns:
+    --------
+    pd.DataFrame or None
+        One row per player, goalkeeper first, with 'player.id',
+        'player_name', 'position', 'x', 'y' (meters on the pitch drawn by
+        create_pitch), 'events', 'gk_passes' and 'is_goalkeeper', or None if
+        the team has no events
+    """
+    shape = _team_shape(team_name, competition_id, season_id, num_matches, phase)
+    return None if shape is None else shape.copy()
+
+
+@functools.lru_cache(maxsize=8)
+def _similarity_index(leagues, num_matches):
+    from utils.gk_similarity import GoalkeeperSimilarityIndex, goalkeeper_features
+
+    frames = []
+    for competition_id, season_id in leagues:
+        data = get_distribution_data(competition_id, season_id, num_matches)
+        features = goalkeeper_features(data['pass_events'], analyzer=get_analyzer())
+        if data['match_info']:
+            info = data['match_info'][0]
+            features['league'] = f"{info['competition']} {info['season']}"
+        else:
+            features['league'] = None
+        frames.append(features)
+
+    return GoalkeeperSimilarityIndex(pd.concat(frames, ignore_index=True))
+
+
+def get_similarity_index(leagues=((DEFAULT_COMPETITION_ID, DEFAULT_SEASON_ID),), num_matches=DEFAULT_NUM_MATCHES):
+    """
+    Get the goalkeeper similarity index over one or more leagues, cached per
+    set of leagues.
+
+    The index is shared between all pages and sessions of the process and
+    must be treated as read-only.
+
+    Parameters:
+    -----------
+    leagues : sequence
+        (competition_id, season_id) pairs to index
+    num_matches : int
+        Number of matches to include per league (None for whole seasons)
+
+    Returns:
+    --------
+    GoalkeeperSimilarityIndex
+        Index over the goalkeepers of all leagues, with a 'league' column
+    """
+    return _similarity_index(tuple(sorted(set(map(tuple, leagues)))), num_matches)
+
+
+def invalidate():
+    """
+    Drop every cached dataset so that the next access reloads from disk.
+    """
+    _similarity_index.cache_clear()
+    _team_shape.cache_clear()
+    _goalkeeper_pass_arrays.cache_clear()
+    _pressing_surface.cache_clear()
+    _goalkeeper_rosters.cache_clear()
+    _available_teams.cache_clear()
+    get_distribution_data.cache_clear()
+    warm_up_analyzer.cache_clear()
+    get_analyzer.cache_clear()
+    get_data_loader.cache_clear()
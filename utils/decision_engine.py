@@ -0,0 +1,253 @@
+import functools
+
+import numpy as np
+
+# Pitch dimensions in meters, as drawn by create_pitch
+PITCH_LENGTH = 105
+PITCH_WIDTH = 68
+
+# Spacing of the evaluated targets in meters
+DECISION_RESOLUTION = 1.0
+
+# Targets closer than this to the goalkeeper are not passing options
+MIN_PASS_DISTANCE = 8.0
+
+# Pass completion falls off with distance: 50% at COMPLETION_MIDPOINT meters
+COMPLETION_MIDPOINT = 50.0
+COMPLETION_SCALE = 12.0
+
+# Chance that an opponent on the passing lane intercepts at full pressure,
+# and the distance from the lane at which that chance falls by a factor e
+INTERCEPT_MAX = 0.6
+INTERCEPT_RANGE = 6.0
+
+# Passes longer than this (meters) are lofted over the press and can only be
+# contested where they land
+LOFTED_DISTANCE = 30.0
+
+# Value credited to any completed pass for keeping the build-up going
+BUILD_UP_VALUE = 0.03
+
+# Progression factors for forward and backward passes, as in xT-GK
+FORWARD_FACTOR = 1.5
+BACKWARD_FACTOR = 0.8
+
+# Distance classes (meters): short below the first edge, long above the second
+DISTANCE_EDGES = (30.0, 50.0)
+
+# Preference multipliers for (short, medium, long) passes
+TACTICAL_BIAS = {
+    'Possession-Based': (1.2, 1.0, 1.0),
+    'Direct Play': (1.0, 1.0, 1.2),
+    'Counter-Attacking': (1.0, 1.15, 1.15),
+    'Mixed Approach': (1.0, 1.0, 1.0),
+}
+SCORE_BIAS = {
+    'Winning': (1.1, 1.0, 1.0),
+    'Drawing': (1.0, 1.0, 1.0),
+    'Losing': (1.0, 1.0, 1.1),
+}
+GAME_STATE_BIAS = {
+    'Build-up from Goal Kick': (1.0, 1.0, 1.0),
+    'Build-up from Open Play': (1.0, 1.0, 1.0),
+    'Counter-Attack Opportunity': (0.9, 1.1, 1.2),
+    'Defensive Reset': (1.2, 1.0, 0.8),
+}
+
+# Weight of the threat conceded by losing the ball at the target
+TURNOVER_WEIGHT = {
+    'Winning': 1.3,
+    'Drawing': 1.0,
+    'Losing': 0.8,
+}
+GAME_STATE_TURNOVER_WEIGHT = {
+    'Build-up from Goal Kick': 1.0,
+    'Build-up from Open Play': 1.0,
+    'Counter-Attack Opportunity': 0.7,
+    'Defensive Reset': 1.5,
+}
+
+
+def _analyzer():
+    """
+    Analyzer providing the fitted xT grid, interpolated between zone centres.
+
+    Read through data_service.get_analyzer on every call, so that a grid
+    reloaded after data_service.invalidate replaces the cached one.
+    """
+    from utils.data_service import get_analyzer
+
+    return _meter_analyzer(get_analyzer())
+
+
+@functools.lru_cache(maxsize=2)
+def _meter_analyzer(source):
+    """Analyzer on the pitch in meters sharing the xT grid of source."""
+    from utils.xt_gk_analyzer import XtGkAnalyzer
+
+    # Zones are fractions of the pitch, so the grid fitted on StatsBomb
+    # coordinates applies unchanged to locations in meters
+    analyzer = XtGkAnalyzer(pitch_dimensions=(PITCH_LENGTH, PITCH_WIDTH), interpolate=True)
+    analyzer.base_values = source.base_values
+    return analyzer
+
+
+@functools.lru_cache(maxsize=4)
+def _target_grid(analyzer, resolution):
+    """
+    Target locations at cell centres and the xT of each target for both teams.
+
+    Returns read-only (x, y, our_value, their_value) where our_value is the
+    threat we hold with the ball at the target and their_value the threat the
+    opponent holds if they win it there.
+    """
+    x = np.arange(resolution / 2, PITCH_LENGTH, resolution)
+    y = np.arange(resolution / 2, PITCH_WIDTH, resolution)
+
+    our_value = analyzer.zone_values(x[None, :], y[:, None])
+    their_value = analyzer.zone_values(PITCH_LENGTH - x[None, :], PITCH_WIDTH - y[:, None])
+
+    for values in (x, y, our_value, their_value):
+        values.flags.writeable = False
+    return x, y, our_value, their_value
+
+
+def decision_surface(goalkeeper_position=(5, 34), pressure_level=5, game_state='Build-up from Goal Kick',
+                     score_state='Drawing', tactical_approach='Mixed Approach', opponent_positions=None,
+                     resolution=DECISION_RESOLUTION):
+    """
+    Evaluate the risk-adjusted value of passing to every location on the pitch.
+
+    For each target the expected value is the completion probability times
+    the xT gained (with the xT-GK progression factors and a build-up credit),
+    minus the chance of losing the ball times the threat the opponent would
+    hold there. The result is discounted by the xT-GK risk factor of the
+    goalkeeper's position and weighted by the preferences of the tactical
+    approach, score state and game state for short, medium and long passes.
+    Every target is evaluated in one set of array operations.
+
+    Parameters:
+    -----------
+    goalkeeper_position : tuple
+        (x, y) position of the goalkeeper in meters
+    pressure_level : int
+        Opposition pressure (1-10)
+    game_state : str
+        One of GAME_STATE_BIAS
+    score_state : str
+        One of SCORE_BIAS
+    tactical_approach : str
+        One of TACTICAL_BIAS
+    opponent_positions : sequence, optional
+        (x, y) positions of the pressing opponents in meters
+    resolution : float
+        Spacing of the evaluated targets in meters
+
+    Returns:
+    --------
+    dict
+        'x' (length,) and 'y' (width,) target coordinates, and 'value',
+        'success' and 'distance' arrays of shape (width, length). Targets
+        closer than MIN_PASS_DISTANCE have a value of NaN.
+    """
+    analyzer = _analyzer()
+    x, y, our_value, their_value = _target_grid(analyzer, resolution)
+    gk_x, gk_y = goalkeeper_position
+
+    dx = x[None, :] - gk_x
+    dy = y[:, None] - gk_y
+    distance = np.hypot(dx, dy)
+
+    # Completion: distance fall-off, the goalkeeper's execution under
+    # pressure, and the chance that each opponent cuts out the passing lane
+    success = 1.0 / (1.0 + np.exp((distance - COMPLETION_MIDPOINT) / COMPLETION_SCALE))
+    success *= 1.0 - 0.015 * pressure_level
+
+    if opponent_positions is not None and len(opponent_positions):
+        opponents = np.asarray(opponent_positions, dtype=float)
+        ox = opponents[:, 0, None, None] - gk_x
+        oy = opponents[:, 1, None, None] - gk_y
+
+        # Distance from each opponent to each passing lane, (opponents, width,
+        # length), or to the landing point of lofted passes
+        length_sq = np.maximum(distance ** 2, 1e-9)
+        along = np.clip((ox * dx + oy * dy) / length_sq, 0.0, 1.0)
+        along = np.where(distance > LOFTED_DISTANCE, 1.0, along)
+        contest_distance = np.hypot(ox - along * dx, oy - along * dy)
+
+        intercept = INTERCEPT_MAX * (pressure_level / 10) * np.exp(-contest_distance / INTERCEPT_RANGE)
+        success *= np.prod(1.0 - intercept, axis=0)
+
+    # Threat gained on completion, as in the xT-GK distribution value
+    gk_value = analyzer.zone_values(gk_x, gk_y)
+    progression = np.where(dx > 0, FORWARD_FACTOR, np.where(dx < 0, BACKWARD_FACTOR, 1.0))
+    gain = np.maximum(our_value - gk_value, 0.0) * progression + BUILD_UP_VALUE
+
+    turnover_weight = TURNOVER_WEIGHT.get(score_state, 1.0) * GAME_STATE_TURNOVER_WEIGHT.get(game_state, 1.0)
+    value = success * gain - (1.0 - success) * turnover_weight * their_value
+
+    # xT-GK risk factor of distributing from the goalkeeper's position
+    risk_factor = 1.0 + (1.0 - gk_x / PITCH_LENGTH) * 0.5
+    if pressure_level > 5:
+        risk_factor *= 1.2
+    value /= risk_factor
+
+    # Preferences for short, medium and long passes
+    bias = (np.array(TACTICAL_BIAS.get(tactical_approach, (1.0, 1.0, 1.0)))
+            * np.array(SCORE_BIAS.get(score_state, (1.0, 1.0, 1.0)))
+            * np.array(GAME_STATE_BIAS.get(game_state, (1.0, 1.0, 1.0))))
+    distance_class = np.digitize(distance, DISTANCE_EDGES)
+    value = np.where(value > 0, value * bias[distance_class], value / bias[distance_class])
+
+    value[distance < MIN_PASS_DISTANCE] = np.nan
+
+    return {
+        'x': x,
+        'y': y,
+        'value': value,
+        'success': success,
+        'distance': distance
+    }
+
+
+def top_targets(surface, n=5, min_separation=10.0):
+    """
+    Get the best targets of a decision surface.
+
+    Parameters:
+    -----------
+    surface : dict
+        Output of decision_surface
+    n : int
+        Number of targets
+    min_separation : float
+        Minimum distance between returned targets in meters, so that the
+        targets are distinct options rather than neighbouring cells
+
+    Returns:
+    --------
+    list
+        Up to n dictionaries with 'position' (x, y), 'value', 'success' and
+        'distance', best first
+    """
+    value = surface['value']
+    order = np.argsort(np.where(np.isnan(value), -np.inf, value), axis=None)[::-1]
+
+    rows, cols = np.unravel_index(order, value.shape)
+    candidate_x = surface['x'][cols]
+    candidate_y = surface['y'][rows]
+
+    targets = []
+    for row, col, tx, ty in zip(rows, cols, candidate_x, candidate_y):
+        if len(targets) == n or np.isnan(value[row, col]):
+            break
+        if any(np.hypot(tx - px, ty - py) < min_separation for px, py in (t['position'] for t in targets)):
+            continue
+        targets.append({
+            'position': (float(tx), float(ty)),
+            'value': float(value[row, col]),
+            'success': float(surface['success'][row, col]),
+            'distance': float(surface['distance'][row, col])
+        })
+
+    return targets
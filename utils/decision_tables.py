@@ -0,0 +1,263 @@
+import os
+import json
+import hashlib
+import tempfile
+import functools
+
+import numpy as np
+
+# Discrete match contexts covered by the tables, in table axis order
+PRESSURE_LEVELS = list(range(1, 11))
+GAME_STATES = ["Build-up from Goal Kick", "Build-up from Open Play", "Counter-Attack Opportunity", "Defensive Reset"]
+SCORE_STATES = ["Winning", "Drawing", "Losing"]
+TACTICAL_APPROACHES = ["Possession-Based", "Direct Play", "Counter-Attacking", "Mixed Approach"]
+FIELD_CONDITIONS = ["Dry", "Wet", "Windy"]
+
+DISTANCES = ["short", "medium", "long"]
+
+# Distribution options of the In-Game Decision page with their base xT
+DISTRIBUTION_OPTIONS = [
+    {"name": "Left Center Back", "position": (15, 25), "distance": "short", "pressure": "low", "xT_value": 0.65},
+    {"name": "Right Center Back", "position": (15, 43), "distance": "short", "pressure": "low", "xT_value": 0.68},
+    {"name": "Left Full Back", "position": (20, 15), "distance": "short", "pressure": "medium", "xT_value": 0.58},
+    {"name": "Right Full Back", "position": (20, 53), "distance": "short", "pressure": "medium", "xT_value": 0.56},
+    {"name": "Defensive Midfielder", "position": (30, 34), "distance": "medium", "pressure": "medium", "xT_value": 0.52},
+    {"name": "Left Midfielder", "position": (40, 20), "distance": "medium", "pressure": "high", "xT_value": 0.48},
+    {"name": "Right Midfielder", "position": (40, 48), "distance": "medium", "pressure": "high", "xT_value": 0.45},
+    {"name": "Left Winger", "position": (60, 15), "distance": "long", "pressure": "high", "xT_value": 0.35},
+    {"name": "Striker", "position": (60, 34), "distance": "long", "pressure": "high", "xT_value": 0.32},
+    {"name": "Right Winger", "position": (60, 53), "distance": "long", "pressure": "high", "xT_value": 0.30},
+]
+
+# Options available in each game state: full backs only join the build-up,
+# a counter keeps one centre back as the safe outlet and looks forward, and a
+# defensive reset keeps the ball in the first two lines
+GAME_STATE_OPTIONS = {
+    "Build-up from Goal Kick": ["Left Center Back", "Right Center Back", "Left Full Back", "Right Full Back",
+                                "Defensive Midfielder", "Left Midfielder", "Right Midfielder",
+                                "Left Winger", "Striker", "Right Winger"],
+    "Build-up from Open Play": ["Left Center Back", "Right Center Back", "Left Full Back", "Right Full Back",
+                                "Defensive Midfielder", "Left Midfielder", "Right Midfielder",
+                                "Left Winger", "Striker", "Right Winger"],
+    "Counter-Attack Opportunity": ["Left Center Back", "Left Midfielder", "Right Midfielder",
+                                   "Left Winger", "Striker", "Right Winger"],
+    "Defensive Reset": ["Left Center Back", "Right Center Back", "Defensive Midfielder"],
+}
+
+# Multipliers on the xT of (short, medium, long) options
+TACTICAL_FACTORS = {
+    "Possession-Based": (1.2, 1.0, 1.0),    # Boost short options for possession teams
+    "Direct Play": (1.0, 1.0, 1.2),         # Boost long options for direct play
+    "Counter-Attacking": (1.0, 1.15, 1.15),  # Boost medium/long for counter
+    "Mixed Approach": (1.0, 1.0, 1.0),
+}
+SCORE_FACTORS = {
+    "Winning": (1.1, 1.0, 1.0),  # Safer options when winning
+    "Drawing": (1.0, 1.0, 1.0),
+    "Losing": (1.0, 1.0, 1.1),   # Riskier options when losing
+}
+
+# Multipliers on the xT of (short, medium, long) options. No sourced factors
+# exist for wet or windy conditions yet, so they leave the ranking unchanged.
+FIELD_CONDITION_FACTORS = {
+    "Dry": (1.0, 1.0, 1.0),
+    "Wet": (1.0, 1.0, 1.0),
+    "Windy": (1.0, 1.0, 1.0),
+}
+
+DEFAULT_TABLES_PATH = os.path.join(tempfile.gettempdir(), 'xtgk_decision_tables.npz')
+
+
+def _pressure_factors():
+    """
+    xT multipliers of every option at every pressure level, (pressure, option).
+
+    Higher pressure reduces xT for every option; short passes are hit harder
+    above level 7 and long passes somewhat harder above level 5.
+    """
+    pressure = np.array(PRESSURE_LEVELS, dtype=float)[:, None]
+    distance = np.array([option["distance"] for option in DISTRIBUTION_OPTIONS])[None, :]
+
+    pressure_factor = 1.0 - (pressure / 20)
+    return np.where(
+        (distance == "short") & (pressure > 7), pressure_factor * 0.8,
+        np.where((distance == "long") & (pressure > 5), pressure_factor * 0.9, pressure_factor)
+    )
+
+
+def _distance_factors(factors, contexts):
+    """Expand per-distance multipliers to (context, option)."""
+    distance_index = [DISTANCES.index(option["distance"]) for option in DISTRIBUTION_OPTIONS]
+    return np.array([factors[context] for context in contexts])[:, distance_index]
+
+
+def tables_fingerprint():
+    """
+    Hash of every rule that goes into the tables, used to detect stale artifacts.
+
+    Returns:
+    --------
+    str
+        Hex digest of the options, contexts and factors
+    """
+    rules = {
+        'contexts': [PRESSURE_LEVELS, GAME_STATES, SCORE_STATES, TACTICAL_APPROACHES, FIELD_CONDITIONS],
+        'options': DISTRIBUTION_OPTIONS,
+        'game_state_options': GAME_STATE_OPTIONS,
+        'factors': [TACTICAL_FACTORS, SCORE_FACTORS, FIELD_CONDITION_FACTORS],
+    }
+    encoded = json.dumps(rules, sort_keys=True)
+    return hashlib.sha256(encoded.encode('utf-8')).hexdigest()
+
+
+def build_decision_tables():
+    """
+    Rank the distribution options for every combination of match context.
+
+    Each factor is an array over its own context axis and the options; the
+    broadcast product over all axes gives the adjusted xT of every option in
+    every context at once.
+
+    Returns:
+    --------
+    dict
+        'values' (float32) and 'ranking' (int8) arrays of shape (pressure,
+        game state, score state, tactical approach, field conditions,
+        option). 'values' holds the adjusted xT of each option, NaN where the
+        option is not available. 'ranking' lists option indices best first,
+        padded with -1.
+    """
+    names = [option["name"] for option in DISTRIBUTION_OPTIONS]
+    base = np.array([option["xT_value"] for option in DISTRIBUTION_OPTIONS])
+    available = np.array([[name in GAME_STATE_OPTIONS[state] for name in names] for state in GAME_STATES])
+
+    values = (
+        base
+        * _pressure_factors()[:, None, None, None, None, :]
+        * np.where(available, 1.0, np.nan)[None, :, None, None, None, :]
+        * _distance_factors(SCORE_FACTORS, SCORE_STATES)[None, None, :, None, None, :]
+        * _distance_factors(TACTICAL_FACTORS, TACTICAL_APPROACHES)[None, None, None, :, None, :]
+        * _distance_factors(FIELD_CONDITION_FACTORS, FIELD_CONDITIONS)[None, None, None, None, :, :]
+    )
+
+    # Stable sort keeps the option order for ties; unavailable options last
+    ranking = np.argsort(np.where(np.isnan(values), np.inf, -values), axis=-1, kind='stable')
+    ranking = np.where(np.take_along_axis(np.isnan(values), ranking, axis=-1), -1, ranking)
+
+    return {
+        'values': values.astype(np.float32),
+        'ranking': ranking.astype(np.int8)
+    }
+
+
+def save_decision_tables(tables, path=DEFAULT_TABLES_PATH):
+    """
+    Write decision tables to a compressed .npz artifact.
+
+    Parameters:
+    -----------
+    tables : dict
+        Output of build_decision_tables
+    path : str
+        Artifact path
+
+    Returns:
+    --------
+    bool
+        True if the artifact was written
+    """
+    tmp_path = f"{path}.{os.getpid()}.tmp.npz"
+    try:
+        os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+        np.savez_compressed(tmp_path, fingerprint=np.array(tables_fingerprint()), **tables)
+        os.replace(tmp_path, path)
+    except OSError:
+        # An unwritable location only means the tables are rebuilt next time
+        return False
+    return True
+
+
+@functools.lru_cache(maxsize=4)
+def load_decision_tables(path=DEFAULT_TABLES_PATH):
+    """
+    Load the decision tables, building and saving them if the artifact is
+    missing or was built from different rules.
+
+    Parameters:
+    -----------
+    path : str
+        Artifact path
+
+    Returns:
+    --------
+    dict
+        As returned by build_decision_tables, with read-only arrays
+    """
+    tables = None
+    try:
+        with np.load(path) as artifact:
+            if str(artifact['fingerprint']) == tables_fingerprint():
+                tables = {'values': artifact['values'], 'ranking': artifact['ranking']}
+    except (OSError, KeyError, ValueError):
+        pass
+
+    if tables is None:
+        tables = build_decision_tables()
+        save_decision_tables(tables, path)
+
+    for values in tables.values():
+        values.flags.writeable = False
+    return tables
+
+
+_CONTEXT_INDEX = [
+    {value: i for i, value in enumerate(values)}
+    for values in (PRESSURE_LEVELS, GAME_STATES, SCORE_STATES, TACTICAL_APPROACHES, FIELD_CONDITIONS)
+]
+
+
+def lookup_options(pressure_level, game_state, score_state, tactical_approach, field_conditions="Dry",
+                   path=DEFAULT_TABLES_PATH):
+    """
+    Get the ranked distribution options for a match context.
+
+    Parameters:
+    -----------
+    pressure_level : int
+        Opposition pressure (1-10)
+    game_state : str
+        One of GAME_STATES
+    score_state : str
+        One of SCORE_STATES
+    tactical_approach : str
+        One of TACTICAL_APPROACHES
+    field_conditions : str
+        One of FIELD_CONDITIONS
+    path : str
+        Artifact path
+
+    Returns:
+    --------
+    list
+        Available options, best first, as copies of DISTRIBUTION_OPTIONS
+        with 'xT_value' adjusted for the context
+    """
+    tables = load_decision_tables(path)
+
+    index = tuple(
+        lookup[value] for lookup, value in zip(
+            _CONTEXT_INDEX, (pressure_level, game_state, score_state, tactical_approach, field_conditions)
+        )
+    )
+    ranking = tables['ranking'][index]
+    values = tables['values'][index]
+
+    return [
+        dict(DISTRIBUTION_OPTIONS[option], xT_value=float(values[option]))
+        for option in ranking if option >= 0
+    ]
+
+
+if __name__ == '__main__':
+    saved = save_decision_tables(build_decision_tables())
+    print(f"{'Wrote' if saved else 'Could not write'} {DEFAULT_TABLES_PATH}")
@@ -0,0 +1,247 @@
+import numpy as np
+import pandas as pd
+
+# StatsBomb event coordinates (yards)
+STATSBOMB_PITCH = (120, 80)
+
+# Pass length bin edges (yards) separating short, medium and long passes.
+# Short matches the loader's short/long split.
+PASS_LENGTH_BINS = (30, 60)
+
+# Destination zones: thirds along the length x channels across the width
+DESTINATION_THIRDS = ['defensive', 'middle', 'final']
+DESTINATION_CHANNELS = ['left', 'center', 'right']
+
+# Goalkeepers with fewer passes are left out of the index
+MIN_PASSES = 10
+
+FEATURE_NAMES = (
+    ['short_pct', 'medium_pct', 'long_pct', 'success_rate', 'pressure_pct']
+    + [f'to_{third}_{channel}_pct' for third in DESTINATION_THIRDS for channel in DESTINATION_CHANNELS]
+    + ['xt_gk']
+)
+
+
+def goalkeeper_features(pass_events, analyzer=None, min_passes=MIN_PASSES):
+    """
+    Build a distribution feature vector for every goalkeeper.
+
+    Parameters:
+    -----------
+    pass_events : list
+        Goalkeeper pass events, as in the 'pass_events' of
+        StatsBombDataLoader.get_goalkeeper_distribution_data
+    analyzer : XtGkAnalyzer, optional
+        Analyzer used to score the passes (default: one on the StatsBomb pitch)
+    min_passes : int
+        Minimum number of passes for a goalkeeper to be included
+
+    Returns:
+    --------
+    pd.DataFrame
+        One row per goalkeeper with 'player_id', 'player_name', 'team_name',
+        'passes', the FEATURE_NAMES columns, and 'short_success',
+        'medium_success', 'long_success' and 'pressure_success' (completion
+        rates of short, medium, long and pressured passes) and
+        'release_speed' (mean ball speed of the passes, yards per second)
+    """
+    columns = (['player_id', 'player_name', 'team_name', 'passes'] + FEATURE_NAMES
+               + ['short_success', 'medium_success', 'long_success', 'pressure_success', 'release_speed'])
+    if not pass_events:
+        return pd.DataFrame(columns=columns)
+
+    if analyzer is None:
+        # Imported here so that the index itself does not pull in the
+        # analyzer and its plotting dependencies
+        from utils.xt_gk_analyzer import XtGkAnalyzer
+        analyzer = XtGkAnalyzer(pitch_dimensions=STATSBOMB_PITCH)
+    xt_gk = analyzer.calculate_xt_gk_batch(pd.DataFrame(pass_events))
+
+    start = np.zeros((len(pass_events), 2))
+    end = np.zeros((len(pass_events), 2))
+    for i, event in enumerate(pass_events):
+        start[i] = (event.get('location') or (0, 0))[:2]
+        end[i] = (event.get('pass', {}).get('end_location') or (0, 0))[:2]
+
+    completed = np.array([not event.get('pass', {}).get('outcome') for event in pass_events], dtype=float)
+    duration = np.array([event.get('duration') or np.nan for event in pass_events], dtype=float)
+    pressured = np.array([bool(event.get('under_pressure')) for event in pass_events], dtype=float)
+
+    # Length bin and destination zone of every pass, one-hot encoded so that
+    # a per-goalkeeper mean gives the share of passes in each
+    length = np.hypot(*(end - start).T)
+    length_bin = np.digitize(length, PASS_LENGTH_BINS)
+    third = np.clip((end[:, 0] * (len(DESTINATION_THIRDS) / STATSBOMB_PITCH[0])).astype(int),
+                    0, len(DESTINATION_THIRDS) - 1)
+    channel = np.clip((end[:, 1] * (len(DESTINATION_CHANNELS) / STATSBOMB_PITCH[1])).astype(int),
+                      0, len(DESTINATION_CHANNELS) - 1)
+    zone = third * len(DESTINATION_CHANNELS) + channel
+
+    frame = pd.DataFrame(
+        np.column_stack([
+            np.eye(len(PASS_LENGTH_BINS) + 1)[length_bin],
+            completed,
+            pressured,
+            np.eye(len(DESTINATION_THIRDS) * len(DESTINATION_CHANNELS))[zone],
+            xt_gk
+        ]),
+        columns=FEATURE_NAMES
+    )
+    frame['player_id'] = [event.get('player', {}).get('id') for event in pass_events]
+    frame['player_name'] = [event.get('player', {}).get('name') for event in pass_events]
+    frame['team_name'] = [event.get('team', {}).get('name') for event in pass_events]
+
+    # Completion rates by pass type, for display only
+    frame['short_completed'] = np.where(length_bin == 0, completed, np.nan)
+    frame['medium_completed'] = np.where(length_bin == 1, completed, np.nan)
+    frame['long_completed'] = np.where(length_bin == 2, completed, np.nan)
+    frame['pressure_completed'] = np.where(pressured > 0, completed, np.nan)
+    frame['release_speed'] = length / np.where(duration > 0, duration, np.nan)
+
+    grouped = frame.groupby('player_id')
+    features = grouped[FEATURE_NAMES].mean()
+    features['passes'] = grouped.size()
+    features['player_name'] = grouped['player_name'].first()
+    features['team_name'] = grouped['team_name'].agg(lambda teams: teams.mode().iat[0])
+    features[['short_success', 'medium_success', 'long_success', 'pressure_success']] = (
+        grouped[['short_completed', 'medium_completed', 'long_completed', 'pressure_completed']]
+        .mean().fillna(0).to_numpy()
+    )
+    features['release_speed'] = grouped['release_speed'].mean().fillna(0)
+
+    features = features[features['passes'] >= min_passes].reset_index()
+    return features[columns]
+
+
+class GoalkeeperSimilarityIndex:
+    """
+    Nearest-neighbour search over goalkeeper distribution feature vectors.
+
+    Features are standardized across the indexed goalkeepers and every vector
+    is scaled to unit length, so the cosine similarity of all goalkeepers to a
+    query is a single matrix-vector product.
+    """
+
+    def __init__(self, features):
+        """
+        Build the index.
+
+        Parameters:
+        -----------
+        features : pd.DataFrame
+            Output of goalkeeper_features, possibly for several leagues
+            concatenated (an optional 'league' column is kept as metadata)
+        """
+        self.goalkeepers = features.drop(columns=FEATURE_NAMES).reset_index(drop=True)
+        self.features = features[FEATURE_NAMES].reset_index(drop=True)
+
+        values = self.features.to_numpy(dtype=float)
+        self.mean = values.mean(axis=0) if len(values) else np.zeros(len(FEATURE_NAMES))
+        self.scale = values.std(axis=0) if len(values) else np.ones(len(FEATURE_NAMES))
+        self.scale[self.scale == 0] = 1.0
+
+        self.vectors = self._normalize(values)
+        self.vectors.flags.writeable = False
+
+    def __len__(self):
+        return len(self.goalkeepers)
+
+    def _normalize(self, values):
+        standardized = (np.asarray(values, dtype=float) - self.mean) / self.scale
+        norms = np.linalg.norm(standardized, axis=-1, keepdims=True)
+        return standardized / np.where(norms > 0, norms, 1.0)
+
+    def find(self, player_name, team_name=None):
+        """
+        Get the row of a goalkeeper in the index.
+
+        Parameters:
+        -----------
+        player_name : str
+            Goalkeeper name
+        team_name : str, optional
+            Team name, to tell apart goalkeepers with the same name
+
+        Returns:
+        --------
+        int or None
+            Row of the goalkeeper (the one with most passes if several
+            match), or None if the goalkeeper is not indexed
+        """
+        matches = self.goalkeepers['player_name'] == player_name
+        if team_name is not None:
+            matches &= self.goalkeepers['team_name'] == team_name
+        if not matches.any():
+            return None
+        return int(self.goalkeepers.loc[matches, 'passes'].idxmax())
+
+    def profile(self, row):
+        """
+        Get the metadata and features of an indexed goalkeeper.
+
+        Parameters:
+        -----------
+        row : int
+            Row of the goalkeeper, as returned by find
+
+        Returns:
+        --------
+        pd.Series
+            Metadata columns and raw (unstandardized) features
+        """
+        return pd.concat([self.goalkeepers.iloc[row], self.features.iloc[row]])
+
+    def query(self, features, k=5, exclude=None):
+        """
+        Find the goalkeepers most similar to a feature vector.
+
+        Parameters:
+        -----------
+        features : array-like or dict
+            Raw feature values in FEATURE_NAMES order, or mapping by name
+        k : int
+            Number of goalkeepers to return
+        exclude : int, optional
+            Row to leave out of the results, e.g. the queried goalkeeper
+
+        Returns:
+        --------
+        pd.DataFrame
+            Metadata of the k most similar goalkeepers with a 'similarity'
+            column (cosine similarity, 1 = identical profile), most similar
+            first
+        """
+        if isinstance(features, dict):
+            features = [features[name] for name in FEATURE_NAMES]
+
+        similarity = self.vectors @ self._normalize(features)
+        if exclude is not None:
+            similarity[exclude] = -np.inf
+
+        k = min(k, len(similarity) - (exclude is not None))
+        if k <= 0:
+            return self.goalkeepers.iloc[[]].assign(similarity=[])
+
+        # Partial selection of the top k, then sort only those
+        top = np.argpartition(-similarity, k - 1)[:k]
+        top = top[np.argsort(-similarity[top])]
+
+        return self.goalkeepers.iloc[top].assign(similarity=similarity[top])
+
+    def similar_to(self, row, k=5):
+        """
+        Find the goalkeepers most similar to an indexed goalkeeper.
+
+        Parameters:
+        -----------
+        row : int
+            Row of the goalkeeper, as returned by find
+        k : int
+            Number of goalkeepers to return
+
+        Returns:
+        --------
+        pd.DataFrame
+            As returned by query, without the goalkeeper itself
+        """
+        return self.query(self.features.iloc[row].to_numpy(), k=k, exclude=row)
@@ -1,39 +1,518 @@
 import io
+import os
 import base64
+import hashlib
+import tempfile
+import atexit
+import asyncio
+import threading
+import concurrent.futures
 import pandas as pd
 import matplotlib.pyplot as plt
 from weasyprint import HTML, CSS
-from jinja2 import Template
+try:
+    from weasyprint.text.fonts import FontConfiguration
+except ImportError:  # WeasyPrint < 53
+    from weasyprint.fonts import FontConfiguration
+from jinja2 import Environment, DictLoader
 import plotly.io as pio
 import plotly.graph_objects as go
 from datetime import datetime
+from functools import lru_cache
 
-def generate_pdf_report(title, content, figures=None, tables=None, metadata=None):
+from utils.report_cache import evict_reports
+
+try:
+    import kaleido
+except ImportError:  # Figures fall back to pio.to_image
+    kaleido = None
+
+# Browser tabs kept open for rasterizing figures concurrently
+RENDER_TABS = 4
+# Seconds allowed for rasterizing all figures of one report
+RENDER_TIMEOUT = 60
+
+
+class _FigureRenderer:
     """
-    Generate a PDF report using WeasyPrint with proper styling and layout.
+    Persistent Kaleido browser, running on its own event loop thread, that
+    rasterizes figures concurrently across several tabs.
+    """
+    
+    def __init__(self, tabs=RENDER_TABS):
+        self.tabs = tabs
+        self._lock = threading.Lock()
+        self._loop = None
+        self._browser = None
+    
+    def _start(self, timeout):
+        loop = asyncio.new_event_loop()
+        threading.Thread(target=loop.run_forever, name='xtgk-figure-renderer', daemon=True).start()
+        
+        async def open_browser():
+            browser = kaleido.Kaleido(n=self.tabs, timeout=timeout)
+            await browser.open()
+            return browser
+        
+        future = asyncio.run_coroutine_threadsafe(open_browser(), loop)
+        try:
+            self._browser = future.result(timeout)
+        except BaseException:
+            future.cancel()
+            loop.call_soon_threadsafe(loop.stop)
+            raise
+        self._loop = loop
+        atexit.register(self.close)
+    
+    def render(self, figs, opts, timeout=RENDER_TIMEOUT):
+        """
+        Rasterize figures concurrently.
+        
+        Returns a list with the image bytes of each figure, or None for figures
+        that failed to render. Raises concurrent.futures.TimeoutError if the
+        figures are not rendered within timeout seconds.
+        """
+        with self._lock:
+            if self._browser is None:
+                self._start(timeout)
+            browser, loop = self._browser, self._loop
+        
+        async def render_all():
+            return await asyncio.gather(
+                *(browser.calc_fig(fig, opts=dict(opts)) for fig in figs),
+                return_exceptions=True
+            )
+        
+        future = asyncio.run_coroutine_threadsafe(render_all(), loop)
+        try:
+            results = future.result(timeout)
+        except concurrent.futures.TimeoutError:
+            future.cancel()
+            raise
+        
+        return [None if isinstance(result, BaseException) else result for result in results]
+    
+    def close(self):
+        """Shut down the browser; the next render starts a fresh one."""
+        with self._lock:
+            if self._browser is None:
+                return
+            try:
+                asyncio.run_coroutine_threadsafe(self._browser.close(), self._loop).result(10)
+            except Exception:
+                pass
+            self._loop.call_soon_threadsafe(self._loop.stop)
+            self._loop = None
+            self._browser = None
+
+
+_renderer = _FigureRenderer() if hasattr(kaleido, 'Kaleido') else None
+
+
+def rasterize_figures(figs, format='png', width=800, height=500, scale=2, timeout=RENDER_TIMEOUT):
+    """
+    Rasterize Plotly figures with a persistent renderer.
+    
+    All figures are rendered concurrently by a Kaleido browser that is kept
+    alive between reports. If that renderer is unavailable (Kaleido < 1.0 or
+    no browser) or times out, figures are rendered one by one with
+    pio.to_image instead, as are figures the renderer failed to draw.
     
     Parameters:
     -----------
-    title : str
-        The title of the report
-    content : dict
-        Dictionary containing sections of content with keys as section titles
-        and values as section content (can include HTML)
-    figures : list, optional
-        List of dictionaries with figure data, each containing:
-        - 'figure': Plotly figure object
-        - 'caption': Figure caption
-    tables : list, optional
-        List of dictionaries with table data, each containing:
-        - 'data': Pandas DataFrame
-        - 'caption': Table caption
-    metadata : dict, optional
-        Dictionary containing metadata like author, date, etc.
+    figs : list
+        List of Plotly figure objects
+    format : str
+        Image format, e.g. 'png' or 'svg'
+    width : int
+        Image width in layout pixels
+    height : int
+        Image height in layout pixels
+    scale : float
+        Resolution scale factor
+    timeout : float
+        Seconds allowed for rendering all figures
         
     Returns:
     --------
-    bytes
-        PDF file as bytes
+    list
+        Image bytes for each figure, or None where rendering failed
+    """
+    if not figs:
+        return []
+    
+    images = [None] * len(figs)
+    if _renderer is not None:
+        opts = dict(format=format, width=width, height=height, scale=scale)
+        try:
+            images = list(_renderer.render([fig.to_dict() for fig in figs], opts, timeout))
+        except concurrent.futures.TimeoutError:
+            # The browser may be stuck; start a fresh one for the next report
+            # and render this report's figures one by one below
+            _renderer.close()
+        except Exception:
+            pass
+    
+    # Render the figures the batch did not produce one by one
+    for i, fig in enumerate(figs):
+        if images[i] is not None:
+            continue
+        try:
+            images[i] = pio.to_image(fig, format=format, width=width, height=height, scale=scale)
+        except Exception:
+            pass
+    return images
+
+# Content-addressed store of rendered figures, shared by all reports so that
+# figures repeated across a report bundle are rendered and decoded only once
+IMAGE_STORE_DIR = os.path.join(tempfile.gettempdir(), 'xtgk_figures')
+IMAGE_STORE_MAX_BYTES = 500 * 1024 * 1024
+IMAGE_FORMATS = {'png': 'image/png', 'svg': 'image/svg+xml'}
+
+# WeasyPrint's cache of parsed images, keyed by image URL
+_image_cache = {}
+_IMAGE_CACHE_ENTRIES = 256
+
+
+def _figure_image_key(fig, format, width, height, scale):
+    encoded = f"{fig.to_json()}|{format}|{width}|{height}|{scale}"
+    return hashlib.sha256(encoded.encode('utf-8')).hexdigest()
+
+
+def store_figure_images(figs, format='png', width=800, height=500, scale=2):
+    """
+    Render figures through the shared image store.
+    
+    Identical figures (same JSON, format and size) are rendered once and then
+    served from the store. The images are returned as data URIs read while
+    the figures of this report are protected from eviction, so that another
+    process trimming the store cannot remove one before WeasyPrint reads it.
+    
+    Parameters:
+    -----------
+    figs : list
+        List of Plotly figure objects
+    format : str
+        Image format, 'png' or 'svg'
+    width : int
+        Image width in layout pixels
+    height : int
+        Image height in layout pixels
+    scale : float
+        Resolution scale factor (ignored by vector formats)
+        
+    Returns:
+    --------
+    list
+        Image data URI for each figure, or None where rendering failed
+    """
+    if format not in IMAGE_FORMATS:
+        raise ValueError(f"Unsupported image format: {format}")
+    
+    paths = [
+        os.path.join(IMAGE_STORE_DIR, f"{_figure_image_key(fig, format, width, height, scale)}.{format}")
+        for fig in figs
+    ]
+    
+    # Read the stored figures, marking them as recently used for eviction
+    images = {}
+    missing = {}
+    for fig, path in zip(figs, paths):
+        if path in images or path in missing:
+            continue
+        try:
+            with open(path, 'rb') as f:
+                images[path] = f.read()
+            os.utime(path)
+        except OSError:
+            missing[path] = fig
+    
+    # Render each distinct missing figure once
+    rendered = rasterize_figures(list(missing.values()), format=format,
+                                 width=width, height=height, scale=scale)
+    
+    for path, image in zip(missing, rendered):
+        images[path] = image
+        if image is None:
+            continue
+        try:
+            os.makedirs(IMAGE_STORE_DIR, exist_ok=True)
+            with tempfile.NamedTemporaryFile(dir=IMAGE_STORE_DIR, suffix='.tmp', delete=False) as f:
+                f.write(image)
+            os.replace(f.name, path)
+        except OSError:
+            # An unwritable store only costs the deduplication
+            continue
+    
+    if missing:
+        suffixes = tuple(f".{image_format}" for image_format in IMAGE_FORMATS)
+        evict_reports(IMAGE_STORE_DIR, IMAGE_STORE_MAX_BYTES, suffixes=suffixes, keep=paths)
+    
+    data_uris = {}
+    for path, image in images.items():
+        if image is None:
+            data_uris[path] = None
+            continue
+        img_base64 = base64.b64encode(image).decode('utf-8')
+        data_uris[path] = f"data:{IMAGE_FORMATS[format]};base64,{img_base64}"
+    return [data_uris[path] for path in paths]
+
+# Stylesheet shared by all reports, parsed once by _get_report_stylesheet
+REPORT_CSS = """
+@page {
+    size: A4;
+    margin: 2.5cm 1.5cm;
+    @top-center {
+        content: "xT-GK Analysis";
+        font-size: 10pt;
+        color: #666;
+    }
+    @bottom-center {
+        content: "Page " counter(page) " of " counter(pages);
+        font-size: 10pt;
+        color: #666;
+    }
+}
+body {
+    font-family: 'Helvetica', 'Arial', sans-serif;
+    font-size: 11pt;
+    line-height: 1.4;
+    color: #333;
+}
+h1 {
+    font-size: 24pt;
+    color: #1a5276;
+    margin-bottom: 0.5cm;
+    text-align: center;
+    page-break-after: avoid;
+}
+h2 {
+    font-size: 16pt;
+    color: #2874a6;
+    margin-top: 1cm;
+    margin-bottom: 0.3cm;
+    page-break-after: avoid;
+}
+h3 {
+    font-size: 14pt;
+    color: #3498db;
+    margin-top: 0.8cm;
+    margin-bottom: 0.2cm;
+    page-break-after: avoid;
+}
+p {
+    margin-bottom: 0.3cm;
+    text-align: justify;
+}
+.metadata {
+    margin-bottom: 1cm;
+    text-align: center;
+    font-size: 10pt;
+    color: #666;
+}
+.figure-container {
+    margin: 1cm 0;
+    text-align: center;
+    page-break-inside: avoid;
+}
+.figure-container img {
+    max-width: 100%;
+    height: auto;
+}
+.figure-caption {
+    font-style: italic;
+    font-size: 10pt;
+    color: #666;
+    margin-top: 0.2cm;
+    text-align: center;
+}
+.table-container {
+    margin: 1cm 0;
+    page-break-inside: avoid;
+}
+.table-caption {
+    font-style: italic;
+    font-size: 10pt;
+    color: #666;
+    margin-bottom: 0.2cm;
+}
+.data-table {
+    width: 100%;
+    border-collapse: collapse;
+    font-size: 9pt;
+}
+.data-table th {
+    background-color: #f2f2f2;
+    border: 1px solid #ddd;
+    padding: 8px;
+    text-align: left;
+}
+.data-table td {
+    border: 1px solid #ddd;
+    padding: 6px;
+}
+.data-table tr:nth-child(even) {
+    background-color: #f9f9f9;
+}
+.footer {
+    margin-top: 1.5cm;
+    text-align: center;
+    font-size: 9pt;
+    color: #666;
+    border-top: 1px solid #ddd;
+    padding-top: 0.3cm;
+}
+.page-break {
+    page-break-before: always;
+}
+.toc ol {
+    padding-left: 0.5cm;
+}
+.toc li {
+    margin-bottom: 0.2cm;
+}
+.toc a {
+    color: #333;
+    text-decoration: none;
+}
+.toc a::after {
+    content: leader('.') target-counter(attr(href), page);
+}
+.book-report {
+    page-break-before: always;
+}
+"""
+
+# Body of one report, shared by the single report and the report book
+REPORT_MACROS = """
+{% macro report_body(report, anchor=None) %}
+    <h1{% if anchor %} id="{{ anchor }}"{% endif %}>{{ report.title }}</h1>
+
+    <div class="metadata">
+        <p>
+            {% if report.metadata.author %}Author: {{ report.metadata.author }}{% endif %}
+            {% if report.metadata.date %} | Date: {{ report.metadata.date }}{% endif %}
+            {% if report.metadata.team %} | Team: {{ report.metadata.team }}{% endif %}
+        </p>
+    </div>
+
+    {% for section_title, section_content in report.content.items() %}
+        <h2>{{ section_title }}</h2>
+        {{ section_content|safe }}
+    {% endfor %}
+
+    {% if report.figure_images %}
+        <h2>Visualizations</h2>
+        {% for figure in report.figure_images %}
+            <div class="figure-container">
+                <img src="{{ figure.image }}" alt="{{ figure.caption }}">
+                <div class="figure-caption">{{ figure.caption }}</div>
+            </div>
+        {% endfor %}
+    {% endif %}
+
+    {% if report.table_htmls %}
+        <h2>Data Tables</h2>
+        {% for table in report.table_htmls %}
+            <div class="table-container">
+                <div class="table-caption">{{ table.caption }}</div>
+                {{ table.html|safe }}
+            </div>
+        {% endfor %}
+    {% endif %}
+{% endmacro %}
+
+{% macro footer() %}
+    <div class="footer">
+        <p>Generated by xT-GK Analyzer | Jeffrey Eyestone | j@eyestone.us | +1 (720) 625-2425</p>
+    </div>
+{% endmacro %}
+"""
+
+# HTML template for a single report
+REPORT_TEMPLATE = """
+{% from 'macros.html' import report_body, footer %}
+<!DOCTYPE html>
+<html>
+<head>
+    <meta charset="UTF-8">
+    <title>{{ report.title }}</title>
+</head>
+<body>
+    {{ report_body(report) }}
+    {{ footer() }}
+</body>
+</html>
+"""
+
+# HTML template for several reports bound into one book with a table of contents
+BOOK_TEMPLATE = """
+{% from 'macros.html' import report_body, footer %}
+<!DOCTYPE html>
+<html>
+<head>
+    <meta charset="UTF-8">
+    <title>{{ title }}</title>
+</head>
+<body>
+    <h1>{{ title }}</h1>
+
+    <div class="metadata">
+        <p>
+            {% if metadata.author %}Author: {{ metadata.author }}{% endif %}
+            {% if metadata.date %} | Date: {{ metadata.date }}{% endif %}
+            {% if metadata.team %} | Team: {{ metadata.team }}{% endif %}
+        </p>
+    </div>
+
+    <div class="toc">
+        <h2>Contents</h2>
+        <ol>
+            {% for report in reports %}
+            <li><a href="#report-{{ loop.index }}">{{ report.title }}</a></li>
+            {% endfor %}
+        </ol>
+    </div>
+
+    {% for report in reports %}
+    <div class="book-report">
+        {{ report_body(report, anchor='report-' ~ loop.index) }}
+    </div>
+    {% endfor %}
+
+    {{ footer() }}
+</body>
+</html>
+"""
+
+# Templates are compiled on first use and cached by the environment
+_jinja_env = Environment(
+    loader=DictLoader({
+        'macros.html': REPORT_MACROS,
+        'report.html': REPORT_TEMPLATE,
+        'book.html': BOOK_TEMPLATE,
+    }),
+    autoescape=False
+)
+
+
+def _get_report_template(name='report.html'):
+    return _jinja_env.get_template(name)
+
+
+@lru_cache(maxsize=None)
+def _get_report_stylesheet():
+    font_config = FontConfiguration()
+    return CSS(string=REPORT_CSS, font_config=font_config), font_config
+
+
+def _prepare_report(title, content, figures=None, tables=None, metadata=None, images=None):
+    """
+    Fill in the metadata defaults and lay out the figures and tables of a
+    report for the templates.
+    
+    ``images`` holds the image URL of each entry of ``figures`` that has a
+    'figure', as returned by store_figure_images.
     """
     if metadata is None:
         metadata = {}
@@ -44,18 +523,14 @@ def generate_pdf_report(title, content, figures=None, tables=None, metadata=None
     if 'date' not in metadata:
         metadata['date'] = datetime.now().strftime('%Y-%m-%d')
     
-    # Convert Plotly figures to base64 encoded images
     figure_images = []
     if figures:
-        for i, fig_data in enumerate(figures):
-            if 'figure' in fig_data:
-                fig = fig_data['figure']
-                img_bytes = pio.to_image(fig, format='png', width=800, height=500, scale=2)
-                img_base64 = base64.b64encode(img_bytes).decode('utf-8')
-                figure_images.append({
-                    'image': f"data:image/png;base64,{img_base64}",
-                    'caption': fig_data.get('caption', f'Figure {i+1}')
-                })
+        figures = [(i, fig_data) for i, fig_data in enumerate(figures) if 'figure' in fig_data]
+        for (i, fig_data), image in zip(figures, images):
+            figure_images.append({
+                'image': image,
+                'caption': fig_data.get('caption', f'Figure {i+1}')
+            })
     
     # Convert Pandas tables to HTML
     table_htmls = []
@@ -69,185 +544,169 @@ def generate_pdf_report(title, content, figures=None, tables=None, metadata=None
                     'caption': table_data.get('caption', f'Table {i+1}')
                 })
     
-    # HTML template for the report
-    html_template = """
-    <!DOCTYPE html>
-    <html>
-    <head>
-        <meta charset="UTF-8">
-        <title>{{ title }}</title>
-        <style>
-            @page {
-                size: A4;
-                margin: 2.5cm 1.5cm;
-                @top-center {
-                    content: "xT-GK Analysis";
-                    font-size: 10pt;
-                    color: #666;
-                }
-                @bottom-center {
-                    content: "Page " counter(page) " of " counter(pages);
-                    font-size: 10pt;
-                    color: #666;
-                }
-            }
-            body {
-                font-family: 'Helvetica', 'Arial', sans-serif;
-                font-size: 11pt;
-                line-height: 1.4;
-                color: #333;
-            }
-            h1 {
-                font-size: 24pt;
-                color: #1a5276;
-                margin-bottom: 0.5cm;
-                text-align: center;
-                page-break-after: avoid;
-            }
-            h2 {
-                font-size: 16pt;
-                color: #2874a6;
-                margin-top: 1cm;
-                margin-bottom: 0.3cm;
-                page-break-after: avoid;
-            }
-            h3 {
-                font-size: 14pt;
-                color: #3498db;
-                margin-top: 0.8cm;
-                margin-bottom: 0.2cm;
-                page-break-after: avoid;
-            }
-            p {
-                margin-bottom: 0.3cm;
-                text-align: justify;
-            }
-            .metadata {
-                margin-bottom: 1cm;
-                text-align: center;
-                font-size: 10pt;
-                color: #666;
-            }
-            .figure-container {
-                margin: 1cm 0;
-                text-align: center;
-                page-break-inside: avoid;
-            }
-            .figure-container img {
-                max-width: 100%;
-                height: auto;
-            }
-            .figure-caption {
-                font-style: italic;
-                font-size: 10pt;
-                color: #666;
-                margin-top: 0.2cm;
-                text-align: center;
-            }
-            .table-container {
-                margin: 1cm 0;
-                page-break-inside: avoid;
-            }
-            .table-caption {
-                font-style: italic;
-                font-size: 10pt;
-                color: #666;
-                margin-bottom: 0.2cm;
-            }
-            .data-table {
-                width: 100%;
-                border-collapse: collapse;
-                font-size: 9pt;
-            }
-            .data-table th {
-                background-color: #f2f2f2;
-                border: 1px solid #ddd;
-                padding: 8px;
-                text-align: left;
-            }
-            .data-table td {
-                border: 1px solid #ddd;
-                padding: 6px;
-            }
-            .data-table tr:nth-child(even) {
-                background-color: #f9f9f9;
-            }
-            .footer {
-                margin-top: 1.5cm;
-                text-align: center;
-                font-size: 9pt;
-                color: #666;
-                border-top: 1px solid #ddd;
-                padding-top: 0.3cm;
-            }
-            .page-break {
-                page-break-before: always;
-            }
-        </style>
-    </head>
-    <body>
-        <h1>{{ title }}</h1>
-        
-        <div class="metadata">
-            <p>
-                {% if metadata.author %}Author: {{ metadata.author }}{% endif %}
-                {% if metadata.date %} | Date: {{ metadata.date }}{% endif %}
-                {% if metadata.team %} | Team: {{ metadata.team }}{% endif %}
-            </p>
-        </div>
-        
-        {% for section_title, section_content in content.items() %}
-            <h2>{{ section_title }}</h2>
-            {{ section_content|safe }}
-        {% endfor %}
-        
-        {% if figure_images %}
-            <h2>Visualizations</h2>
-            {% for figure in figure_images %}
-                <div class="figure-container">
-                    <img src="{{ figure.image }}" alt="{{ figure.caption }}">
-                    <div class="figure-caption">{{ figure.caption }}</div>
-                </div>
-            {% endfor %}
-        {% endif %}
+    return {
+        'title': title,
+        'content': content,
+        'figure_images': figure_images,
+        'table_htmls': table_htmls,
+        'metadata': metadata
+    }
+
+
+def _check_images(images):
+    """
+    Raise if any figure could not be rendered, so that incomplete reports
+    are never written or cached.
+    """
+    missing = sum(image is None for image in images)
+    if missing:
+        raise RuntimeError(f"{missing} of {len(images)} report figures could not be rendered")
+
+
+def _report_figures(report):
+    return [fig_data['figure'] for fig_data in report.get('figures') or [] if 'figure' in fig_data]
+
+
+def _write_pdf(html_content, target):
+    stylesheet, font_config = _get_report_stylesheet()
+    if len(_image_cache) > _IMAGE_CACHE_ENTRIES:
+        _image_cache.clear()
+    HTML(string=html_content).write_pdf(target, stylesheets=[stylesheet], font_config=font_config,
+                                        cache=_image_cache)
+
+
+def generate_pdf_report(title, content, figures=None, tables=None, metadata=None, image_format='png'):
+    """
+    Generate a PDF report using WeasyPrint with proper styling and layout.
+    
+    Parameters:
+    -----------
+    title : str
+        The title of the report
+    content : dict
+        Dictionary containing sections of content with keys as section titles
+        and values as section content (can include HTML)
+    figures : list, optional
+        List of dictionaries with figure data, each containing:
+        - 'figure': Plotly figure object
+        - 'caption': Figure caption
+    tables : list, optional
+        List of dictionaries with table data, each containing:
+        - 'data': Pandas DataFrame
+        - 'caption': Table caption
+    metadata : dict, optional
+        Dictionary containing metadata like author, date, etc.
+    image_format : str, optional
+        How figures are embedded: 'png' (raster, default) or 'svg' (vector,
+        smaller files that stay sharp when zoomed)
         
-        {% if table_htmls %}
-            <h2>Data Tables</h2>
-            {% for table in table_htmls %}
-                <div class="table-container">
-                    <div class="table-caption">{{ table.caption }}</div>
-                    {{ table.html|safe }}
-                </div>
-            {% endfor %}
-        {% endif %}
+    Returns:
+    --------
+    bytes
+        PDF file as bytes
         
-        <div class="footer">
-            <p>Generated by xT-GK Analyzer | Jeffrey Eyestone | j@eyestone.us | +1 (720) 625-2425</p>
-        </div>
-    </body>
-    </html>
+    Raises:
+    -------
+    RuntimeError
+        If a figure could not be rendered
     """
+    # Render Plotly figures into the shared image store
+    images = store_figure_images(_report_figures({'figures': figures}),
+                                 format=image_format, width=800, height=500, scale=2)
+    _check_images(images)
+    report = _prepare_report(title, content, figures, tables, metadata, images)
     
     # Render the template
-    template = Template(html_template)
-    html_content = template.render(
-        title=title,
-        content=content,
-        figure_images=figure_images,
-        table_htmls=table_htmls,
-        metadata=metadata
-    )
+    html_content = _get_report_template().render(report=report)
     
     # Generate PDF
     pdf_bytes = io.BytesIO()
-    HTML(string=html_content).write_pdf(pdf_bytes)
+    _write_pdf(html_content, pdf_bytes)
     pdf_bytes.seek(0)
     
     return pdf_bytes.getvalue()
 
-def generate_in_game_decision_pdf(gk_name, team_name, match_situation, pressure_level, 
+
+def generate_report_book(reports, output_path, title="xT-GK Report Book", metadata=None,
+                         image_format='png'):
+    """
+    Bind several analyses into one PDF book with a table of contents.
+    
+    The figures of all reports are rasterized together and the whole book is
+    laid out in a single WeasyPrint pass, streamed to ``output_path``.
+    
+    Parameters:
+    -----------
+    reports : list
+        Report specifications, as returned by the ``build_*_report``
+        functions (dictionaries with 'title', 'content' and optionally
+        'figures', 'tables' and 'metadata')
+    output_path : str
+        Path of the PDF file to write
+    title : str, optional
+        Title of the book
+    metadata : dict, optional
+        Dictionary containing book metadata like author, date, team
+    image_format : str, optional
+        How figures are embedded: 'png' (default) or 'svg'
+        
+    Returns:
+    --------
+    str
+        Path of the written PDF file
+        
+    Raises:
+    -------
+    RuntimeError
+        If a figure could not be rendered
+    """
+    metadata = dict(metadata or {})
+    metadata.setdefault('author', 'xT-GK Analyzer')
+    metadata.setdefault('date', datetime.now().strftime('%Y-%m-%d'))
+    
+    # Render the figures of every report in one batch
+    report_figures = [_report_figures(report) for report in reports]
+    images = store_figure_images([fig for figs in report_figures for fig in figs],
+                                 format=image_format, width=800, height=500, scale=2)
+    _check_images(images)
+    
+    prepared = []
+    offset = 0
+    for report, figs in zip(reports, report_figures):
+        prepared.append(_prepare_report(
+            report['title'],
+            report['content'],
+            report.get('figures'),
+            report.get('tables'),
+            report.get('metadata'),
+            images[offset:offset + len(figs)]
+        ))
+        offset += len(figs)
+    
+    html_content = _get_report_template('book.html').render(
+        title=title,
+        metadata=metadata,
+        reports=prepared
+    )
+    
+    # Write to a private file first so readers never see a partial book
+    tmp_path = f"{output_path}.{os.getpid()}.tmp"
+    try:
+        _write_pdf(html_content, tmp_path)
+        os.replace(tmp_path, output_path)
+    except BaseException:
+        # Do not leave a partial book behind, e.g. when the disk fills up
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+        raise
+    
+    return output_path
+
+def build_in_game_decision_report(gk_name, team_name, match_situation, pressure_level, 
                                   distribution_options, recommendation, pitch_fig=None):
-    """Generate PDF for In-Game Decision template"""
+    """Build the report specification for the In-Game Decision template"""
     
     title = f"In-Game Decision Analysis: {gk_name}"
     
@@ -284,11 +743,23 @@ def generate_in_game_decision_pdf(gk_name, team_name, match_situation, pressure_
         'team': team_name
     }
     
-    return generate_pdf_report(title, content, figures, metadata=metadata)
+    return {
+        'title': title,
+        'content': content,
+        'figures': figures,
+        'metadata': metadata
+    }
 
-def generate_opposition_analysis_pdf(gk_name, team_name, opposition_team, 
+def generate_in_game_decision_pdf(gk_name, team_name, match_situation, pressure_level, 
+                                  distribution_options, recommendation, pitch_fig=None, image_format='png'):
+    """Generate PDF for In-Game Decision template"""
+    report = build_in_game_decision_report(gk_name, team_name, match_situation, pressure_level,
+                                           distribution_options, recommendation, pitch_fig=pitch_fig)
+    return generate_pdf_report(**report, image_format=image_format)
+
+def build_opposition_analysis_report(gk_name, team_name, opposition_team, 
                                     analysis_type, key_findings, pitch_fig=None):
-    """Generate PDF for Opposition Analysis template"""
+    """Build the report specification for the Opposition Analysis template"""
     
     if analysis_type == "our_gk":
         title = f"Opposition Analysis: Preparing {gk_name} for {opposition_team}"
@@ -330,11 +801,23 @@ def generate_opposition_analysis_pdf(gk_name, team_name, opposition_team,
         'team': team_name
     }
     
-    return generate_pdf_report(title, content, figures, metadata=metadata)
+    return {
+        'title': title,
+        'content': content,
+        'figures': figures,
+        'metadata': metadata
+    }
 
-def generate_team_coordination_pdf(gk_name, team_name, formation, build_up_pattern,
+def generate_opposition_analysis_pdf(gk_name, team_name, opposition_team, 
+                                    analysis_type, key_findings, pitch_fig=None, image_format='png'):
+    """Generate PDF for Opposition Analysis template"""
+    report = build_opposition_analysis_report(gk_name, team_name, opposition_team,
+                                              analysis_type, key_findings, pitch_fig=pitch_fig)
+    return generate_pdf_report(**report, image_format=image_format)
+
+def build_team_coordination_report(gk_name, team_name, formation, build_up_pattern,
                                   movement_patterns, recommendations, coord_fig=None):
-    """Generate PDF for Team Coordination template"""
+    """Build the report specification for the Team Coordination template"""
     
     title = f"Team Coordination Analysis: {team_name}"
     
@@ -372,11 +855,23 @@ def generate_team_coordination_pdf(gk_name, team_name, formation, build_up_patte
         'team': team_name
     }
     
-    return generate_pdf_report(title, content, figures, metadata=metadata)
+    return {
+        'title': title,
+        'content': content,
+        'figures': figures,
+        'metadata': metadata
+    }
 
-def generate_training_development_pdf(gk_name, team_name, primary_focus, secondary_focus,
+def generate_team_coordination_pdf(gk_name, team_name, formation, build_up_pattern,
+                                  movement_patterns, recommendations, coord_fig=None, image_format='png'):
+    """Generate PDF for Team Coordination template"""
+    report = build_team_coordination_report(gk_name, team_name, formation, build_up_pattern,
+                                            movement_patterns, recommendations, coord_fig=coord_fig)
+    return generate_pdf_report(**report, image_format=image_format)
+
+def build_training_development_report(gk_name, team_name, primary_focus, secondary_focus,
                                      training_phase, recommendations, pitch_fig=None, radar_fig=None):
-    """Generate PDF for Training Development template"""
+    """Build the report specification for the Training Development template"""
     
     title = f"Training Development Program: {gk_name}"
     
@@ -415,11 +910,25 @@ def generate_training_development_pdf(gk_name, team_name, primary_focus, seconda
         'team': team_name
     }
     
-    return generate_pdf_report(title, content, figures, metadata=metadata)
+    return {
+        'title': title,
+        'content': content,
+        'figures': figures,
+        'metadata': metadata
+    }
 
-def generate_goalkeeper_scouting_pdf(gk_name, team_name, scouting_team, team_style,
+def generate_training_development_pdf(gk_name, team_name, primary_focus, secondary_focus,
+                                     training_phase, recommendations, pitch_fig=None, radar_fig=None,
+                                     image_format='png'):
+    """Generate PDF for Training Development template"""
+    report = build_training_development_report(gk_name, team_name, primary_focus, secondary_focus,
+                                               training_phase, recommendations,
+                                               pitch_fig=pitch_fig, radar_fig=radar_fig)
+    return generate_pdf_report(**report, image_format=image_format)
+
+def build_goalkeeper_scouting_report(gk_name, team_name, scouting_team, team_style,
                                     strengths, weaknesses, recommendation, radar_fig=None, pitch_fig=None):
-    """Generate PDF for Goalkeeper Scouting template"""
+    """Build the report specification for the Goalkeeper Scouting template"""
     
     title = f"Goalkeeper Scouting Report: {gk_name}"
     
@@ -467,4 +976,18 @@ def generate_goalkeeper_scouting_pdf(gk_name, team_name, scouting_team, team_sty
         'team': scouting_team
     }
     
-    return generate_pdf_report(title, content, figures, metadata=metadata)
+    return {
+        'title': title,
+        'content': content,
+        'figures': figures,
+        'metadata': metadata
+    }
+
+def generate_goalkeeper_scouting_pdf(gk_name, team_name, scouting_team, team_style,
+                                    strengths, weaknesses, recommendation, radar_fig=None, pitch_fig=None,
+                                    image_format='png'):
+    """Generate PDF for Goalkeeper Scouting template"""
+    report = build_goalkeeper_scouting_report(gk_name, team_name, scouting_team, team_style,
+                                              strengths, weaknesses, recommendation,
+                                              radar_fig=radar_fig, pitch_fig=pitch_fig)
+    return generate_pdf_report(**report, image_format=image_format)
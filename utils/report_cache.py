@@ -0,0 +1,224 @@
+import os
+import json
+import hashlib
+import tempfile
+import numpy as np
+import pandas as pd
+from datetime import datetime
+
+# Bump when report templates change so that stale PDFs are not served
+REPORT_CACHE_VERSION = 1
+
+DEFAULT_CACHE_DIR = os.path.join(tempfile.gettempdir(), 'xtgk_reports')
+DEFAULT_MAX_BYTES = 200 * 1024 * 1024
+
+
+def _encode(value):
+    """JSON fallback for report inputs that are not plain Python values."""
+    if hasattr(value, 'to_plotly_json'):
+        return value.to_json()
+    if isinstance(value, (pd.DataFrame, pd.Series)):
+        return value.to_json(orient='split')
+    if isinstance(value, np.ndarray):
+        return value.tolist()
+    if isinstance(value, np.generic):
+        return value.item()
+    return repr(value)
+
+
+def report_key(generator, **kwargs):
+    """
+    Compute the content address of a report.
+
+    Parameters:
+    -----------
+    generator : callable
+        PDF generator function, e.g. generate_in_game_decision_pdf
+    **kwargs
+        Keyword arguments the generator will be called with. Plotly figures
+        and DataFrames are hashed by their JSON serialization.
+
+    Returns:
+    --------
+    str
+        Hex digest identifying the report
+    """
+    payload = {
+        'version': REPORT_CACHE_VERSION,
+        'generator': f"{generator.__module__}.{generator.__qualname__}",
+        'inputs': kwargs
+    }
+    encoded = json.dumps(payload, sort_keys=True, default=_encode)
+    return hashlib.sha256(encoded.encode('utf-8')).hexdigest()
+
+
+def _report_file(key, cache_dir):
+    return os.path.join(cache_dir or DEFAULT_CACHE_DIR, f"{key}.pdf")
+
+
+def load_report(key, cache_dir=None):
+    """
+    Get a previously generated report from the disk cache.
+
+    Parameters:
+    -----------
+    key : str
+        Report key from report_key
+    cache_dir : str, optional
+        Cache directory (default: DEFAULT_CACHE_DIR)
+
+    Returns:
+    --------
+    bytes or None
+        PDF file as bytes, or None if the report is not cached
+    """
+    report_file = _report_file(key, cache_dir)
+    try:
+        with open(report_file, 'rb') as f:
+            pdf_bytes = f.read()
+        # Mark as recently used for eviction
+        os.utime(report_file)
+    except OSError:
+        return None
+
+    return pdf_bytes
+
+
+def store_report(key, pdf_bytes, cache_dir=None, max_bytes=DEFAULT_MAX_BYTES):
+    """
+    Write a report to the disk cache and evict least recently used reports
+    until the cache fits in max_bytes.
+
+    Parameters:
+    -----------
+    key : str
+        Report key from report_key
+    pdf_bytes : bytes
+        PDF file as bytes
+    cache_dir : str, optional
+        Cache directory (default: DEFAULT_CACHE_DIR)
+    max_bytes : int
+        Maximum total size of the cache in bytes
+
+    Returns:
+    --------
+    bool
+        True if the report was written
+    """
+    report_file = _report_file(key, cache_dir)
+    tmp_file = f"{report_file}.{os.getpid()}.tmp"
+    try:
+        os.makedirs(os.path.dirname(report_file), exist_ok=True)
+        with open(tmp_file, 'wb') as f:
+            f.write(pdf_bytes)
+        os.replace(tmp_file, report_file)
+    except OSError:
+        # An unwritable cache directory simply means no caching
+        return False
+
+    evict_reports(cache_dir, max_bytes)
+    return True
+
+
+def evict_reports(cache_dir=None, max_bytes=DEFAULT_MAX_BYTES, suffixes=('.pdf',), keep=()):
+    """
+    Delete least recently used reports until the cache fits in max_bytes.
+
+    Parameters:
+    -----------
+    cache_dir : str, optional
+        Cache directory (default: DEFAULT_CACHE_DIR)
+    max_bytes : int
+        Maximum total size of the cache in bytes
+    suffixes : tuple
+        File name suffixes of the cached files
+    keep : iterable, optional
+        Paths that are in use and must not be deleted
+    """
+    cache_dir = cache_dir or DEFAULT_CACHE_DIR
+    keep = {os.path.abspath(path) for path in keep}
+
+    entries = []
+    try:
+        with os.scandir(cache_dir) as it:
+            for entry in it:
+                if entry.name.endswith(tuple(suffixes)):
+                    stat = entry.stat()
+                    entries.append((stat.st_mtime_ns, stat.st_size, entry.path))
+    except OSError:
+        return
+
+    total = sum(size for _, size, _ in entries)
+    for _, size, path in sorted(entries):
+        if total <= max_bytes:
+            break
+        if os.path.abspath(path) in keep:
+            continue
+        try:
+            os.remove(path)
+        except OSError:
+            continue
+        total -= size
+
+
+def _cache_key(generator, kwargs):
+    # Reports are stamped with the day they are generated, so a cached
+    # report is only served on that day
+    today = datetime.now().strftime('%Y-%m-%d')
+    return hashlib.sha256(f"{report_key(generator, **kwargs)}|{today}".encode('utf-8')).hexdigest()
+
+
+def find_report(generator, cache_dir=None, **kwargs):
+    """
+    Get the report cached_report would serve, without generating it.
+
+    Parameters:
+    -----------
+    generator : callable
+        PDF generator function, e.g. generate_in_game_decision_pdf
+    cache_dir : str, optional
+        Cache directory (default: DEFAULT_CACHE_DIR)
+    **kwargs
+        Keyword arguments the generator would be called with
+
+    Returns:
+    --------
+    bytes or None
+        PDF file as bytes, or None if the report is not cached
+    """
+    return load_report(_cache_key(generator, kwargs), cache_dir)
+
+
+def cached_report(generator, cache_dir=None, max_bytes=DEFAULT_MAX_BYTES, **kwargs):
+    """
+    Get a report from the disk cache, generating and caching it on a miss.
+
+    Only reports the generator returns are cached; if it raises, e.g. because
+    a figure could not be rendered, nothing is stored and the error propagates.
+    Reports carry the date they were generated on, so cached reports are
+    regenerated on the next day.
+
+    Parameters:
+    -----------
+    generator : callable
+        PDF generator function, e.g. generate_in_game_decision_pdf
+    cache_dir : str, optional
+        Cache directory (default: DEFAULT_CACHE_DIR)
+    max_bytes : int
+        Maximum total size of the cache in bytes
+    **kwargs
+        Keyword arguments passed to the generator
+
+    Returns:
+    --------
+    bytes
+        PDF file as bytes
+    """
+    key = _cache_key(generator, kwargs)
+
+    pdf_bytes = load_report(key, cache_dir)
+    if pdf_bytes is None:
+        pdf_bytes = generator(**kwargs)
+        store_report(key, pdf_bytes, cache_dir, max_bytes)
+
+    return pdf_bytes
@@ -1,12 +1,44 @@
+import copy
+from functools import lru_cache
+
 import numpy as np
 import matplotlib.pyplot as plt
 import plotly.graph_objects as go
 from plotly.subplots import make_subplots
 
+# Pitch dimensions in meters and the pressing map grid (length x width cells)
+PITCH_LENGTH = 105
+PITCH_WIDTH = 68
+PRESSING_GRID = (50, 30)
+
+# Pressure field sample points (length x width) and decay of pressure with
+# distance from an opponent (per meter)
+PRESSURE_GRID = (50, 30)
+PRESSURE_DECAY = 0.05
+
+# Simulated opponent positions for low (1-3), medium (4-7) and high (8-10)
+# pressure, used by plot_pressure_heatmap
+PRESSURE_LAYOUTS = {
+    'low': [(25, 34), (30, 20), (30, 48)],
+    'medium': [(15, 34), (20, 20), (20, 48)],
+    'high': [(8, 34), (12, 20), (12, 48)],
+}
+PRESSURE_ROLES = ["Forward", "Winger", "Winger"]
+
+# Pass maps draw individual passes up to PASS_MAP_MAX_SEGMENTS and aggregate
+# larger sets into flows between PASS_FLOW_BINS zones (length x width)
+PASS_MAP_MAX_SEGMENTS = 2000
+PASS_FLOW_BINS = (12, 8)
+PASS_FLOW_WIDTHS = (1, 2, 4, 7)
+PASS_OUTCOMES = [(True, "Completed", "#2ecc71"), (False, "Incomplete", "#e74c3c")]
+
 def create_pitch(width=700, height=500, pitch_color='#1e3a5f', line_color='white'):
     """
     Create a football pitch visualization using Plotly
     
+    The pitch is built once per size and color combination; each call returns
+    an independent copy that can be modified freely.
+    
     Args:
         width: Width of the pitch in pixels
         height: Height of the pitch in pixels
@@ -16,6 +48,16 @@ def create_pitch(width=700, height=500, pitch_color='#1e3a5f', line_color='white
     Returns:
         Plotly figure object with pitch
     """
+    return go.Figure(copy.deepcopy(_base_pitch(width, height, pitch_color, line_color)))
+
+@lru_cache(maxsize=32)
+def _base_pitch(width, height, pitch_color, line_color):
+    """
+    Build the pitch figure for a size and color combination
+    
+    Returns:
+        Figure dict of the pitch, without the layout template
+    """
     # Create figure
     fig = go.Figure()
     
@@ -132,68 +174,164 @@ def create_pitch(width=700, height=500, pitch_color='#1e3a5f', line_color='white
         )
     )
     
-    return fig
+    # Leave out the default template, which makes up most of the dict and
+    # its validation; go.Figure applies it again when the copy is built
+    fig_dict = fig.to_dict()
+    fig_dict['layout'].pop('template', None)
+    return fig_dict
 
-def plot_pressure_heatmap(fig, pressure_level, goalkeeper_position=(5, 34)):
+def pressure_layout(pressure_level):
     """
-    Add a pressure heatmap to the pitch visualization
+    Get the simulated opponent positions for a pressure level
     
     Args:
-        fig: Plotly figure with pitch
         pressure_level: Intensity of pressure (1-10)
-        goalkeeper_position: (x, y) coordinates of goalkeeper
         
     Returns:
-        Updated Plotly figure
+        List of (x, y) opponent positions
     """
-    # Create a grid of points
-    x = np.linspace(0, 105, 50)
-    y = np.linspace(0, 68, 30)
-    X, Y = np.meshgrid(x, y)
-    
-    # Calculate pressure intensity based on distance from opponents
-    # Simulate opponent positions based on pressure level
     if pressure_level <= 3:
-        # Low pressure - opponents far away
-        opponent_positions = [(25, 34), (30, 20), (30, 48)]
-        opponent_roles = ["Forward", "Winger", "Winger"]
-    elif pressure_level <= 7:
-        # Medium pressure - opponents closer
-        opponent_positions = [(15, 34), (20, 20), (20, 48)]
-        opponent_roles = ["Forward", "Winger", "Winger"]
-    else:
-        # High pressure - opponents very close
-        opponent_positions = [(8, 34), (12, 20), (12, 48)]
-        opponent_roles = ["Forward", "Winger", "Winger"]
-    
-    # Calculate pressure intensity at each point
-    Z = np.zeros_like(X)
-    for op_x, op_y in opponent_positions:
-        # Distance from opponent to each point
-        distance = np.sqrt((X - op_x)**2 + (Y - op_y)**2)
-        # Pressure intensity decreases with distance
-        intensity = pressure_level * np.exp(-0.05 * distance)
-        Z += intensity
+        return PRESSURE_LAYOUTS['low']
+    if pressure_level <= 7:
+        return PRESSURE_LAYOUTS['medium']
+    return PRESSURE_LAYOUTS['high']
+
+def pressure_field(opponent_positions, weights=None, decay=PRESSURE_DECAY, grid=PRESSURE_GRID):
+    """
+    Compute the pressure exerted by any number of opponents over the pitch
+    
+    Pressure from each opponent decays exponentially with distance. All
+    opponents are evaluated in one broadcasted computation, and results are
+    memoized per set of positions, so repeated calls are free.
+    
+    Args:
+        opponent_positions: Sequence of (x, y) opponent positions
+        weights: Optional pressure weight of each opponent
+        decay: Decay of pressure per meter of distance
+        grid: Number of sample points along the length and width
+        
+    Returns:
+        Tuple (x, y, Z) of sample coordinates and the read-only pressure
+        field of shape (len(y), len(x)), scaled to a maximum of 1
+    """
+    positions = tuple(tuple(float(v) for v in pos) for pos in opponent_positions)
+    if weights is not None:
+        weights = tuple(float(w) for w in weights)
+    return _pressure_field(positions, weights, float(decay), tuple(grid))
+
+@lru_cache(maxsize=64)
+def _pressure_field(positions, weights, decay, grid):
+    x = np.linspace(0, PITCH_LENGTH, grid[0])
+    y = np.linspace(0, PITCH_WIDTH, grid[1])
+    x.flags.writeable = False
+    y.flags.writeable = False
+    
+    if not positions:
+        Z = np.zeros((grid[1], grid[0]))
+        Z.flags.writeable = False
+        return x, y, Z
+    
+    opponents = np.asarray(positions).reshape(-1, 2)
+    
+    # (opponents, width, length) distances in one broadcast
+    dx = x[None, None, :] - opponents[:, 0, None, None]
+    dy = y[None, :, None] - opponents[:, 1, None, None]
+    intensity = np.exp(-decay * np.hypot(dx, dy))
+    
+    if weights is not None:
+        intensity *= np.asarray(weights)[:, None, None]
+    
+    Z = intensity.sum(axis=0)
     
     # Normalize Z values
-    Z = Z / Z.max()
+    peak = Z.max()
+    if peak > 0:
+        Z /= peak
+    Z.flags.writeable = False
+    
+    return x, y, Z
+
+def add_pressure_field(fig, opponent_positions, weights=None, opacity=0.7, name="Pressure Intensity"):
+    """
+    Add the pressure field of a set of opponents to the pitch visualization
+    
+    Args:
+        fig: Plotly figure with pitch
+        opponent_positions: Sequence of (x, y) opponent positions
+        weights: Optional pressure weight of each opponent
+        opacity: Opacity of the contour layer
+        name: Trace name
+        
+    Returns:
+        Updated Plotly figure
+    """
+    x, y, Z = pressure_field(opponent_positions, weights)
     
-    # Add heatmap to figure
     fig.add_trace(go.Contour(
         z=Z,
         x=x,
         y=y,
         colorscale='Hot_r',
-        opacity=0.7,
+        opacity=opacity,
         showscale=False,
         contours=dict(
             start=0,
             end=1,
             size=0.1,
         ),
-        name="Pressure Intensity"
+        name=name
     ))
     
+    return fig
+
+def add_decision_surface(fig, surface, opacity=0.6, name="Pass Value"):
+    """
+    Add a distribution decision surface to the pitch visualization
+    
+    Args:
+        fig: Plotly figure with pitch
+        surface: Output of decision_engine.decision_surface
+        opacity: Opacity of the heatmap layer
+        name: Trace name
+        
+    Returns:
+        Updated Plotly figure
+    """
+    fig.add_trace(go.Heatmap(
+        z=surface['value'],
+        x=surface['x'],
+        y=surface['y'],
+        customdata=surface['success'],
+        colorscale='RdYlGn',
+        zmid=0,
+        opacity=opacity,
+        colorbar=dict(title=dict(text=name, side="right")),
+        hovertemplate="Value: %{z:.3f}<br>Completion: %{customdata:.0%}<extra></extra>",
+        name=name
+    ))
+    
+    return fig
+
+def plot_pressure_heatmap(fig, pressure_level, goalkeeper_position=(5, 34)):
+    """
+    Add a pressure heatmap to the pitch visualization
+    
+    Args:
+        fig: Plotly figure with pitch
+        pressure_level: Intensity of pressure (1-10)
+        goalkeeper_position: (x, y) coordinates of goalkeeper
+        
+    Returns:
+        Updated Plotly figure
+    """
+    # Simulate opponent positions based on pressure level
+    opponent_positions = pressure_layout(pressure_level)
+    opponent_roles = PRESSURE_ROLES
+    
+    # Add heatmap to figure; the normalized field does not depend on the
+    # pressure level itself, only on where the opponents stand
+    add_pressure_field(fig, opponent_positions)
+    
     # Add goalkeeper position
     fig.add_trace(go.Scatter(
         x=[goalkeeper_position[0]],
@@ -229,6 +367,124 @@ def plot_pressure_heatmap(fig, pressure_level, goalkeeper_position=(5, 34)):
     
     return fig
 
+def add_markers(fig, points, name=None, textposition="top center", showlegend=True):
+    """
+    Add a set of player markers to the pitch visualization as a single trace
+    
+    Styling is given per point, so any number of players costs one trace.
+    
+    Args:
+        fig: Plotly figure with pitch
+        points: List of dicts with 'pos' (x, y) and optional 'color', 'size',
+            'symbol', 'outline', 'outline_width', 'text' and 'hover'
+        name: Legend name of the trace
+        textposition: Position of the labels relative to the markers
+        showlegend: Whether to show the trace in the legend
+        
+    Returns:
+        Updated Plotly figure
+    """
+    if not points:
+        return fig
+    
+    text = [point.get('text', '') for point in points]
+    hover = [point.get('hover', point.get('text', '')) for point in points]
+    
+    fig.add_trace(go.Scatter(
+        x=[point['pos'][0] for point in points],
+        y=[point['pos'][1] for point in points],
+        mode='markers+text' if any(text) else 'markers',
+        marker=dict(
+            color=[point.get('color', 'blue') for point in points],
+            size=[point.get('size', 12) for point in points],
+            symbol=[point.get('symbol', 'circle') for point in points],
+            line=dict(
+                color=[point.get('outline', 'white') for point in points],
+                width=[point.get('outline_width', 1) for point in points]
+            )
+        ),
+        text=text,
+        textposition=textposition,
+        hovertext=hover,
+        hovertemplate="%{hovertext}<extra></extra>",
+        name=name,
+        showlegend=showlegend and name is not None
+    ))
+    
+    return fig
+
+def add_labels(fig, labels, font_color="white", font_size=10):
+    """
+    Add text labels to the pitch visualization as a single trace
+    
+    Args:
+        fig: Plotly figure with pitch
+        labels: List of dicts with 'pos' (x, y) and 'text'
+        font_color: Label color
+        font_size: Label size
+        
+    Returns:
+        Updated Plotly figure
+    """
+    if not labels:
+        return fig
+    
+    fig.add_trace(go.Scatter(
+        x=[label['pos'][0] for label in labels],
+        y=[label['pos'][1] for label in labels],
+        mode='text',
+        text=[label['text'] for label in labels],
+        textfont=dict(size=font_size, color=font_color),
+        hoverinfo='skip',
+        showlegend=False
+    ))
+    
+    return fig
+
+def add_passing_lines(fig, lines):
+    """
+    Add passing lines to the pitch visualization
+    
+    A Plotly line has a single color, width and dash, so lines are packed
+    into one trace per distinct style, with None separating the segments.
+    
+    Args:
+        fig: Plotly figure with pitch
+        lines: List of dicts with 'start' and 'end' (x, y) and optional
+            'color', 'width', 'dash', 'hover' and 'legend' (legend entry
+            shared by all lines with the same value)
+        
+    Returns:
+        Updated Plotly figure
+    """
+    groups = {}
+    for line in lines:
+        style = (line.get('legend'), line.get('color', 'white'), line.get('width', 2), line.get('dash'))
+        groups.setdefault(style, []).append(line)
+    
+    legend_shown = set()
+    for (legend, color, width, dash), group in groups.items():
+        x, y, hover = [], [], []
+        for line in group:
+            x.extend((line['start'][0], line['end'][0], None))
+            y.extend((line['start'][1], line['end'][1], None))
+            hover.extend((line.get('hover', ''),) * 2 + (None,))
+        
+        fig.add_trace(go.Scatter(
+            x=x,
+            y=y,
+            mode='lines',
+            line=dict(color=color, width=width, dash=dash),
+            hovertext=hover,
+            hovertemplate="%{hovertext}<extra></extra>",
+            name=legend,
+            legendgroup=legend,
+            showlegend=legend is not None and legend not in legend_shown
+        ))
+        legend_shown.add(legend)
+    
+    return fig
+
 def plot_distribution_options(fig, options, goalkeeper_position=(5, 34)):
     """
     Add distribution options to the pitch visualization
@@ -250,7 +506,9 @@ def plot_distribution_options(fig, options, goalkeeper_position=(5, 34)):
         "Striker": (60, 34)
     }
     
-    # Add passing lines and targets
+    # Collect passing lines and targets, drawn as one batch
+    lines = []
+    targets = []
     for option in options:
         target = option["target"]
         if target in target_positions:
@@ -263,43 +521,80 @@ def plot_distribution_options(fig, options, goalkeeper_position=(5, 34)):
             g = max(0, min(255, int(255 * value)))
             color = f'rgb({r},{g},0)'
             
-            # Add passing line
-            fig.add_trace(go.Scatter(
-                x=[goalkeeper_position[0], target_pos[0]],
-                y=[goalkeeper_position[1], target_pos[1]],
-                mode='lines',
-                line=dict(
-                    color=color,
-                    width=3,
-                    dash='solid' if value > 0.5 else 'dash'
-                ),
-                name=f'{target} (xT-GK: {value:.2f})'
-            ))
+            # Lines sharing a color share a trace, so snap the line color
+            # to steps of 0.1; the target marker keeps the exact color
+            step = round(value, 1)
+            r = max(0, min(255, int(255 * (1 - step))))
+            g = max(0, min(255, int(255 * step)))
             
-            # Add target position
-            fig.add_trace(go.Scatter(
-                x=[target_pos[0]],
-                y=[target_pos[1]],
-                mode='markers+text',
-                marker=dict(
-                    color=color,
-                    size=12,
-                    symbol='circle',
-                    line=dict(color='white', width=1)
-                ),
-                text=target,
-                textposition="top center",
-                name=target
-            ))
+            lines.append({
+                "start": goalkeeper_position,
+                "end": target_pos,
+                "color": f'rgb({r},{g},0)',
+                "width": 3,
+                "dash": 'solid' if value > 0.5 else 'dash',
+                "hover": f'{target} (xT-GK: {value:.2f})'
+            })
+            targets.append({
+                "pos": target_pos,
+                "color": color,
+                "text": target,
+                "hover": f'{target} (xT-GK: {value:.2f})'
+            })
+    
+    add_passing_lines(fig, lines)
+    add_markers(fig, targets, name="Distribution Targets")
     
     return fig
 
+@lru_cache(maxsize=16)
+def _smoothing_matrix(size, sigma):
+    """
+    Gaussian smoothing along one axis of a grid, as a (size, size) matrix
+    
+    Rows are renormalized after truncating the kernel at the grid edges, so
+    pressure near the touchlines is not smoothed off the pitch.
+    """
+    offsets = np.arange(size)[:, None] - np.arange(size)[None, :]
+    kernel = np.exp(-0.5 * (offsets / sigma) ** 2)
+    kernel[np.abs(offsets) > 3 * sigma] = 0
+    kernel /= kernel.sum(axis=1, keepdims=True)
+    kernel.flags.writeable = False
+    return kernel
+
+def pressing_surface(x, y, bins=PRESSING_GRID, sigma=1.5):
+    """
+    Compute a pressing intensity surface from pressure locations
+    
+    Args:
+        x: Pressure locations along the pitch length in meters
+        y: Pressure locations along the pitch width in meters
+        bins: Number of grid cells along the length and width
+        sigma: Width of the Gaussian smoothing kernel in grid cells
+        
+    Returns:
+        Array of shape (width cells, length cells) scaled to [0, 1]
+    """
+    counts, _, _ = np.histogram2d(
+        np.asarray(x, dtype=float), np.asarray(y, dtype=float),
+        bins=bins, range=[[0, PITCH_LENGTH], [0, PITCH_WIDTH]]
+    )
+    
+    # Separable smoothing: one matrix product per axis
+    surface = _smoothing_matrix(bins[0], sigma) @ counts @ _smoothing_matrix(bins[1], sigma).T
+    
+    peak = surface.max()
+    if peak > 0:
+        surface /= peak
+    return surface.T
+
 def create_opposition_heatmap(pressing_data):
     """
     Create a heatmap of opposition pressing intensity
     
     Args:
-        pressing_data: DataFrame with pressing data
+        pressing_data: Pressing surface from pressing_surface, or pressure
+            locations in meters as a mapping/DataFrame with 'x' and 'y'
         
     Returns:
         Plotly figure with heatmap
@@ -307,35 +602,14 @@ def create_opposition_heatmap(pressing_data):
     # Create pitch
     fig = create_pitch()
     
-    # Create a grid of points
-    x = np.linspace(0, 105, 50)
-    y = np.linspace(0, 68, 30)
-    X, Y = np.meshgrid(x, y)
-    
-    # Simulate pressing intensity data
-    Z = np.zeros_like(X)
-    
-    # Add some pressing hotspots
-    for i in range(len(X)):
-        for j in range(len(X[0])):
-            # Higher intensity in wide areas of defensive third
-            if X[i][j] < 35:
-                if Y[i][j] < 20 or Y[i][j] > 48:
-                    Z[i][j] += 0.8
-                else:
-                    Z[i][j] += 0.4
-            # Medium intensity in middle third
-            elif X[i][j] < 70:
-                Z[i][j] += 0.5
-            # Lower intensity in attacking third
-            else:
-                Z[i][j] += 0.2
-    
-    # Add some random variation
-    Z += np.random.rand(*Z.shape) * 0.3
+    if isinstance(pressing_data, np.ndarray) and pressing_data.ndim == 2:
+        Z = pressing_data
+    else:
+        Z = pressing_surface(pressing_data['x'], pressing_data['y'])
     
-    # Normalize Z values
-    Z = Z / Z.max()
+    # Grid cell centres
+    x = (np.arange(Z.shape[1]) + 0.5) * PITCH_LENGTH / Z.shape[1]
+    y = (np.arange(Z.shape[0]) + 0.5) * PITCH_WIDTH / Z.shape[0]
     
     # Add heatmap to figure
     fig.add_trace(go.Contour(
@@ -351,9 +625,7 @@ def create_opposition_heatmap(pressing_data):
             size=0.1,
         ),
         colorbar=dict(
-            title="Pressing<br>Intensity",
-            titleside="right",
-            titlefont=dict(size=14),
+            title=dict(text="Pressing<br>Intensity", side="right", font=dict(size=14)),
             tickvals=[0, 0.5, 1],
             ticktext=["Low", "Medium", "High"]
         ),
@@ -362,6 +634,180 @@ def create_opposition_heatmap(pressing_data):
     
     return fig
 
+def _segments(x, y, end_x, end_y):
+    """
+    Interleave segment start and end points with NaN gaps, so that any number
+    of segments can be drawn as a single line trace
+    """
+    gap = np.full(len(x), np.nan)
+    return np.column_stack([x, end_x, gap]).ravel(), np.column_stack([y, end_y, gap]).ravel()
+
+def _zone(x, y, bins):
+    """Index of the flow zone containing each location"""
+    i = np.clip((x * (bins[0] / PITCH_LENGTH)).astype(int), 0, bins[0] - 1)
+    j = np.clip((y * (bins[1] / PITCH_WIDTH)).astype(int), 0, bins[1] - 1)
+    return i * bins[1] + j
+
+def pass_flows(x, y, end_x, end_y, completed, bins=PASS_FLOW_BINS):
+    """
+    Aggregate passes into flows between pitch zones
+    
+    Args:
+        x, y: Pass start locations in meters
+        end_x, end_y: Pass end locations in meters
+        completed: Whether each pass was completed
+        bins: Number of zones along the length and width
+        
+    Returns:
+        Dictionary of arrays with one entry per flow: mean start and end
+        location ('x', 'y', 'end_x', 'end_y'), 'count' and 'completion'
+    """
+    x, y, end_x, end_y = (np.asarray(v, dtype=float) for v in (x, y, end_x, end_y))
+    
+    num_zones = bins[0] * bins[1]
+    route = _zone(x, y, bins) * num_zones + _zone(end_x, end_y, bins)
+    _, flow, count = np.unique(route, return_inverse=True, return_counts=True)
+    flow = flow.ravel()
+    
+    def mean(values):
+        return np.bincount(flow, weights=values, minlength=len(count)) / count
+    
+    return {
+        'x': mean(x),
+        'y': mean(y),
+        'end_x': mean(end_x),
+        'end_y': mean(end_y),
+        'count': count,
+        'completion': mean(np.asarray(completed, dtype=float))
+    }
+
+def create_pass_map(passes, title=None, max_segments=PASS_MAP_MAX_SEGMENTS, bins=PASS_FLOW_BINS):
+    """
+    Create a map of goalkeeper passes
+    
+    Up to max_segments passes are drawn individually, one WebGL trace per
+    outcome. Larger sets are aggregated into flows between pitch zones, drawn
+    as arrows whose width shows the number of passes and whose head color
+    shows the completion rate.
+    
+    Args:
+        passes: Mapping/DataFrame with 'x', 'y', 'end_x', 'end_y' in meters
+            and 'completed'
+        title: Optional figure title
+        max_segments: Largest number of passes drawn individually
+        bins: Number of flow zones along the length and width
+        
+    Returns:
+        Plotly figure with pass map
+    """
+    fig = create_pitch()
+    
+    x, y, end_x, end_y = (np.asarray(passes[key], dtype=float) for key in ('x', 'y', 'end_x', 'end_y'))
+    completed = np.asarray(passes['completed'], dtype=bool)
+    
+    valid = np.isfinite(x) & np.isfinite(y) & np.isfinite(end_x) & np.isfinite(end_y)
+    x, y, end_x, end_y, completed = x[valid], y[valid], end_x[valid], end_y[valid], completed[valid]
+    
+    if len(x) <= max_segments:
+        for outcome, name, color in PASS_OUTCOMES:
+            selected = completed == outcome
+            seg_x, seg_y = _segments(x[selected], y[selected], end_x[selected], end_y[selected])
+            fig.add_trace(go.Scattergl(
+                x=seg_x,
+                y=seg_y,
+                mode='lines',
+                line=dict(color=color, width=1),
+                opacity=0.6,
+                hoverinfo='skip',
+                name=f"{name} ({int(selected.sum())})"
+            ))
+    else:
+        flows = pass_flows(x, y, end_x, end_y, completed, bins)
+        count = flows['count']
+        
+        # Flow lines: one trace per width class, by share of the busiest flow
+        width_class = np.minimum((count / count.max() * len(PASS_FLOW_WIDTHS)).astype(int), len(PASS_FLOW_WIDTHS) - 1)
+        for level, width in enumerate(PASS_FLOW_WIDTHS):
+            selected = width_class == level
+            if not selected.any():
+                continue
+            seg_x, seg_y = _segments(flows['x'][selected], flows['y'][selected],
+                                     flows['end_x'][selected], flows['end_y'][selected])
+            fig.add_trace(go.Scattergl(
+                x=seg_x,
+                y=seg_y,
+                mode='lines',
+                line=dict(color='rgba(255, 255, 255, 0.6)', width=width),
+                hoverinfo='skip',
+                showlegend=False
+            ))
+        
+        # Arrow heads pointing along each flow, colored by completion rate
+        angle = np.degrees(np.arctan2(flows['end_x'] - flows['x'], flows['end_y'] - flows['y']))
+        fig.add_trace(go.Scattergl(
+            x=flows['end_x'],
+            y=flows['end_y'],
+            mode='markers',
+            marker=dict(
+                symbol='triangle-up',
+                angle=angle,
+                size=8 + 10 * np.sqrt(count / count.max()),
+                color=flows['completion'],
+                colorscale='RdYlGn',
+                cmin=0,
+                cmax=1,
+                colorbar=dict(title=dict(text="Completion", side="right"))
+            ),
+            customdata=np.column_stack([count, flows['completion']]),
+            hovertemplate="%{customdata[0]:.0f} passes<br>%{customdata[1]:.0%} completed<extra></extra>",
+            name=f"Pass flows ({len(x)} passes)"
+        ))
+    
+    if title:
+        fig.update_layout(title=title)
+    
+    return fig
+
+def create_team_shape_diagram(shape):
+    """
+    Create a diagram of a team's average positions and goalkeeper pass volumes
+    
+    Args:
+        shape: DataFrame from data_service.get_team_shape with 'player_name',
+            'position', 'x', 'y', 'gk_passes' and 'is_goalkeeper'
+        
+    Returns:
+        Plotly figure with team shape diagram
+    """
+    fig = create_pitch()
+    
+    goalkeeper = shape[shape['is_goalkeeper']]
+    outfield = shape[~shape['is_goalkeeper']]
+    
+    # Goalkeeper passes to each player, line width by share of the busiest lane
+    if not goalkeeper.empty:
+        gk_pos = (goalkeeper['x'].iat[0], goalkeeper['y'].iat[0])
+        most_passes = max(outfield['gk_passes'].max(), 1)
+        fig = add_passing_lines(fig, [{
+            "start": gk_pos,
+            "end": (row.x, row.y),
+            "color": 'rgba(0, 255, 255, 0.6)',
+            "width": 1 + round(7 * row.gk_passes / most_passes),
+            "hover": f"{row.gk_passes} GK passes to {row.player_name}",
+            "legend": "GK Passes"
+        } for row in outfield.itertuples() if row.gk_passes > 0])
+    
+    fig = add_markers(fig, [{
+        "pos": (row.x, row.y),
+        "color": 'cyan' if row.is_goalkeeper else 'blue',
+        "size": 15,
+        "outline_width": 2,
+        "text": str(row.player_name).split()[-1],
+        "hover": f"{row.player_name} ({row.position}): {row.events} events"
+    } for row in shape.itertuples()], name="Average Positions")
+    
+    return fig
+
 def create_team_coordination_diagram(formation, build_up_pattern):
     """
     Create a diagram showing team coordination for build-up play
@@ -527,5 +973,57 @@ def create_team_coordination_diagram(formation, build_up_pattern):
                 name="Primary Build-up"
             ))
             fig.add_trace(go.Scatter(
-                x=[positions["RCB"][0]
-(Content truncated due to size limit. Use line ranges to read in chunks)
\ No newline at end of file
+                x=[positions["RCB"][0], positions["RDM"][0]],
+                y=[positions["RCB"][1], positions["RDM"][1]],
+                mode='lines+markers',
+                line=dict(color='green', width=3),
+                marker=dict(size=0),
+                showlegend=False
+            ))
+    
+    return fig
+
+
+def create_radar_chart(gk_data, comparison_data=None):
+    """
+    Create a radar chart of goalkeeper distribution attributes
+    
+    Args:
+        gk_data: Dictionary mapping attribute names to values between 0 and 1
+        comparison_data: Optional dictionary with the same attributes, e.g. a
+            league average or team requirements, drawn as a second trace
+        
+    Returns:
+        Plotly figure with radar chart
+    """
+    categories = list(gk_data)
+    
+    # Repeat the first attribute to close each polygon
+    theta = categories + categories[:1]
+    
+    fig = go.Figure()
+    fig.add_trace(go.Scatterpolar(
+        r=[gk_data[category] for category in theta],
+        theta=theta,
+        fill='toself',
+        name="Goalkeeper",
+        line=dict(color='cyan')
+    ))
+    
+    if comparison_data is not None:
+        fig.add_trace(go.Scatterpolar(
+            r=[comparison_data.get(category, 0) for category in theta],
+            theta=theta,
+            fill='toself',
+            name="Comparison",
+            line=dict(color='orange', dash='dash'),
+            opacity=0.6
+        ))
+    
+    fig.update_layout(
+        polar=dict(radialaxis=dict(visible=True, range=[0, 1])),
+        showlegend=True,
+        height=450
+    )
+    
+    return fig
@@ -1,4 +1,3 @@
-```python
 # xT-GK Analyzer - Python Implementation
 # © 2025 xT-GK Project
 
@@ -9,15 +8,25 @@ import seaborn as sns
 from matplotlib.patches import Rectangle, Arc
 import json
 import os
+import threading
+import tempfile
+from scipy import sparse
 from typing import Dict, List, Tuple, Optional, Union
 
+# Version of the fitted xT model. Bump this whenever fit_base_values changes
+# so that persisted artifacts from older fits are not reused.
+XT_MODEL_VERSION = 1
+
 class XtGkAnalyzer:
     """
     A comprehensive analyzer for calculating and visualizing xT-GK metrics
     for goalkeeper offensive contributions.
     """
     
-    def __init__(self, pitch_dimensions: Tuple[int, int] = (105, 68)):
+    def __init__(self, pitch_dimensions: Tuple[int, int] = (105, 68),
+                 base_values_path: Optional[str] = None,
+                 grid_resolution: Tuple[int, int] = (12, 8),
+                 interpolate: bool = False):
         """
         Initialize the xT-GK analyzer.
         
@@ -25,11 +34,50 @@ class XtGkAnalyzer:
         -----------
         pitch_dimensions : tuple
             Dimensions of the pitch in meters (length, width)
+        base_values_path : str, optional
+            Path to an xT grid saved with ``save_base_values``. When given, the
+            fitted grid is used instead of the handcrafted base values.
+        grid_resolution : tuple, optional
+            Number of zones along the length and width of the pitch
+        interpolate : bool, optional
+            Bilinearly interpolate zone values between zone centres instead
+            of using the value of the zone containing each location
         """
         self.pitch_dimensions = pitch_dimensions
-        self.zone_grid = self._create_zone_grid(12, 8)  # 12x8 grid for pitch zones
-        self.base_values = self._initialize_base_values()
+        self.interpolate = interpolate
+        self.zone_grid = self._create_zone_grid(*grid_resolution)
+        self._base_values = None
+        self._pending_base_values = None
+        # Reentrant, as resolving the grid assigns it through the setter
+        self._base_values_lock = threading.RLock()
+        if base_values_path is not None:
+            self.base_values = self.load_base_values(base_values_path)
+        else:
+            self.base_values = self._initialize_base_values()
         
+    @property
+    def base_values(self) -> np.ndarray:
+        """
+        xT values for each zone, resolved on first use when a fitted model
+        has been attached with ``use_fitted_base_values``.
+        """
+        with self._base_values_lock:
+            resolve = self._pending_base_values
+            if resolve is not None:
+                # Other threads wait for the grid instead of reading the
+                # handcrafted values, and a failed fit is retried next time
+                base_values = resolve()
+                if self._pending_base_values is resolve:
+                    self._pending_base_values = None
+                self._base_values = base_values
+            return self._base_values
+    
+    @base_values.setter
+    def base_values(self, values: np.ndarray) -> None:
+        with self._base_values_lock:
+            self._pending_base_values = None
+            self._base_values = values
+    
     def _create_zone_grid(self, length_zones: int, width_zones: int) -> np.ndarray:
         """
         Create a grid of zones for the pitch.
@@ -73,6 +121,295 @@ class XtGkAnalyzer:
         
         return base_values
     
+    def _zone_indices(self, x: np.ndarray, y: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Map pitch coordinates to (length, width) zone indices of the grid.
+        
+        Works on whole arrays of locations at once, so the cost per event does
+        not depend on the grid resolution.
+        """
+        length_zones, width_zones = self.zone_grid.shape
+        zone_x = np.trunc(np.asarray(x, dtype=float) / self.pitch_dimensions[0] * length_zones).astype(np.int64)
+        zone_y = np.trunc(np.asarray(y, dtype=float) / self.pitch_dimensions[1] * width_zones).astype(np.int64)
+        return (
+            np.clip(zone_x, 0, length_zones - 1),
+            np.clip(zone_y, 0, width_zones - 1)
+        )
+    
+    def _zone_values(self, x: np.ndarray, y: np.ndarray) -> np.ndarray:
+        """
+        Look up xT values for arrays of pitch coordinates.
+        
+        Uses the value of the containing zone, or a bilinear interpolation
+        between the four surrounding zone centres when ``interpolate`` is set.
+        """
+        base_values = self.base_values
+        
+        if not self.interpolate:
+            zone_x, zone_y = self._zone_indices(x, y)
+            return base_values[zone_x, zone_y]
+        
+        length_zones, width_zones = base_values.shape
+        
+        # Continuous position in zone units, measured from the first zone centre
+        position_x = np.clip(
+            np.asarray(x, dtype=float) / self.pitch_dimensions[0] * length_zones - 0.5, 0, length_zones - 1
+        )
+        position_y = np.clip(
+            np.asarray(y, dtype=float) / self.pitch_dimensions[1] * width_zones - 0.5, 0, width_zones - 1
+        )
+        
+        x0 = np.floor(position_x).astype(np.int64)
+        y0 = np.floor(position_y).astype(np.int64)
+        x1 = np.minimum(x0 + 1, length_zones - 1)
+        y1 = np.minimum(y0 + 1, width_zones - 1)
+        weight_x = position_x - x0
+        weight_y = position_y - y0
+        
+        return (
+            base_values[x0, y0] * (1 - weight_x) * (1 - weight_y)
+            + base_values[x1, y0] * weight_x * (1 - weight_y)
+            + base_values[x0, y1] * (1 - weight_x) * weight_y
+            + base_values[x1, y1] * weight_x * weight_y
+        )
+    
+    def fit_base_values(self, events: pd.DataFrame, max_iter: int = 100,
+                        tol: float = 1e-6) -> np.ndarray:
+        """
+        Fit the xT grid from event data with a Markov value iteration.
+        
+        For every zone, the probabilities of shooting and of moving the ball
+        (pass or carry) are estimated along with the scoring probability of a
+        shot and the zone-to-zone transition matrix of successful moves. The
+        Expected Threat surface is then obtained by iterating
+        ``xT = P(shot) * P(goal) + P(move) * T @ xT`` to convergence using a
+        sparse transition matrix. The fitted grid replaces ``base_values``.
+        
+        Parameters:
+        -----------
+        events : pd.DataFrame
+            DataFrame containing event data (all players, not only goalkeepers)
+        max_iter : int, optional
+            Maximum number of value iterations
+        tol : float, optional
+            Convergence threshold on the largest change of a zone value
+            
+        Returns:
+        --------
+        np.ndarray
+            Fitted xT values for each zone
+        """
+        length_zones, width_zones = self.zone_grid.shape
+        num_zones = length_zones * width_zones
+        
+        event_types = np.array(self._event_values(events, 'type.name'), dtype=object)
+        is_pass = event_types == 'Pass'
+        is_carry = event_types == 'Carry'
+        is_shot = event_types == 'Shot'
+        is_move = is_pass | is_carry
+        
+        start_x, start_y = self._event_coordinates(events, 'location')
+        start_zone_x, start_zone_y = self._zone_indices(start_x, start_y)
+        start_zone = start_zone_x * width_zones + start_zone_y
+        
+        # Passes and carries share one end-location array
+        pass_end_x, pass_end_y = self._event_coordinates(events, 'pass.end_location')
+        carry_end_x, carry_end_y = self._event_coordinates(events, 'carry.end_location')
+        end_zone_x, end_zone_y = self._zone_indices(
+            np.where(is_carry, carry_end_x, pass_end_x),
+            np.where(is_carry, carry_end_y, pass_end_y)
+        )
+        end_zone = end_zone_x * width_zones + end_zone_y
+        
+        pass_outcomes = self._event_values(events, 'pass.outcome.name')
+        shot_outcomes = self._event_values(events, 'shot.outcome.name')
+        is_successful_move = is_carry | (is_pass & np.array([outcome is None for outcome in pass_outcomes]))
+        is_goal = is_shot & (np.array(shot_outcomes, dtype=object) == 'Goal')
+        
+        shot_counts = np.bincount(start_zone[is_shot], minlength=num_zones).astype(float)
+        goal_counts = np.bincount(start_zone[is_goal], minlength=num_zones).astype(float)
+        move_counts = np.bincount(start_zone[is_move], minlength=num_zones).astype(float)
+        action_counts = shot_counts + move_counts
+        
+        with np.errstate(divide='ignore', invalid='ignore'):
+            shot_probability = np.where(action_counts > 0, shot_counts / action_counts, 0.0)
+            goal_probability = np.where(shot_counts > 0, goal_counts / shot_counts, 0.0)
+            inverse_action_counts = np.where(action_counts > 0, 1.0 / action_counts, 0.0)
+        
+        # P(move) * T collapses to successful move counts / all action counts
+        transition_counts = sparse.coo_matrix(
+            (
+                np.ones(int(is_successful_move.sum())),
+                (start_zone[is_successful_move], end_zone[is_successful_move])
+            ),
+            shape=(num_zones, num_zones)
+        ).tocsr()
+        move_transitions = sparse.diags(inverse_action_counts) @ transition_counts
+        
+        shot_value = shot_probability * goal_probability
+        xt = np.zeros(num_zones)
+        for _ in range(max_iter):
+            updated = shot_value + move_transitions @ xt
+            converged = np.max(np.abs(updated - xt)) < tol
+            xt = updated
+            if converged:
+                break
+        
+        self.base_values = xt.reshape(length_zones, width_zones)
+        return self.base_values
+    
+    def save_base_values(self, path: str) -> None:
+        """
+        Save the current xT grid as a ``.npz`` artifact.
+        
+        Parameters:
+        -----------
+        path : str
+            Destination file path
+        """
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        np.savez(
+            path,
+            base_values=self.base_values,
+            pitch_dimensions=np.asarray(self.pitch_dimensions),
+            model_version=XT_MODEL_VERSION
+        )
+    
+    def load_base_values(self, path: str) -> np.ndarray:
+        """
+        Load an xT grid saved with ``save_base_values``.
+        
+        Parameters:
+        -----------
+        path : str
+            Path to the ``.npz`` artifact
+            
+        Returns:
+        --------
+        np.ndarray
+            xT values for each zone
+            
+        Raises:
+        -------
+        ValueError
+            If the artifact was written by another ``XT_MODEL_VERSION``, for
+            other pitch dimensions or for another grid resolution
+        """
+        with np.load(path) as artifact:
+            base_values = artifact['base_values']
+            model_version = int(artifact['model_version']) if 'model_version' in artifact.files else None
+            pitch_dimensions = (
+                tuple(artifact['pitch_dimensions'].tolist()) if 'pitch_dimensions' in artifact.files else None
+            )
+        
+        # Zone indices scale with the pitch, so a grid fitted on other
+        # coordinates or by another model version does not apply
+        if model_version != XT_MODEL_VERSION:
+            raise ValueError(
+                f"xT grid in {path} was fitted by model version {model_version}, "
+                f"expected {XT_MODEL_VERSION}"
+            )
+        if pitch_dimensions != tuple(self.pitch_dimensions):
+            raise ValueError(
+                f"xT grid in {path} was fitted on a {pitch_dimensions} pitch, "
+                f"expected {tuple(self.pitch_dimensions)}"
+            )
+        if base_values.shape != self.zone_grid.shape:
+            raise ValueError(
+                f"xT grid in {path} has shape {base_values.shape}, "
+                f"expected {self.zone_grid.shape}"
+            )
+        
+        self.base_values = base_values
+        return base_values
+    
+    def use_fitted_base_values(self, data_loader, competition_id: int, season_id: int,
+                               num_matches: Optional[int] = None,
+                               artifact_dir: Optional[str] = None) -> str:
+        """
+        Use an xT grid fitted on a competition season, shared through a cache.
+        
+        Fitted grids are stored as ``.npz`` artifacts keyed by a hash of the
+        input match files, the grid resolution, the pitch dimensions and
+        ``XT_MODEL_VERSION``. The
+        grid is resolved lazily on first access to ``base_values``: an
+        existing artifact is loaded, otherwise the model is fitted once and
+        written atomically so that concurrent workers can share it. The
+        events are fitted in their own coordinates, so the analyzer's
+        ``pitch_dimensions`` must match the data (120 x 80 for StatsBomb).
+        
+        Parameters:
+        -----------
+        data_loader : StatsBombDataLoader
+            Loader used to read the match events
+        competition_id : int
+            Competition ID
+        season_id : int
+            Season ID
+        num_matches : int, optional
+            Number of matches to fit on (default: all matches of the season)
+        artifact_dir : str, optional
+            Directory holding the artifacts (default: ``<data_dir>/models``)
+            
+        Returns:
+        --------
+        str
+            Path of the artifact backing the grid
+        """
+        matches = data_loader.get_matches(competition_id, season_id)[:num_matches]
+        match_ids = [match.get('match_id') for match in matches]
+        
+        length_zones, width_zones = self.zone_grid.shape
+        pitch_length, pitch_width = self.pitch_dimensions
+        # The fingerprint hashes each events file's size and mtime rather
+        # than its content, so that checking for an artifact does not read
+        # the whole season; a file rewritten in place with the same size
+        # and mtime would keep its stale grid
+        fingerprint = data_loader.get_events_fingerprint(match_ids)
+        artifact_dir = artifact_dir or os.path.join(data_loader.data_dir, 'models')
+        artifact_path = os.path.join(
+            artifact_dir,
+            f"xt_grid_v{XT_MODEL_VERSION}_{length_zones}x{width_zones}_"
+            f"{pitch_length:g}x{pitch_width:g}_{fingerprint[:16]}.npz"
+        )
+        
+        def resolve() -> np.ndarray:
+            if os.path.exists(artifact_path):
+                try:
+                    return self.load_base_values(artifact_path)
+                except (OSError, KeyError, ValueError):
+                    pass  # Unreadable artifact, fit a fresh one
+            
+            frames = [data_loader.get_match_events_frame(match_id) for match_id in match_ids]
+            frames = [frame for frame in frames if not frame.empty]
+            if not frames:
+                return self._initialize_base_values()
+            
+            base_values = self.fit_base_values(pd.concat(frames, ignore_index=True))
+            
+            # Write to a private file first so readers never see partial data
+            tmp_path = None
+            try:
+                os.makedirs(artifact_dir, exist_ok=True)
+                fd, tmp_path = tempfile.mkstemp(dir=artifact_dir, suffix='.tmp.npz')
+                os.close(fd)
+                self.save_base_values(tmp_path)
+                os.replace(tmp_path, artifact_path)
+            except OSError:
+                # Read-only data directory, keep the grid in memory only
+                if tmp_path is not None:
+                    try:
+                        os.remove(tmp_path)
+                    except OSError:
+                        pass
+            
+            return base_values
+        
+        self._pending_base_values = resolve
+        return artifact_path
+    
     def load_event_data(self, file_path: str) -> pd.DataFrame:
         """
         Load event data from a JSON file.
@@ -113,6 +450,25 @@ class XtGkAnalyzer:
         gk_events = events[events['position.name'] == 'Goalkeeper'].copy()
         return gk_events
     
+    def zone_values(self, x: np.ndarray, y: np.ndarray) -> np.ndarray:
+        """
+        Look up the xT value of the pitch at arrays of locations.
+        
+        Parameters:
+        -----------
+        x : np.ndarray
+            Locations along the length of the pitch, in pitch units
+        y : np.ndarray
+            Locations along the width of the pitch, in pitch units
+            
+        Returns:
+        --------
+        np.ndarray
+            xT value at each location, broadcast like ``x`` and ``y``
+        """
+        x, y = np.broadcast_arrays(np.asarray(x, dtype=float), np.asarray(y, dtype=float))
+        return self._zone_values(x.ravel(), y.ravel()).reshape(x.shape)
+    
     def calculate_distribution_value(self, pass_event: Dict) -> float:
         """
         Calculate the Distribution Value component of xT-GK.
@@ -128,21 +484,17 @@ class XtGkAnalyzer:
             Distribution Value
         """
         # Extract pass data
-        start_x = pass_event.get('location', [0, 0])[0] / self.pitch_dimensions[0]
-        start_y = pass_event.get('location', [0, 0])[1] / self.pitch_dimensions[1]
+        start_location = pass_event.get('location', [0, 0])
+        end_location = pass_event.get('pass', {}).get('end_location', [0, 0])
         
-        end_x = pass_event.get('pass', {}).get('end_location', [0, 0])[0] / self.pitch_dimensions[0]
-        end_y = pass_event.get('pass', {}).get('end_location', [0, 0])[1] / self.pitch_dimensions[1]
+        start_x = start_location[0] / self.pitch_dimensions[0]
+        end_x = end_location[0] / self.pitch_dimensions[0]
         
-        # Calculate base value based on start and end zones
-        start_zone_x = min(int(start_x * self.base_values.shape[0]), self.base_values.shape[0] - 1)
-        start_zone_y = min(int(start_y * self.base_values.shape[1]), self.base_values.shape[1] - 1)
-        
-        end_zone_x = min(int(end_x * self.base_values.shape[0]), self.base_values.shape[0] - 1)
-        end_zone_y = min(int(end_y * self.base_values.shape[1]), self.base_values.shape[1] - 1)
-        
-        # Value difference between zones
-        value_diff = self.base_values[end_zone_x, end_zone_y] - self.base_values[start_zone_x, start_zone_y]
+        # Value difference between the end and start zones
+        end_value, start_value = self._zone_values(
+            [end_location[0], start_location[0]], [end_location[1], start_location[1]]
+        )
+        value_diff = end_value - start_value
         
         # Progression factor - reward forward passes more
         progression_factor = 1.0
@@ -209,32 +561,37 @@ class XtGkAnalyzer:
         event : dict
             Dictionary containing event data
         sequence_data : dict, optional
-            Dictionary containing possession sequence data
+            Possession chain of the event, as a row of ``build_possession_index``
             
         Returns:
         --------
         float
             Build-up Contribution
         """
+        # Event type factor
+        event_type_factor = 1.0
+        if event.get('type', {}).get('name', '') == 'Pass':
+            # Passes contribute more to build-up
+            event_type_factor = 1.5
+        
         # Simplified implementation without sequence data
         if sequence_data is None:
             # Base contribution value
             base_contribution = 0.02
             
-            # Event type factor
-            event_type_factor = 1.0
-            if event.get('type', {}).get('name', '') == 'Pass':
-                # Passes contribute more to build-up
-                event_type_factor = 1.5
-            
             # Calculate build-up contribution
             build_up_contribution = base_contribution * event_type_factor
             
             return build_up_contribution
-        else:
-            # More sophisticated implementation would use sequence data
-            # to track possession sequences and their outcomes
-            pass
+        
+        # Actions made while the opponent owns the possession do not build up
+        if event.get('team', {}).get('id') != sequence_data.get('team_id'):
+            return 0.0
+        
+        # Credit the threat the possession chain went on to create
+        build_up_contribution = max(0.0, sequence_data.get('xt_gained', 0.0)) * event_type_factor
+        
+        return build_up_contribution
     
     def calculate_risk_adjusted_value(self, action_value: float, event: Dict) -> float:
         """
@@ -300,6 +657,249 @@ class XtGkAnalyzer:
         
         return xt_gk
     
+    def _event_values(self, events: pd.DataFrame, name: str) -> List:
+        """
+        Get a (possibly nested) event field for every row of an event frame.
+        
+        Accepts flat dotted columns (e.g. ``'pass.outcome.name'``) as produced
+        by ``pd.json_normalize`` or the columnar event store, as well as
+        columns holding the nested StatsBomb dictionaries (e.g. ``'pass'``).
+        Missing values are returned as None.
+        """
+        if name in events.columns:
+            series = events[name]
+            return series.astype(object).where(series.notna(), None).tolist()
+        
+        head, _, rest = name.partition('.')
+        while rest:
+            if head in events.columns:
+                keys = rest.split('.')
+                values = []
+                for value in events[head].tolist():
+                    for key in keys:
+                        value = value.get(key) if isinstance(value, dict) else None
+                    values.append(value)
+                return values
+            
+            key, _, rest = rest.partition('.')
+            head = f"{head}.{key}"
+        
+        return [None] * len(events)
+    
+    def _event_coordinates(self, events: pd.DataFrame, name: str) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Get x/y coordinate arrays for a location field, defaulting to (0, 0).
+        """
+        if f"{name}.x" in events.columns:
+            x = events[f"{name}.x"].to_numpy(dtype=float, na_value=0.0)
+            y = events[f"{name}.y"].to_numpy(dtype=float, na_value=0.0)
+            return x, y
+        
+        points = [
+            point if isinstance(point, (list, tuple)) and len(point) >= 2 else (0.0, 0.0)
+            for point in self._event_values(events, name)
+        ]
+        coordinates = np.array(points, dtype=float).reshape(-1, 2)
+        return coordinates[:, 0].copy(), coordinates[:, 1].copy()
+    
+    def build_possession_index(self, events: pd.DataFrame) -> pd.DataFrame:
+        """
+        Index the possession chains of a frame of events in a single pass.
+        
+        Chains are runs of consecutive events sharing StatsBomb's
+        ``possession`` number, so a frame holding several matches (in event
+        order) can be indexed at once.
+        
+        Parameters:
+        -----------
+        events : pd.DataFrame
+            DataFrame containing all events of one or more matches, in order
+            
+        Returns:
+        --------
+        pd.DataFrame
+            One row per chain with the columns 'possession', 'team_id',
+            'start_offset' and 'end_offset' (row positions in ``events``,
+            end exclusive), 'num_events', 'outcome' ('Goal', 'Shot' or
+            'No Shot') and 'xt_gained' (xT added by the possession team's
+            successful passes and carries)
+        """
+        possession = np.array(self._event_values(events, 'possession'), dtype=object)
+        if len(possession) == 0:
+            return pd.DataFrame(columns=[
+                'possession', 'team_id', 'start_offset', 'end_offset',
+                'num_events', 'outcome', 'xt_gained'
+            ])
+        
+        start_offsets = np.flatnonzero(np.r_[True, possession[1:] != possession[:-1]])
+        end_offsets = np.r_[start_offsets[1:], len(possession)]
+        
+        team_ids = np.array(self._event_values(events, 'team.id'), dtype=object)
+        possession_team_ids = np.array(self._event_values(events, 'possession_team.id'), dtype=object)
+        in_possession = team_ids == possession_team_ids
+        
+        event_types = np.array(self._event_values(events, 'type.name'), dtype=object)
+        is_carry = event_types == 'Carry'
+        is_complete = np.array([outcome is None for outcome in self._event_values(events, 'pass.outcome.name')])
+        is_successful_move = in_possession & (is_carry | ((event_types == 'Pass') & is_complete))
+        
+        start_x, start_y = self._event_coordinates(events, 'location')
+        pass_end_x, pass_end_y = self._event_coordinates(events, 'pass.end_location')
+        carry_end_x, carry_end_y = self._event_coordinates(events, 'carry.end_location')
+        xt_added = np.where(
+            is_successful_move,
+            self._zone_values(
+                np.where(is_carry, carry_end_x, pass_end_x),
+                np.where(is_carry, carry_end_y, pass_end_y)
+            ) - self._zone_values(start_x, start_y),
+            0.0
+        )
+        
+        is_shot = in_possession & (event_types == 'Shot')
+        is_goal = is_shot & (np.array(self._event_values(events, 'shot.outcome.name'), dtype=object) == 'Goal')
+        
+        chain_shots = np.add.reduceat(is_shot.astype(np.int64), start_offsets)
+        chain_goals = np.add.reduceat(is_goal.astype(np.int64), start_offsets)
+        
+        return pd.DataFrame({
+            'possession': possession[start_offsets],
+            'team_id': possession_team_ids[start_offsets],
+            'start_offset': start_offsets,
+            'end_offset': end_offsets,
+            'num_events': end_offsets - start_offsets,
+            'outcome': np.where(chain_goals > 0, 'Goal', np.where(chain_shots > 0, 'Shot', 'No Shot')),
+            'xt_gained': np.add.reduceat(xt_added, start_offsets)
+        })
+    
+    def lookup_possession_sequences(self, possession_index: pd.DataFrame,
+                                    positions: np.ndarray) -> pd.DataFrame:
+        """
+        Look up the possession chain of events by their row position.
+        
+        Parameters:
+        -----------
+        possession_index : pd.DataFrame
+            Index built by ``build_possession_index``
+        positions : np.ndarray
+            Row positions of the events in the frame the index was built from
+            
+        Returns:
+        --------
+        pd.DataFrame
+            One possession chain row per position
+        """
+        chains = np.searchsorted(
+            possession_index['start_offset'].to_numpy(), np.asarray(positions), side='right'
+        ) - 1
+        return possession_index.iloc[chains].reset_index(drop=True)
+    
+    def calculate_xt_gk_components(self, events: pd.DataFrame,
+                                   sequence_data: Optional[pd.DataFrame] = None) -> pd.DataFrame:
+        """
+        Calculate the xT-GK components for a whole frame of events at once.
+        
+        This is the vectorized equivalent of calling ``calculate_xt_gk`` on
+        every event: DV, PEV, BC and RAV are evaluated as NumPy array
+        expressions over the start/end coordinates, outcomes and pressure
+        flags of all events, and produce the same values as the per-event
+        path.
+        
+        Parameters:
+        -----------
+        events : pd.DataFrame
+            DataFrame containing event data
+        sequence_data : pd.DataFrame, optional
+            Possession chain of each event, row-aligned with ``events``, as
+            returned by ``lookup_possession_sequences``
+            
+        Returns:
+        --------
+        pd.DataFrame
+            DataFrame indexed like ``events`` with the columns
+            'distribution_value', 'pressure_escape_value',
+            'build_up_contribution' and 'xt_gk'
+        """
+        pitch_length, pitch_width = self.pitch_dimensions
+        
+        is_pass = np.array([name == 'Pass' for name in self._event_values(events, 'type.name')], dtype=bool)
+        failed = np.isin(
+            np.array(self._event_values(events, 'pass.outcome.name'), dtype=object),
+            ['Incomplete', 'Out']
+        )
+        under_pressure = np.array(
+            [bool(flag) for flag in self._event_values(events, 'under_pressure')], dtype=bool
+        )
+        
+        start_location_x, start_location_y = self._event_coordinates(events, 'location')
+        end_location_x, end_location_y = self._event_coordinates(events, 'pass.end_location')
+        start_x = start_location_x / pitch_length
+        end_x = end_location_x / pitch_length
+        
+        # Distribution Value
+        value_diff = (
+            self._zone_values(end_location_x, end_location_y)
+            - self._zone_values(start_location_x, start_location_y)
+        )
+        progression_factor = np.where(end_x > start_x, 1.5, np.where(end_x < start_x, 0.8, 1.0))
+        outcome_factor = np.where(failed, -0.5, 1.0)
+        pressure_factor = np.where(under_pressure, 1.3, 1.0)
+        
+        distribution_value = np.where(
+            is_pass,
+            np.maximum(0, value_diff) * progression_factor * outcome_factor * pressure_factor,
+            0.0
+        )
+        
+        # Pressure Escape Value
+        pressure_escape_value = np.where(
+            under_pressure, 0.05 * np.where(is_pass & failed, 0.0, 1.0), 0.0
+        )
+        
+        # Build-up Contribution
+        event_type_factor = np.where(is_pass, 1.5, 1.0)
+        if sequence_data is None:
+            build_up_contribution = 0.02 * event_type_factor
+        else:
+            in_possession = (
+                np.array(self._event_values(events, 'team.id'), dtype=object)
+                == sequence_data['team_id'].to_numpy(dtype=object)
+            )
+            build_up_contribution = np.where(
+                in_possession,
+                np.maximum(0.0, sequence_data['xt_gained'].to_numpy(dtype=float)) * event_type_factor,
+                0.0
+            )
+        
+        # Risk-Adjusted Value
+        risk_factor = (1.0 + (1.0 - start_x) * 0.5) * np.where(under_pressure, 1.2, 1.0)
+        action_value = distribution_value + pressure_escape_value + build_up_contribution
+        
+        return pd.DataFrame({
+            'distribution_value': distribution_value,
+            'pressure_escape_value': pressure_escape_value,
+            'build_up_contribution': build_up_contribution,
+            'xt_gk': action_value / risk_factor
+        }, index=events.index)
+    
+    def calculate_xt_gk_batch(self, events: pd.DataFrame,
+                              sequence_data: Optional[pd.DataFrame] = None) -> np.ndarray:
+        """
+        Calculate xT-GK values for a whole frame of events at once.
+        
+        Parameters:
+        -----------
+        events : pd.DataFrame
+            DataFrame containing event data
+        sequence_data : pd.DataFrame, optional
+            Possession chain of each event, row-aligned with ``events``
+            
+        Returns:
+        --------
+        np.ndarray
+            xT-GK value for each event, in row order
+        """
+        return self.calculate_xt_gk_components(events, sequence_data)['xt_gk'].to_numpy()
+    
     def process_match_events(self, events: pd.DataFrame) -> pd.DataFrame:
         """
         Process all events in a match to calculate xT-GK values.
@@ -314,16 +914,87 @@ class XtGkAnalyzer:
         pd.DataFrame
             DataFrame with added xT-GK values
         """
+        if not events.index.is_unique:
+            events = events.reset_index(drop=True)
+        
         # Filter goalkeeper events
         gk_events = self.filter_goalkeeper_events(events)
         
-        # Calculate xT-GK for each event
-        gk_events['xt_gk'] = gk_events.apply(
-            lambda row: self.calculate_xt_gk(row.to_dict()), axis=1
-        )
+        # Attach each goalkeeper action to its possession chain when the
+        # events carry StatsBomb's possession numbers
+        sequence_data = None
+        if 'possession' in events.columns:
+            possession_index = self.build_possession_index(events)
+            sequence_data = self.lookup_possession_sequences(
+                possession_index, events.index.get_indexer(gk_events.index)
+            )
+        
+        # Calculate xT-GK for all events in one vectorized pass
+        gk_events['xt_gk'] = self.calculate_xt_gk_batch(gk_events, sequence_data)
         
         return gk_events
     
+    def goalkeeper_performance_table(self, gk_events: pd.DataFrame,
+                                     group_by: Optional[List[str]] = None) -> pd.DataFrame:
+        """
+        Aggregate goalkeeper performance metrics into a typed table.
+        
+        All metrics come from a single ``groupby().agg()`` over the events, so
+        league-wide tables over hundreds of goalkeepers stay interactive.
+        
+        Parameters:
+        -----------
+        gk_events : pd.DataFrame
+            DataFrame containing goalkeeper events with xT-GK values
+        group_by : list, optional
+            Extra columns of ``gk_events`` to split each goalkeeper's totals
+            by, e.g. ``['match_id']``, ``['season']`` or ``['team.name']``
+            
+        Returns:
+        --------
+        pd.DataFrame
+            One row per goalkeeper (and group) with the columns 'player.id',
+            the ``group_by`` columns, 'player_name', 'team_name',
+            'total_xt_gk', 'avg_xt_gk', 'num_actions', 'num_passes',
+            'completed_passes' and 'pass_completion_rate'
+        """
+        keys = ['player.id'] + list(group_by or [])
+        
+        is_pass = np.array(self._event_values(gk_events, 'type.name'), dtype=object) == 'Pass'
+        failed = np.isin(
+            np.array(self._event_values(gk_events, 'pass.outcome.name'), dtype=object),
+            ['Incomplete', 'Out']
+        )
+        
+        metrics = gk_events[keys].copy()
+        metrics['player_name'] = gk_events['player.name'].astype('string')
+        metrics['team_name'] = gk_events['team.name'].astype('string')
+        metrics['xt_gk'] = gk_events['xt_gk'].astype(float)
+        metrics['is_pass'] = is_pass
+        metrics['is_completed_pass'] = is_pass & ~failed
+        
+        table = metrics.groupby(keys, sort=True, observed=True).agg(
+            player_name=('player_name', 'first'),
+            team_name=('team_name', 'first'),
+            total_xt_gk=('xt_gk', 'sum'),
+            avg_xt_gk=('xt_gk', 'mean'),
+            num_actions=('xt_gk', 'size'),
+            num_passes=('is_pass', 'sum'),
+            completed_passes=('is_completed_pass', 'sum')
+        ).reset_index()
+        
+        num_passes = table['num_passes'].to_numpy(dtype=np.int64)
+        completed_passes = table['completed_passes'].to_numpy(dtype=np.int64)
+        table['num_passes'] = num_passes
+        table['completed_passes'] = completed_passes
+        table['num_actions'] = table['num_actions'].astype(np.int64)
+        table['pass_completion_rate'] = np.divide(
+            completed_passes, num_passes,
+            out=np.zeros(len(table)), where=num_passes > 0
+        )
+        
+        return table
+    
     def aggregate_goalkeeper_performance(self, gk_events: pd.DataFrame) -> Dict:
         """
         Aggregate goalkeeper performance metrics.
@@ -338,39 +1009,13 @@ class XtGkAnalyzer:
         dict
             Dictionary containing aggregated performance metrics
         """
-        # Group by goalkeeper
-        gk_performance = {}
+        table = self.goalkeeper_performance_table(gk_events)
         
-        for player_id, player_events in gk_events.groupby('player.id'):
-            player_name = player_events['player.name'].iloc[0]
-            team_name = player_events['team.name'].iloc[0]
-            
-            # Calculate metrics
-            total_xt_gk = player_events['xt_gk'].sum()
-            avg_xt_gk = player_events['xt_gk'].mean()
-            num_actions = len(player_events)
-            
-            # Pass completion rate
-            pass_events = player_events[player_events['type.name'] == 'Pass']
-            if len(pass_events) > 0:
-                completed_passes = pass_events[
-                    ~pass_events['pass.outcome.name'].isin(['Incomplete', 'Out'])
-                ]
-                pass_completion_rate = len(completed_passes) / len(pass_events)
-            else:
-                pass_completion_rate = 0.0
-            
-            # Store metrics
-            gk_performance[player_id] = {
-                'player_name': player_name,
-                'team_name': team_name,
-                'total_xt_gk': total_xt_gk,
-                'avg_xt_gk': avg_xt_gk,
-                'num_actions': num_actions,
-                'pass_completion_rate': pass_completion_rate
-            }
-        
-        return gk_performance
+        columns = [
+            'player_name', 'team_name', 'total_xt_gk',
+            'avg_xt_gk', 'num_actions', 'pass_completion_rate'
+        ]
+        return table.set_index('player.id')[columns].to_dict('index')
     
     def plot_pitch(self, ax: plt.Axes = None, figsize: Tuple[int, int] = (12, 8)) -> Tuple[plt.Figure, plt.Axes]:
         """
@@ -451,5 +1096,32 @@ class XtGkAnalyzer:
         Returns:
         --------
         plt.Figure
-            Heatm
-(Content truncated due to size limit. Use line ranges to read in chunks)
\ No newline at end of file
+            Heatmap figure
+        """
+        if player_id is not None:
+            player_ids = np.array(self._event_values(gk_events, 'player.id'), dtype=object)
+            gk_events = gk_events[player_ids == player_id]
+        
+        # Sum xT-GK over the zone of each event's location
+        x, y = self._event_coordinates(gk_events, 'location')
+        zone_x, zone_y = self._zone_indices(x, y)
+        xt_gk = gk_events['xt_gk'].to_numpy(dtype=float) if 'xt_gk' in gk_events.columns else np.zeros(len(gk_events))
+        zone_totals = np.zeros_like(self.zone_grid, dtype=float)
+        np.add.at(zone_totals, (zone_x, zone_y), xt_gk)
+        
+        fig, ax = self.plot_pitch()
+        pitch_length, pitch_width = self.pitch_dimensions
+        
+        # Zones run along the length (x) and width (y) of the pitch
+        heatmap = ax.imshow(
+            zone_totals.T, origin='lower', cmap='YlOrRd', alpha=0.7,
+            extent=(0, pitch_length, 0, pitch_width), zorder=0
+        )
+        fig.colorbar(heatmap, ax=ax, label='xT-GK')
+        
+        title = 'xT-GK Heatmap'
+        if player_id is not None and len(gk_events) and 'player.name' in gk_events.columns:
+            title = f"xT-GK Heatmap - {gk_events['player.name'].iloc[0]}"
+        ax.set_title(title)
+        
+        return fig